@@ -1,30 +1,202 @@
+from array import array
+
 from algebra.matrices import Matrix
-from algebra.vectors import Vector
 from algebra.validator import LinearAlgebraValidator as linalgvalidtor
+from algebra.vectors import Vector
 
 class AugmentedMatrix(Matrix):
 
-    def __init__(self, A: Matrix, b: Vector):
+    __slots__ = ("original_matrix", "original_vectors", "original_vector")
+
+    def __init__(self, A: Matrix, b):
         """
         Create an augmented matrix [A | b] from a matrix A and a vector b.
 
         This constructor validates that A is a valid matrix and b is a valid vector,
         and ensures that the number of rows in A matches the number of elements in b.
-        It then appends each element of b as an additional column to the corresponding
-        row of A, forming the augmented matrix used in solving systems of linear equations.
+        The augmented matrix, used in solving systems of linear equations, presents
+        each element of b as an additional column of the corresponding row of A.
+
+        Storage:
+            Nothing is copied: element reads, `.data`, products and `solve` read A and b
+            directly, and rows, columns, slices, transposes and iteration return
+            read-only (frozen) copies of just the elements requested. The first time
+            the augmented matrix is modified (row operations, item assignment, in-place
+            operators), its elements are copied once into a private working buffer
+            (copy-on-write); from then on it behaves like a Matrix, views included, and
+            `solve` solves the modified system. A and b are never modified.
 
         Parameters
         ----------
         A : Matrix
             The coefficient matrix of the linear system (size m × n).
-        b : Vector
-            The right-hand side vector (size m).
+        b : Vector, list of Vector or Matrix
+            The right-hand side vector (size m), or several right-hand sides given as
+            a list of vectors or as the columns of an m × k matrix.
         """
 
         linalgvalidtor.validate_object_is_matrix(A)
-        linalgvalidtor.validate_object_is_vector(b)
-        linalgvalidtor.validate_matrix_and_vector_have_same_length(A, b)
-        augmented_matrix = [row + [b.data[i]] for i, row in enumerate(A.data)]
-        super().__init__(augmented_matrix)
+        if isinstance(b, Matrix):
+            columns = [b.column(j) for j in range(b.dims[1])]
+        elif isinstance(b, list):
+            columns = b
+        else:
+            columns = [b]
+        for column in columns:
+            linalgvalidtor.validate_object_is_vector(column)
+            linalgvalidtor.validate_matrix_and_vector_have_same_length(A, column)
+
+        self._buffer = None
+        self._offset = 0
+        # The layout of the working buffer once materialized (slices locate their elements with it until then)
+        self._strides = (A.dims[1] + len(columns), 1)
+        self.dims = [A.dims[0], A.dims[1] + len(columns)]
+        self.base = None
+        self._version = 0
+        self._frozen = False
+        self._cache = None
         self.original_matrix = A
-        self.original_vector = b
\ No newline at end of file
+        self.original_vectors = columns
+        self.original_vector = columns[0] if len(columns) == 1 else None
+
+
+    # COPY-ON-WRITE STORAGE
+    @property
+    def is_materialized(self):
+        """
+        Whether the private working buffer has been created.
+        """
+        return self._buffer is not None
+
+    def _materialize(self):
+        """
+        Copy [A | b] into the private working buffer, once.
+        """
+        if self._buffer is None:
+            values = array("d")
+            for i in range(self.dims[0]):
+                values.extend(self._source_row_values(i))
+            self._buffer = values
+
+    def _source_row_values(self, index):
+        values = array("d", self.original_matrix._row_values(index))
+        values.extend([column[index] for column in self.original_vectors])
+        return values
+
+    def _row_values(self, index):
+        if self._buffer is None:
+            return self._source_row_values(index)
+        return super()._row_values(index)
+
+    def _column_values(self, index):
+        if self._buffer is None:
+            n = self.original_matrix.dims[1]
+            if index < n:
+                return self.original_matrix._column_values(index)
+            return array("d", self.original_vectors[index - n]._values())
+        return super()._column_values(index)
+
+    def _row_major(self):
+        if self._buffer is None:
+            values = array("d")
+            for row in self._rows():
+                values.extend(row)
+            return values
+        return super()._row_major()
+
+    def _set_row_values(self, index, values):
+        self._check_writable()
+        self._materialize()
+        super()._set_row_values(index, values)
+
+    def _set_row_major(self, values):
+        self._check_writable()
+        self._materialize()
+        super()._set_row_major(values)
+
+    def _source_value(self, row, col):
+        n = self.original_matrix.dims[1]
+        if col < n:
+            return self.original_matrix[row, col]
+        return self.original_vectors[col - n][row]
+
+    def _view(self, dims, offset, strides):
+        if self._buffer is None:
+            # A read-only copy of the requested elements only, located with the
+            # layout of the working buffer
+            rows, cols = dims
+            width = self.dims[1]
+            values = array("d")
+            for i in range(rows):
+                start = offset + i * strides[0]
+                values.extend([self._source_value(*divmod(start + j * strides[1], width)) for j in range(cols)])
+            return Matrix._from_buffer(values, [rows, cols]).freeze()
+        return super()._view(dims, offset, strides)
+
+    def row(self, index):
+        if self._buffer is None:
+            rows, cols = self.dims
+            if index < 0:
+                index += rows
+            if not 0 <= index < rows:
+                raise IndexError("Matrix row index out of range.")
+            return Vector._from_buffer(self._source_row_values(index), cols).freeze()
+        return super().row(index)
+
+    def column(self, index):
+        if self._buffer is None:
+            rows, cols = self.dims
+            if index < 0:
+                index += cols
+            if not 0 <= index < cols:
+                raise IndexError("Matrix column index out of range.")
+            return Vector._from_buffer(array("d", self._column_values(index)), rows).freeze()
+        return super().column(index)
+
+    def __getitem__(self, index):
+        if self._buffer is None and isinstance(index, tuple) and not any(isinstance(i, slice) for i in index):
+            row, col = index
+            n = self.original_matrix.dims[1]
+            if col < 0:
+                col += self.dims[1]
+            if not 0 <= col < self.dims[1]:
+                raise IndexError("Matrix index out of range.")
+            if col < n:
+                return self.original_matrix[row, col]
+            return self.original_vectors[col - n][row]
+        return super().__getitem__(index)
+
+    def __setitem__(self, index, value):
+        self._check_writable()
+        self._materialize()
+        super().__setitem__(index, value)
+
+
+    def solve(self, b=None):
+        """
+        Solve the system A ⋅ x = b represented by the augmented matrix [A | b].
+
+        Unlike `Matrix.solve`, the right-hand side is not passed: it is the last
+        column(s) of the augmented matrix, and passing `b` raises a TypeError.
+
+        The LU factors are those cached on A, so solving several augmented matrices
+        sharing the same A only costs one factorization. Once the augmented matrix has
+        been modified, the system is read back from its working buffer instead.
+
+        Returns
+        -------
+        Vector or list of Vector
+            The solution x, or one solution per right-hand side when the augmented
+            matrix holds several of them.
+        """
+        if b is not None:
+            raise TypeError("An augmented matrix already holds its right-hand side: call solve() without arguments.")
+        if self._buffer is not None:
+            n = self.original_matrix.dims[1]
+            A = self[:, :n].copy()
+            columns = [self.column(j).copy() for j in range(n, self.dims[1])]
+        else:
+            A, columns = self.original_matrix, self.original_vectors
+        if len(columns) == 1:
+            return A.solve(columns[0])
+        return A.solve_many(columns)
@@ -0,0 +1,176 @@
+from algebra.matrices import Matrix
+from algebra.vectors import Vector
+
+
+class ChainPlan:
+
+    def __init__(self, shapes, order, flops, naive_flops):
+        """
+        The multiplication order chosen for a chain of products A₁ ⋅ A₂ ⋅ ... ⋅ Aₖ.
+
+        Attributes
+        ----------
+        shapes : list of (int, int)
+            The shapes of the operands (a Vector of size n is an n × 1 column).
+        order : int or tuple
+            The parenthesization as a binary tree of operand indices,
+            e.g. (0, (1, 2)) for A₁ ⋅ (A₂ ⋅ A₃).
+        flops : int
+            The estimated number of floating point operations of the plan:
+            2 ⋅ m ⋅ n ⋅ p per (m × n) ⋅ (n × p) product (one multiplication and
+            one addition per term).
+        naive_flops : int
+            The same estimate for the left-to-right evaluation ((A₁ ⋅ A₂) ⋅ A₃) ⋅ ...
+
+        Example
+        -------
+        str(plan_chain([X.transpose(), X, W, v]))
+        ➞ "(A0 (A1 (A2 A3))) [4.2e+05 flops, left to right 2.2e+07]"
+        """
+        self.shapes = shapes
+        self.order = order
+        self.flops = flops
+        self.naive_flops = naive_flops
+
+    @property
+    def speedup(self):
+        """
+        The ratio of the left-to-right estimate to the plan estimate.
+        """
+        return self.naive_flops / self.flops if self.flops else 1.0
+
+    def parenthesization(self):
+        """
+        Return the order as text, e.g. "(A0 (A1 A2))".
+        """
+        return _format(self.order)
+
+    def __repr__(self):
+        return f"ChainPlan(order={self.parenthesization()!r}, flops={self.flops}, naive_flops={self.naive_flops})"
+
+    def __str__(self):
+        return f"{self.parenthesization()} [{self.flops:.1e} flops, left to right {self.naive_flops:.1e}]"
+
+
+def plan_chain(operands):
+    """
+    Choose the cheapest multiplication order of a chain of matrices.
+
+    Mathematical definition:
+        For operands of shapes d₀ × d₁, d₁ × d₂, ..., dₖ₋₁ × dₖ, the cost of the
+        best order for Aᵢ ⋅ ... ⋅ Aⱼ is
+        cost(i, j) = min(cost(i, s) + cost(s + 1, j) + dᵢ ⋅ dₛ₊₁ ⋅ dⱼ₊₁, for s in [i, j))
+        with cost(i, i) = 0: the classic O(k³) dynamic program over the dims only
+        (nothing is multiplied).
+
+    Parameters
+    ----------
+    operands : list
+        The matrices (Matrix, or any matrix type with `dims` and `@`, such as
+        SparseMatrix or BandedMatrix), the last one possibly a Vector (a column).
+
+    Returns
+    -------
+    ChainPlan
+        The chosen order and its FLOP estimate.
+    """
+    dims = _chain_dims(operands)
+    k = len(operands)
+
+    # cost[i][j] and split[i][j] for the sub-chain operands[i..j]
+    cost = [[0] * k for _ in range(k)]
+    split = [[0] * k for _ in range(k)]
+    for length in range(2, k + 1):
+        for i in range(k - length + 1):
+            j = i + length - 1
+            best = None
+            for s in range(i, j):
+                candidate = cost[i][s] + cost[s + 1][j] + dims[i] * dims[s + 1] * dims[j + 1]
+                if best is None or candidate < best:
+                    best, split[i][j] = candidate, s
+            cost[i][j] = best
+
+    naive = sum(dims[0] * dims[s] * dims[s + 1] for s in range(1, k))
+    shapes = [(dims[i], dims[i + 1]) for i in range(k)]
+    return ChainPlan(shapes, _order(split, 0, k - 1), 2 * cost[0][k - 1], 2 * naive)
+
+
+def multi_dot(operands, workers=None, return_plan=False):
+    """
+    Multiply a chain of matrices in the cheapest order.
+
+    `A @ B @ C` is evaluated left to right, which can cost orders of magnitude more
+    than another order: for X (1000 × 100), W (100 × 100) and v (size 100),
+    (Xᵀ ⋅ X) ⋅ W ⋅ v multiplies 100 × 1000 by 1000 × 100 matrices, while
+    Xᵀ ⋅ (X ⋅ (W ⋅ v)) only makes matrix-vector products.
+
+    Parameters
+    ----------
+    operands : list
+        The matrices, the last one possibly a Vector (see `plan_chain`).
+    workers : int, optional
+        Passed to `Matrix.dot` for the dense matrix products.
+    return_plan : bool
+        If True, also return the ChainPlan used (e.g. to log its FLOP estimate).
+
+    Returns
+    -------
+    Matrix or Vector (or (result, ChainPlan))
+        The product, a Vector when the last operand is a Vector.
+
+    Example
+    -------
+    result, plan = multi_dot([X.transpose(), X, W, v], return_plan=True)
+    logger.info("chain %s", plan)
+    """
+    plan = plan_chain(operands)
+    result = _evaluate(plan.order, operands, workers)
+    if len(operands) == 1 and isinstance(result, (Matrix, Vector)):
+        result = result.copy()
+    return (result, plan) if return_plan else result
+
+
+def _chain_dims(operands):
+    """
+    Return the k + 1 dims d₀, ..., dₖ of the chain, operand i being dᵢ × dᵢ₊₁.
+    """
+    if not isinstance(operands, (list, tuple)) or not operands:
+        raise ValueError("Expected a non-empty list of matrices.")
+    dims = []
+    for i, operand in enumerate(operands):
+        if isinstance(operand, Vector):
+            if i != len(operands) - 1:
+                raise ValueError(f"Operand {i} is a Vector: only the last operand of a chain can be a Vector.")
+            rows, cols = operand.length, 1
+        elif isinstance(getattr(operand, "dims", None), list) and len(operand.dims) == 2:
+            rows, cols = operand.dims
+        else:
+            raise TypeError(f"Operand {i} is not a matrix or a vector.")
+        if dims and dims[-1] != rows:
+            raise ValueError(f"Operand {i - 1} has {dims[-1]} columns but operand {i} has {rows} rows.")
+        if not dims:
+            dims.append(rows)
+        dims.append(cols)
+    return dims
+
+
+def _order(split, i, j):
+    if i == j:
+        return i
+    s = split[i][j]
+    return (_order(split, i, s), _order(split, s + 1, j))
+
+
+def _evaluate(order, operands, workers):
+    if isinstance(order, int):
+        return operands[order]
+    left, right = (_evaluate(node, operands, workers) for node in order)
+    if isinstance(left, Matrix) and isinstance(right, Matrix):
+        return left.dot(right, workers=workers)
+    return left @ right
+
+
+def _format(order):
+    if isinstance(order, int):
+        return f"A{order}"
+    return f"({_format(order[0])} {_format(order[1])})"
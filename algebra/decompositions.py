@@ -0,0 +1,153 @@
+from array import array
+
+from algebra.kernels import sumprod
+from algebra.validator import LinearAlgebraValidator as linalgvalidator
+from algebra.vectors import Vector
+
+
+class LUFactorization:
+
+    def __init__(self, matrix, inplace=False):
+        """
+        Factorize a square matrix as P ⋅ A = L ⋅ U with partial pivoting.
+
+        Mathematical definition:
+            L is lower triangular with a unit diagonal, U is upper triangular and P is
+            the permutation of the rows chosen during the elimination: at step k, the
+            row with the largest |a_ik| (i ≥ k) is swapped with row k, which keeps the
+            multipliers below 1 in absolute value.
+
+        Both factors are stored in one n × n matrix (U on and above the diagonal,
+        L strictly below it), so the factorization takes no more memory than A.
+
+        A singular matrix (a column with no nonzero pivot) is still factorized, with a
+        zero on the diagonal of U: `is_singular` is then True, `determinant` returns 0.0
+        and only `solve`, `solve_many` and `inverse` raise a ValueError.
+
+        Parameters
+        ----------
+        matrix : Matrix
+            The square matrix A to factorize.
+        inplace : bool
+            If True, the elements of `matrix` are overwritten by the factors instead of
+            being copied first.
+        """
+
+        # Validations
+        linalgvalidator.validate_object_is_matrix(matrix)
+        linalgvalidator.validate_matrix_is_square(matrix)
+
+        lu = matrix if inplace else matrix.copy()
+        n = lu.dims[0]
+        permutation = list(range(n))
+        sign = 1
+        singular = False
+
+        for k in range(n):
+            column = lu._column_values(k)
+            pivot_index = max(range(k, n), key=lambda i: abs(column[i]))
+            if column[pivot_index] == 0:
+                # Nothing to eliminate below a zero column: U gets a zero pivot
+                singular = True
+                continue
+            if pivot_index != k:
+                row_k, row_pivot = lu._row_values(k), lu._row_values(pivot_index)
+                lu._set_row_values(k, row_pivot)
+                lu._set_row_values(pivot_index, row_k)
+                permutation[k], permutation[pivot_index] = permutation[pivot_index], permutation[k]
+                sign = -sign
+
+            pivot_row = lu._row_values(k)
+            pivot, pivot_tail = pivot_row[k], pivot_row[k + 1:].tolist()
+            for i in range(k + 1, n):
+                row = lu._row_values(i)
+                factor = row[k] / pivot
+                if factor:
+                    row[k] = factor
+                    row[k + 1:] = array("d", [a - factor * b for a, b in zip(row[k + 1:], pivot_tail)])
+                    lu._set_row_values(i, row)
+
+        self.lu = lu
+        self.permutation = permutation
+        self.sign = sign
+        self.is_singular = singular
+        self.dims = [n, n]
+
+
+    def solve(self, b : Vector):
+        """
+        Solve A ⋅ x = b with the stored factors, in O(n²).
+
+        Mathematical definition:
+            A ⋅ x = b  ⇔  L ⋅ (U ⋅ x) = P ⋅ b, solved by forward substitution
+            (L ⋅ y = P ⋅ b) followed by back substitution (U ⋅ x = y).
+
+        Parameters
+        ----------
+        b : Vector
+            The right-hand side (size n).
+
+        Returns
+        -------
+        Vector
+            The solution x.
+        """
+        return self.solve_many([b])[0]
+
+    def solve_many(self, vectors):
+        """
+        Solve A ⋅ x = b for every Vector b of an iterable, reading the factors once.
+
+        Returns
+        -------
+        list of Vector
+            The solutions, in the order of the right-hand sides.
+        """
+        if self.is_singular:
+            raise ValueError("Matrix is singular.")
+        rows = [self.lu._row_values(i) for i in range(self.dims[0])]
+        return [self._substitute(rows, b) for b in vectors]
+
+    def _substitute(self, rows, b):
+        linalgvalidator.validate_object_is_vector(b)
+        linalgvalidator.validate_matrix_and_vector_have_same_length(self.lu, b)
+
+        n = self.dims[0]
+        values = b._values()
+        x = [values[p] for p in self.permutation]
+        for i in range(1, n):
+            x[i] -= sumprod(rows[i][:i], x[:i])
+        for i in range(n - 1, -1, -1):
+            row = rows[i]
+            x[i] = (x[i] - sumprod(row[i + 1:], x[i + 1:])) / row[i]
+        return Vector._from_buffer(array("d", x), n)
+
+    def determinant(self):
+        """
+        Return det(A) = sign(P) ⋅ Π Uᵢᵢ (0.0 for a singular matrix).
+        """
+        if self.is_singular:
+            return 0.0
+        determinant = float(self.sign)
+        for i in range(self.dims[0]):
+            determinant *= self.lu[i, i]
+        return determinant
+
+    def inverse(self):
+        """
+        Return A⁻¹, obtained by solving A ⋅ x = eⱼ for every column eⱼ of the identity.
+        """
+        from algebra.matrices import Matrix
+
+        n = self.dims[0]
+        identity_columns = []
+        for j in range(n):
+            column = array("d", bytes(8 * n))
+            column[j] = 1.0
+            identity_columns.append(Vector._from_buffer(column, n))
+
+        columns = self.solve_many(identity_columns)
+        values = array("d")
+        for column in columns:
+            values.extend(column._values())
+        return Matrix._from_buffer(values, [n, n]).transpose().copy()
@@ -0,0 +1,260 @@
+import time
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+
+from algebra.augmented_matrices import AugmentedMatrix
+from algebra.matrices import Matrix
+from algebra.validator import LinearAlgebraValidator
+from algebra.vectors import Vector
+
+# Operations instrumented while at least one hook is registered, as (class, method name).
+OPERATIONS = [
+    (Vector, "__init__"), (Vector, "copy"), (Vector, "scalar_multiply"), (Vector, "add"),
+    (Vector, "substract"), (Vector, "dot"), (Vector, "magnitude"), (Vector, "distance"),
+    (Vector, "cosine_similarity"),
+    (Matrix, "__init__"), (Matrix, "copy"), (Matrix, "transpose"), (Matrix, "add"),
+    (Matrix, "substract"), (Matrix, "scalar_multiply"), (Matrix, "dot"), (Matrix, "apply_to_vector"),
+    (Matrix, "lu"), (Matrix, "solve"), (Matrix, "solve_many"), (Matrix, "determinant"), (Matrix, "inverse"),
+    (AugmentedMatrix, "__init__"), (AugmentedMatrix, "solve"),
+]
+
+_hooks = []
+_originals = {}
+_stack = []
+
+
+# --------------------
+# HOOK API
+# --------------------
+
+def add_hook(hook):
+    """
+    Call `hook(event)` after every instrumented operation.
+
+    Instrumentation is only installed while at least one hook is registered: with no
+    hook, the original methods are in place and nothing is measured (zero overhead).
+
+    The event is a dict with:
+        "operation": the qualified name, e.g. "Matrix.dot" or "LinearAlgebraValidator.validate_data_is_list",
+        "time": the wall time of the call, in seconds (nested operations included),
+        "validation_time": the part of "time" spent in LinearAlgebraValidator,
+        "shapes": the shapes of the Matrix/Vector arguments (self included), e.g. ((2, 3), (3,)),
+        "elements": the number of elements of the new Matrix/Vector returned (0 for views and `out=`),
+        "is_validation": whether the operation is a validation.
+    """
+    if not callable(hook):
+        raise TypeError("The hook must be callable.")
+    if not _hooks:
+        _install()
+    _hooks.append(hook)
+
+
+def remove_hook(hook):
+    """
+    Unregister a hook (instrumentation is removed with the last hook).
+    """
+    _hooks.remove(hook)
+    if not _hooks:
+        _uninstall()
+
+
+def is_enabled():
+    """
+    Tell whether the instrumentation is installed.
+    """
+    return bool(_originals)
+
+
+def instrument(cls, name):
+    """
+    Add a method to the instrumented operations (applied the next time instrumentation is installed).
+    """
+    if not callable(getattr(cls, name, None)):
+        raise AttributeError(f"{cls.__name__} has no method {name!r}.")
+    if name not in vars(cls):
+        # Patching is done on the class defining the method (and undone by restoring it there)
+        owner = next(base for base in cls.__mro__ if name in vars(base))
+        raise AttributeError(f"{cls.__name__}.{name} is inherited: instrument {owner.__name__}.{name} instead.")
+    if (cls, name) not in OPERATIONS:
+        OPERATIONS.append((cls, name))
+        if is_enabled():
+            _patch(cls, name, is_validation=False)
+
+
+# --------------------
+# PROFILE
+# --------------------
+
+class Profile:
+
+    def __init__(self):
+        """
+        Aggregate instrumentation events per operation.
+
+        Attributes
+        ----------
+        stats : dict
+            {operation: {"calls", "time", "validation_time", "elements", "shapes" (Counter)}}
+        validation_time : float
+            The total time spent in LinearAlgebraValidator.
+        """
+        self.stats = {}
+        self.validation_time = 0.0
+
+    def record(self, event):
+        if event["is_validation"]:
+            self.validation_time += event["validation_time"]
+        stats = self.stats.get(event["operation"])
+        if stats is None:
+            stats = self.stats[event["operation"]] = {
+                "calls": 0, "time": 0.0, "validation_time": 0.0, "elements": 0, "shapes": Counter(),
+            }
+        stats["calls"] += 1
+        stats["time"] += event["time"]
+        stats["validation_time"] += event["validation_time"]
+        stats["elements"] += event["elements"]
+        stats["shapes"][event["shapes"]] += 1
+
+    def report(self):
+        """
+        Return the statistics as a text table, slowest operations first.
+        """
+        lines = [f"{'operation':<48} {'calls':>8} {'time (s)':>10} {'validation (s)':>15} {'elements':>10}"]
+        for operation, stats in sorted(self.stats.items(), key=lambda item: -item[1]["time"]):
+            lines.append(
+                f"{operation:<48} {stats['calls']:>8} {stats['time']:>10.4f} "
+                f"{stats['validation_time']:>15.4f} {stats['elements']:>10}"
+            )
+        return "\n".join(lines)
+
+
+@contextmanager
+def profile():
+    """
+    Instrument the algebra operations inside a `with` block.
+
+    Example
+    -------
+    with profile() as p:
+        A.dot(B)
+    p.stats["Matrix.dot"]["validation_time"]
+    print(p.report())
+    """
+    recorder = Profile()
+    add_hook(recorder.record)
+    try:
+        yield recorder
+    finally:
+        remove_hook(recorder.record)
+
+
+# --------------------
+# INSTALLATION
+# --------------------
+
+def _install():
+    # All or nothing: a failing patch leaves every method as it was
+    try:
+        for cls, name in OPERATIONS:
+            _patch(cls, name, is_validation=False)
+        for name in list(vars(LinearAlgebraValidator)):
+            if name.startswith("validate_"):
+                _patch(LinearAlgebraValidator, name, is_validation=True)
+    except BaseException:
+        _uninstall()
+        raise
+
+
+def _uninstall():
+    for (cls, name), original in _originals.items():
+        setattr(cls, name, original)
+    _originals.clear()
+
+
+def _patch(cls, name, is_validation):
+    _originals[(cls, name)] = cls.__dict__[name]
+    function = getattr(cls, name)  # bound to the class for the validator class methods
+    operation = f"{cls.__name__}.{name}"
+    if is_validation:
+        setattr(cls, name, staticmethod(_validation_wrapper(function, operation)))
+    else:
+        setattr(cls, name, _operation_wrapper(function, operation, name))
+
+
+def _operation_wrapper(function, operation, name):
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        frame = {"is_validation": False, "validation_time": 0.0}
+        _stack.append(frame)
+        start = time.perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            _stack.pop()
+        _emit({
+            "operation": operation,
+            "time": elapsed,
+            "validation_time": frame["validation_time"],
+            "shapes": _shapes(args),
+            "elements": _allocated(name, args, result),
+            "is_validation": False,
+        })
+        return result
+    return wrapper
+
+
+def _validation_wrapper(function, operation):
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        # Validations called by a validation (e.g. through Vector.magnitude) are not counted twice
+        outermost = not any(frame["is_validation"] for frame in _stack)
+        _stack.append({"is_validation": True, "validation_time": 0.0})
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            _stack.pop()
+            if outermost:
+                for frame in _stack:
+                    frame["validation_time"] += elapsed
+            _emit({
+                "operation": operation,
+                "time": elapsed,
+                "validation_time": elapsed if outermost else 0.0,
+                "shapes": _shapes(args),
+                "elements": 0,
+                "is_validation": True,
+            })
+    return wrapper
+
+
+def _emit(event):
+    for hook in list(_hooks):
+        hook(event)
+
+
+def _shapes(args):
+    return tuple(shape for shape in map(_shape, args) if shape is not None)
+
+
+def _shape(x):
+    if isinstance(x, Matrix):
+        return tuple(x.dims) if getattr(x, "dims", None) is not None else None
+    if isinstance(x, Vector):
+        return (x.length,) if hasattr(x, "length") else None
+    return None
+
+
+def _allocated(name, args, result):
+    if name == "__init__":
+        result = args[0]
+    if not isinstance(result, (Matrix, Vector)) or result.base is not None:
+        return 0
+    if any(result is x for x in args[1:]) or (name != "__init__" and result is args[0]):
+        return 0
+    if isinstance(result, Matrix):
+        return result.dims[0] * result.dims[1]
+    return result.length
@@ -0,0 +1,59 @@
+from array import array
+from operator import mul
+
+try:
+    from math import sumprod
+except ImportError:  # Python < 3.12
+    def sumprod(p, q):
+        """
+        Return the sum of products of values from two iterables (fallback for `math.sumprod`).
+        """
+        return sum(map(mul, p, q))
+
+
+# Number of rows of A (and columns of B) processed together by the blocked kernels.
+BLOCK_SIZE = 64
+
+
+def matmul(A, B, block_size=BLOCK_SIZE):
+    """
+    Compute the raw product of two matrices with a blocked (tiled) kernel.
+
+    Mathematical definition:
+        If A ∈ ℝᵐˣⁿ and B ∈ ℝⁿˣᵖ, then C = A ⋅ B ∈ ℝᵐˣᵖ where:
+        C[i][j] = Σ (A[i][k] * B[k][j]) for k in [0, n)
+
+    The output is computed tile by tile: a block of rows of A and a block of columns
+    of B are unpacked once into plain Python lists, then every C[i][j] of the tile is
+    a single `sumprod` of a row of A with a column of B. No intermediate object is
+    created and nothing is re-validated inside the loops.
+
+    Parameters
+    ----------
+    A : Matrix
+        The left operand (m × n). Any view is accepted.
+    B : Matrix
+        The right operand (n × p). Any view is accepted.
+    block_size : int
+        The number of rows of A and columns of B in one tile.
+
+    Returns
+    -------
+    array
+        The m × p product as a row-major `array('d')`.
+    """
+
+    m, p = A.dims[0], B.dims[1]
+    out = array("d", bytes(8 * m * p))
+
+    for i0 in range(0, m, block_size):
+        rows = [A._row_values(i).tolist() for i in range(i0, min(i0 + block_size, m))]
+        for j0 in range(0, p, block_size):
+            cols = [B._column_values(j).tolist() for j in range(j0, min(j0 + block_size, p))]
+            width = len(cols)
+            start = i0 * p + j0
+            for row in rows:
+                out[start:start + width] = array("d", [sumprod(row, col) for col in cols])
+                start += p
+
+    return out
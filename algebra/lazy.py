@@ -0,0 +1,230 @@
+from array import array
+from itertools import repeat
+
+from algebra.matrices import Matrix
+from algebra.validator import LinearAlgebraValidator as linalgvalidator
+from algebra.vectors import Vector
+
+# Compiled element-wise kernels, by generated source code (expressions with the same
+# structure share their kernel whatever their operands and scalars).
+_KERNELS = {}
+
+_SYMBOLS = {"add": "+", "substract": "-", "scale": "*"}
+
+
+class LazyExpression:
+
+    def __init__(self, op, operands=(), scalar=None, value=None):
+        """
+        A node of a lazy expression tree over Matrix or Vector objects.
+
+        Element-wise operations (add, substract, scalar_multiply) only record the
+        operation; `evaluate` then computes the whole tree in a single pass: one
+        Python function, generated for the tree, is mapped over the elements of the
+        leaves and returns each output element. No intermediate Matrix or Vector is
+        allocated or validated. Identical subexpressions are computed once per element,
+        and products (dot, apply_to_vector), which are not element-wise, are evaluated
+        once before the fused pass.
+
+        Expressions are built with `Matrix.lazy()` or `Vector.lazy()`.
+
+        Example
+        -------
+        (A.lazy() + B - C) * 0.5
+        ➞ LazyExpression(op='scale', dims=[...])
+        ((A.lazy() + B - C) * 0.5).evaluate()
+        ➞ Matrix([...])
+        """
+
+        self.op = op
+        self.operands = operands
+        self.scalar = scalar
+        self.value = value
+
+        if op == "leaf":
+            self.is_matrix = isinstance(value, Matrix)
+            self.dims = list(value.dims) if self.is_matrix else [value.length]
+            self.key = ("leaf", id(value))
+        else:
+            first = operands[0]
+            if op == "dot":
+                self.is_matrix, self.dims = True, [first.dims[0], operands[1].dims[1]]
+            elif op == "apply_to_vector":
+                self.is_matrix, self.dims = False, [first.dims[0]]
+            else:
+                self.is_matrix, self.dims = first.is_matrix, list(first.dims)
+            self.key = (op, scalar) + tuple(operand.key for operand in operands)
+
+    @classmethod
+    def wrap(cls, x):
+        """
+        Return x as a LazyExpression (a leaf if x is a Matrix or a Vector).
+        """
+        if isinstance(x, LazyExpression):
+            return x
+        if isinstance(x, (Matrix, Vector)):
+            return cls("leaf", value=x)
+        raise TypeError(f"Expected a Matrix, a Vector or a LazyExpression, got '{type(x).__name__}'.")
+
+
+    # OPERATIONS
+    def add(self, other):
+        """
+        Record the element-wise sum self + other.
+        """
+        return self._elementwise("add", LazyExpression.wrap(other))
+
+    def substract(self, other):
+        """
+        Record the element-wise difference self - other.
+        """
+        return self._elementwise("substract", LazyExpression.wrap(other))
+
+    def scalar_multiply(self, scalar):
+        """
+        Record the product α ⋅ self.
+        """
+        linalgvalidator.validate_data_is_scalar(scalar)
+
+        return LazyExpression("scale", (self,), scalar=scalar)
+
+    def dot(self, other):
+        """
+        Record the matrix product self ⋅ other (evaluated before the fused pass).
+        """
+        other = LazyExpression.wrap(other)
+        if not (self.is_matrix and other.is_matrix):
+            raise TypeError("dot expects two matrix expressions.")
+        linalgvalidator.validate_matrices_are_compatible_for_matrix_product(self, other)
+
+        return LazyExpression("dot", (self, other))
+
+    def apply_to_vector(self, vector):
+        """
+        Record the matrix-vector product self ⋅ v (evaluated before the fused pass).
+        """
+        vector = LazyExpression.wrap(vector)
+        if not self.is_matrix or vector.is_matrix:
+            raise TypeError("apply_to_vector expects a matrix expression and a vector expression.")
+        if self.dims[1] != vector.dims[0]:
+            raise ValueError(f"Matrix columns ({self.dims[1]}) and Vector ({vector.dims[0]}) must have the same length.")
+
+        return LazyExpression("apply_to_vector", (self, vector))
+
+    def _elementwise(self, op, other):
+        if self.is_matrix != other.is_matrix or self.dims != other.dims:
+            raise ValueError(f"Operands do not have the same shape ({self.dims} and {other.dims}).")
+
+        return LazyExpression(op, (self, other))
+
+
+    # EVALUATION
+    def evaluate(self):
+        """
+        Compute the expression.
+
+        Returns
+        -------
+        Matrix or Vector
+            The result, computed in one fused pass over the elements.
+        """
+        return self._evaluate({})
+
+    def _evaluate(self, evaluated):
+        if self.op == "leaf":
+            return self.value
+        if self.key in evaluated:
+            return evaluated[self.key]
+
+        if self.op == "dot":
+            left, right = (operand._evaluate(evaluated) for operand in self.operands)
+            result = left.dot(right)
+        elif self.op == "apply_to_vector":
+            matrix, vector = (operand._evaluate(evaluated) for operand in self.operands)
+            result = matrix.apply_to_vector(vector)
+        else:
+            inputs, scalars = [], []
+            kernel = _compile(self, inputs, scalars)
+            buffers = [_flat_values(node._evaluate(evaluated)) for node in inputs]
+            values = array("d", map(kernel, *buffers, *(repeat(scalar) for scalar in scalars)))
+            if self.is_matrix:
+                result = Matrix._from_buffer(values, self.dims)
+            else:
+                result = Vector._from_buffer(values, self.dims[0])
+
+        evaluated[self.key] = result
+        return result
+
+
+    # OVERLOAD
+    def __repr__(self):
+        return f"LazyExpression(op={self.op!r}, dims={self.dims})"
+
+    def __add__(self, other):
+        return self.add(other)
+
+    def __radd__(self, other):
+        return LazyExpression.wrap(other).add(self)
+
+    def __sub__(self, other):
+        return self.substract(other)
+
+    def __rsub__(self, other):
+        return LazyExpression.wrap(other).substract(self)
+
+    def __mul__(self, other):
+        return self.scalar_multiply(other)
+
+    def __rmul__(self, other):
+        return self.scalar_multiply(other)
+
+    def __neg__(self):
+        return self.scalar_multiply(-1)
+
+    def __matmul__(self, other):
+        other = LazyExpression.wrap(other)
+        if other.is_matrix:
+            return self.dot(other)
+        return self.apply_to_vector(other)
+
+
+def _flat_values(x):
+    return x._row_major() if isinstance(x, Matrix) else x._values()
+
+
+def _compile(expression, inputs, scalars):
+    """
+    Generate (or reuse) the function computing one output element of an element-wise tree.
+
+    `inputs` and `scalars` are filled with the nodes read element by element (leaves and
+    products) and with the scalars, in the order of the generated function arguments.
+    """
+    names, lines = {}, []
+
+    def visit(node):
+        if node.key in names:
+            return names[node.key]
+        if node.op in _SYMBOLS:
+            if node.op == "scale":
+                operand = visit(node.operands[0])
+                scalars.append(node.scalar)
+                operands = (operand, f"s{len(scalars) - 1}")
+            else:
+                operands = tuple(visit(operand) for operand in node.operands)
+            name = f"t{len(lines)}"
+            lines.append(f"    {name} = {operands[0]} {_SYMBOLS[node.op]} {operands[1]}")
+        else:
+            inputs.append(node)
+            name = f"x{len(inputs) - 1}"
+        names[node.key] = name
+        return name
+
+    result = visit(expression)
+    arguments = [f"x{i}" for i in range(len(inputs))] + [f"s{i}" for i in range(len(scalars))]
+    source = f"def kernel({', '.join(arguments)}):\n" + "\n".join(lines + [f"    return {result}"])
+
+    if source not in _KERNELS:
+        namespace = {}
+        exec(source, namespace)
+        _KERNELS[source] = namespace["kernel"]
+    return _KERNELS[source]
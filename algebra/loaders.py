@@ -0,0 +1,231 @@
+import csv
+import os
+from array import array
+from operator import itemgetter
+
+from algebra.matrices import Matrix
+from algebra.serialization import resolve_path
+
+# Default number of rows per block yielded by `iter_csv_blocks`.
+BLOCK_SIZE = 1024
+
+_BOOLEANS = {"true": 1.0, "false": 0.0}
+
+
+def iter_csv_blocks(path, block_size=BLOCK_SIZE, delimiter=None, header="auto", columns=None):
+    """
+    Read a CSV/TSV file in one pass, as Matrix blocks of at most `block_size` rows.
+
+    Only the current block is held in memory, whatever the size of the file. Each
+    block is built directly on a flat buffer, without the list of lists and the
+    validation of `Matrix(data)`.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        The file path, relative to DATA_DIR unless absolute.
+    block_size : int
+        The maximum number of rows of a block.
+    delimiter : str, optional
+        The field separator. Defaults to a tab for ".tsv" and ".tab" files, a comma otherwise.
+    header : bool or "auto"
+        Whether the first line holds column names. "auto" treats it as a header when
+        one of its (selected) fields is not a number.
+    columns : list of int or str, optional
+        The columns to keep, by position or by header name, in the given order.
+        Defaults to all the columns.
+
+    Yields
+    ------
+    Matrix
+        The consecutive row blocks.
+
+    Example
+    -------
+    for block in iter_csv_blocks("measures.csv", block_size=10_000, columns=["x", "y"]):
+        process(block)   # a 10 000 × 2 Matrix, one block in memory at a time
+    """
+    if not isinstance(block_size, int) or isinstance(block_size, bool) or block_size < 1:
+        raise ValueError("The block size must be a positive integer.")
+
+    with _open(path) as file:
+        width, rows = _parse(file, path, delimiter, header, columns)
+        values, count = array("d"), 0
+        for row in rows:
+            values.extend(row)
+            count += 1
+            if count == block_size:
+                yield Matrix._from_buffer(values, [count, width])
+                values, count = array("d"), 0
+        if count:
+            yield Matrix._from_buffer(values, [count, width])
+
+
+def load_csv(path, rows=None, delimiter=None, header="auto", columns=None):
+    """
+    Read a whole CSV/TSV file into one Matrix, in one pass.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        The file path, relative to DATA_DIR unless absolute.
+    rows : int, optional
+        The number of data rows, when known: the buffer of the matrix is then allocated
+        once and filled in place, instead of growing while the file is read.
+    delimiter, header, columns
+        See `iter_csv_blocks`.
+
+    Returns
+    -------
+    Matrix
+        The matrix of the (selected) columns.
+    """
+    with _open(path) as file:
+        width, parsed = _parse(file, path, delimiter, header, columns)
+        if rows is None:
+            values, count = array("d"), 0
+            for row in parsed:
+                values.extend(row)
+                count += 1
+        else:
+            if not isinstance(rows, int) or isinstance(rows, bool) or rows < 0:
+                raise ValueError("The number of rows must be a non-negative integer.")
+            values, count = array("d", bytes(8 * rows * width)), 0
+            # Rows are staged in a small block, copied into place every BLOCK_SIZE rows
+            staged, start = array("d"), 0
+            for row in parsed:
+                if count == rows:
+                    raise ValueError(f"The file has more than the {rows} announced rows.")
+                staged.extend(row)
+                count += 1
+                if len(staged) == BLOCK_SIZE * width:
+                    values[start:start + len(staged)] = staged
+                    start += len(staged)
+                    del staged[:]
+            values[start:start + len(staged)] = staged
+            if count != rows:
+                raise ValueError(f"The file has {count} rows, {rows} were announced.")
+
+    if count == 0:
+        raise ValueError(f"No data rows in {path}.")
+    return Matrix._from_buffer(values, [count, width])
+
+
+def _open(path):
+    return open(resolve_path(path), newline="")
+
+
+def _parse(file, path, delimiter, header, columns):
+    """
+    Read the first lines and return the number of selected columns and an iterator of converted rows.
+
+    The type of every selected column (number or boolean) is inferred from the first data
+    row; rows are then converted with the inferred types, numbers staying on the fast
+    `map(float, ...)` path.
+    """
+    if delimiter is None:
+        delimiter = "\t" if os.path.splitext(os.fspath(path))[1].lower() in (".tsv", ".tab") else ","
+    if header not in (True, False, "auto"):
+        raise ValueError(f"header must be True, False or 'auto', got {header!r}.")
+
+    reader = csv.reader(file, delimiter=delimiter)
+    lines = (row for row in reader if row)
+    first = next(lines, None)
+    if first is None:
+        raise ValueError(f"No data rows in {path}.")
+
+    names = None
+    if header == "auto":
+        header = any(_converter(field) is None for field in _auto_header_fields(first, columns))
+    if header:
+        names = [name.strip() for name in first]
+        first = next(lines, None)
+        if first is None:
+            raise ValueError(f"No data rows in {path}.")
+
+    positions = _positions(columns, names, len(first))
+    select = itemgetter(*positions) if positions is not None else None
+    fields = _pick(first, select)
+    converters = [_converter(field) for field in fields]
+    for position, converter in enumerate(converters):
+        if converter is None:
+            column = positions[position] if positions is not None else position
+            label = names[column] if names else column
+            raise ValueError(f"Column {label!r} is not numeric (first value {fields[position]!r}).")
+    width = len(converters)
+
+    def rows():
+        numeric = all(converter is float for converter in converters)
+        for row in _chain(first, lines):
+            try:
+                fields = _pick(row, select)
+                if len(fields) != width:
+                    raise ValueError(f"expected {width} fields, found {len(fields)}")
+                yield list(map(float, fields)) if numeric else [convert(field) for convert, field in zip(converters, fields)]
+            except (ValueError, KeyError, IndexError) as error:
+                raise ValueError(f"{path}, line {reader.line_num}: {error}") from None
+
+    return width, rows()
+
+
+def _chain(first, lines):
+    yield first
+    yield from lines
+
+
+def _pick(row, select):
+    if select is None:
+        return row
+    picked = select(row)
+    return picked if isinstance(picked, tuple) else (picked,)
+
+
+def _auto_header_fields(row, columns):
+    """
+    Return the fields of the first line looked at to detect a header.
+    """
+    if columns is None:
+        return row
+    if any(isinstance(column, str) for column in columns):
+        return [""]  # selecting by name implies a header
+    return [row[column] for column in columns if isinstance(column, int) and -len(row) <= column < len(row)]
+
+
+def _positions(columns, names, width):
+    if columns is None:
+        return None
+    if not columns:
+        raise ValueError("At least one column must be selected.")
+    positions = []
+    for column in columns:
+        if isinstance(column, str):
+            if names is None:
+                raise ValueError(f"Column {column!r} is selected by name but the file has no header.")
+            if column not in names:
+                raise ValueError(f"Unknown column {column!r}, expected one of {names}.")
+            positions.append(names.index(column))
+        elif isinstance(column, int) and not isinstance(column, bool):
+            if not -width <= column < width:
+                raise ValueError(f"Column {column} is out of range ({width} columns).")
+            positions.append(column % width)
+        else:
+            raise TypeError("Columns must be selected by position (int) or by name (str).")
+    return positions
+
+
+def _converter(field):
+    """
+    Return the function converting a field like this one, or None if it is not numeric.
+    """
+    try:
+        float(field)
+        return float
+    except ValueError:
+        pass
+    if field.strip().lower() in _BOOLEANS:
+        return _boolean
+    return None
+
+
+def _boolean(field):
+    return _BOOLEANS[field.strip().lower()]
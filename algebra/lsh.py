@@ -0,0 +1,231 @@
+import random
+from array import array
+
+from algebra.kernels import sumprod
+from algebra.validator import LinearAlgebraValidator as linalgvalidator
+from algebra.vectors import Vector
+
+# Default number of hash tables (more tables: better recall, more memory).
+TABLES = 8
+
+# Default number of hyperplanes per table (more bits: smaller buckets, faster queries, lower recall).
+BITS = 12
+
+
+class CosineLSH:
+
+    def __init__(self, dim, tables=TABLES, bits=BITS, seed=None):
+        """
+        Create an approximate cosine-similarity index (random-projection locality sensitive hashing).
+
+        Mathematical definition:
+            Each table draws `bits` random hyperplanes hⱼ (Gaussian coordinates). A vector v
+            is hashed to the signature of the sides it lies on: bit j is 1 when hⱼ · v ≥ 0.
+            Two vectors at an angle θ agree on one bit with probability 1 - θ / π, so
+            similar vectors tend to share a bucket in at least one table.
+
+        A query collects the vectors sharing its bucket in any table, then re-ranks these
+        candidates with the exact cosine similarity; only the candidates are compared,
+        instead of every stored vector.
+
+        Parameters
+        ----------
+        dim : int
+            The length of the indexed vectors.
+        tables : int
+            The number of hash tables.
+        bits : int
+            The number of hyperplanes (signature bits) per table.
+        seed : int, optional
+            The seed of the hyperplanes, for reproducible indexes.
+        """
+
+        for name, value in (("dim", dim), ("tables", tables), ("bits", bits)):
+            if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+                raise ValueError(f"{name} must be a positive integer.")
+
+        rng = random.Random(seed)
+        self.dim = dim
+        self.tables = tables
+        self.bits = bits
+        self._planes = [
+            [array("d", [rng.gauss(0.0, 1.0) for _ in range(dim)]) for _ in range(bits)]
+            for _ in range(tables)
+        ]
+        self._buckets = [{} for _ in range(tables)]
+        self._vectors = {}
+        self._norms = {}
+        self._signatures = {}
+        self._next_key = 0
+
+
+    # HASHING
+    def _signatures_of(self, values):
+        signatures = []
+        for planes in self._planes:
+            signature = 0
+            for plane in planes:
+                signature = (signature << 1) | (sumprod(plane, values) >= 0)
+            signatures.append(signature)
+        return signatures
+
+    def _checked_values(self, v):
+        linalgvalidator.validate_object_is_vector(v)
+        if v.length != self.dim:
+            raise ValueError(f"Vector ({v.length}) and index ({self.dim}) are not the same dimension.")
+        values = array("d", v._values())
+        norm = sumprod(values, values) ** 0.5
+        if norm == 0:
+            raise ZeroDivisionError("Cannot compute cosine similarity with a zero vector.")
+        return values, norm
+
+
+    # UPDATES
+    def insert(self, v, key=None):
+        """
+        Add a vector to the index.
+
+        Parameters
+        ----------
+        v : Vector
+            The vector (non-zero, copied by the index).
+        key : hashable, optional
+            The key returned by queries for this vector. Defaults to the next free integer.
+
+        Returns
+        -------
+        hashable
+            The key of the vector.
+        """
+        values, norm = self._checked_values(v)
+        if key is None:
+            while self._next_key in self._vectors:
+                self._next_key += 1
+            key = self._next_key
+        if key in self._vectors:
+            raise KeyError(f"Key {key!r} is already in the index.")
+
+        signatures = self._signatures_of(values)
+        for buckets, signature in zip(self._buckets, signatures):
+            buckets.setdefault(signature, {})[key] = None
+        self._vectors[key] = values
+        self._norms[key] = norm
+        self._signatures[key] = signatures
+        return key
+
+    def extend(self, vectors):
+        """
+        Add several vectors and return their keys.
+        """
+        return [self.insert(v) for v in vectors]
+
+    def delete(self, key):
+        """
+        Remove the vector stored under a key.
+        """
+        if key not in self._vectors:
+            raise KeyError(f"Key {key!r} is not in the index.")
+
+        for buckets, signature in zip(self._buckets, self._signatures.pop(key)):
+            bucket = buckets[signature]
+            del bucket[key]
+            if not bucket:
+                del buckets[signature]
+        del self._vectors[key]
+        del self._norms[key]
+
+
+    # QUERIES
+    def candidates(self, v):
+        """
+        Return the keys of the vectors sharing a bucket with v in at least one table.
+        """
+        values, _ = self._checked_values(v)
+        return self._candidates(values)
+
+    def _candidates(self, values):
+        candidates = {}
+        for buckets, signature in zip(self._buckets, self._signatures_of(values)):
+            candidates.update(buckets.get(signature, {}))
+        return list(candidates)
+
+    def query(self, v, k=1):
+        """
+        Find (approximately) the k stored vectors most similar to v.
+
+        Parameters
+        ----------
+        v : Vector
+            The query vector (non-zero).
+        k : int
+            The number of results.
+
+        Returns
+        -------
+        tuple of (list, list)
+            The exact cosine similarities (descending) and the keys of at most k vectors,
+            taken among the candidates only.
+        """
+        if not isinstance(k, int) or isinstance(k, bool) or k < 1:
+            raise ValueError("k must be a positive integer.")
+        values, norm = self._checked_values(v)
+
+        return self._ranked(values, norm, self._candidates(values), k)
+
+    def _ranked(self, values, norm, keys, k):
+        vectors, norms = self._vectors, self._norms
+        scored = [(sumprod(values, vectors[key]) / (norm * norms[key]), position, key) for position, key in enumerate(keys)]
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [similarity for similarity, _, _ in scored[:k]], [key for _, _, key in scored[:k]]
+
+    def recall(self, queries=None, k=10, sample=100, seed=0):
+        """
+        Measure the recall of `query` against an exact scan, to tune `tables` and `bits`.
+
+        Parameters
+        ----------
+        queries : list of Vector, optional
+            The query vectors. Defaults to `sample` stored vectors drawn at random
+            (each one is then its own nearest neighbour, found in every table).
+        k : int
+            The number of neighbours compared.
+        sample : int
+            The number of stored vectors drawn when `queries` is not given.
+        seed : int
+            The seed of the draw.
+
+        Returns
+        -------
+        dict
+            "recall": the mean fraction of the exact k neighbours returned by `query`,
+            "candidates": the mean fraction of the index re-ranked per query,
+            "queries": the number of queries.
+        """
+        if queries is None:
+            keys = list(self._vectors)
+            keys = random.Random(seed).sample(keys, min(sample, len(keys)))
+            queries = [Vector._from_buffer(self._vectors[key], self.dim) for key in keys]
+        if not queries or not self._vectors:
+            raise ValueError("recall needs at least one query and one indexed vector.")
+
+        found, candidates = 0, 0
+        for v in queries:
+            values, norm = self._checked_values(v)
+            keys = self._candidates(values)
+            approximate = set(self._ranked(values, norm, keys, k)[1])
+            exact = self._ranked(values, norm, list(self._vectors), k)[1]
+            found += len(approximate.intersection(exact)) / len(exact)
+            candidates += len(keys) / len(self._vectors)
+
+        return {"recall": found / len(queries), "candidates": candidates / len(queries), "queries": len(queries)}
+
+
+    # OVERLOAD
+    def __repr__(self):
+        return f"CosineLSH(dim={self.dim}, tables={self.tables}, bits={self.bits}, count={len(self)})"
+
+    def __len__(self):
+        return len(self._vectors)
+
+    def __contains__(self, key):
+        return key in self._vectors
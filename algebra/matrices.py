@@ -1,9 +1,18 @@
+from array import array
+from operator import add, sub
+
+from algebra import parallel, strassen
+from algebra.decompositions import LUFactorization
+from algebra.kernels import sumprod
 from algebra.validator import LinearAlgebraValidator as linalgvalidator
-from algebra.vectors import Vector
+from algebra.vectors import Vector, _as_double_buffer, _detached, _owner, _same_values, _strided_assign, _strided_slice, _validate_size
 
 class Matrix:
 
-    def __init__(self, data : list):
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = ("_buffer", "_offset", "_strides", "dims", "base", "_version", "_frozen", "_cache", "__weakref__")
+
+    def __init__(self, data : list, validation=None):
         """
         Create a Matrix object from a list of lists (rows of scalar values).
 
@@ -11,20 +20,386 @@ class Matrix:
             A matrix is a rectangular array of numbers with dimensions (rows × columns),
             e.g., [[1, 2], [3, 4]] represents a 2×2 matrix.
 
+        Storage:
+            The elements are stored row-major in one contiguous `array('d')` buffer,
+            element (i, j) living at position offset + i * strides[0] + j * strides[1].
+            Views (rows, columns, slices, transpose) share the buffer of their `base`
+            and only differ by their offset, dims and strides.
+
         Parameters
         ----------
         data : list of lists
             The matrix data. Each element must be a list of scalar values (int or float),
             and all rows must have the same length.
+        validation : str, optional
+            The validation policy for this call: "full" (every element is checked),
+            "shape" (only the structure is checked) or "off". Defaults to the active
+            policy (see `algebra.validator.validation_policy`).
         """
 
         # Validations
-        linalgvalidator.validate_data_is_valid_matrix(data) 
+        linalgvalidator.validate_data_is_valid_matrix(data, policy=validation)
 
-        self.data = data
+        buffer = array("d")
+        for row in data:
+            buffer.extend(row)
+
+        self._buffer = buffer
+        self._offset = 0
+        self._strides = (len(data[0]), 1)
         self.dims = [len(data), len(data[0])]
+        self.base = None
+        self._version = 0
+        self._frozen = False
+        self._cache = None
+
+
+    @classmethod
+    def _from_buffer(cls, buffer, dims, offset=0, strides=None, base=None):
+        """
+        Build a Matrix directly on top of an existing buffer, without validation.
+
+        Used internally for results computed by the library and for views.
+        When `strides` is omitted, the buffer is read as row-major contiguous data.
+        """
+        matrix = cls.__new__(cls)
+        matrix._buffer = buffer
+        matrix._offset = offset
+        matrix._strides = strides if strides is not None else (dims[1], 1)
+        matrix.dims = [dims[0], dims[1]]
+        matrix.base = base
+        matrix._version = 0
+        matrix._frozen = False
+        matrix._cache = None
+        return matrix
+
+    # BULK CONSTRUCTORS
+    # The values are produced by the library (or copied into a buffer of doubles), so
+    # the element-by-element validation of the constructor is skipped.
+    @staticmethod
+    def zeros(shape):
+        """
+        Create the matrix of zeros of shape (rows, cols).
+        """
+        rows, cols = _validate_shape(shape)
+        return Matrix._from_buffer(array("d", bytes(8 * rows * cols)), [rows, cols])
+
+    @staticmethod
+    def ones(shape):
+        """
+        Create the matrix of ones of shape (rows, cols).
+        """
+        return Matrix.full(shape, 1.0)
+
+    @staticmethod
+    def full(shape, value):
+        """
+        Create a matrix of shape (rows, cols) whose elements are all equal to `value`.
+        """
+        rows, cols = _validate_shape(shape)
+        linalgvalidator.validate_data_is_scalar(value)
+        return Matrix._from_buffer(array("d", [value]) * (rows * cols), [rows, cols])
+
+    @staticmethod
+    def identity(n):
+        """
+        Create the n × n identity matrix Iₙ.
+        """
+        matrix = Matrix.zeros((n, n))
+        matrix._buffer[::n + 1] = array("d", [1.0]) * n
+        return matrix
+
+    @staticmethod
+    def from_flat(buffer, shape):
+        """
+        Create a matrix from a flat row-major buffer of numbers.
+
+        Parameters
+        ----------
+        buffer : array('d'), memoryview of doubles or sequence of numbers
+            The elements, row after row. An `array('d')` or a memoryview of doubles is
+            used as is (no copy: the matrix shares it); anything else is copied into an
+            `array('d')`.
+        shape : tuple of int
+            The shape (rows, cols), with rows × cols equal to the length of the buffer.
+
+        Example
+        -------
+        Matrix.from_flat([1, 2, 3, 4, 5, 6], (2, 3))
+        ➞ Matrix([[1.0, 2.0, 3.0],
+                  [4.0, 5.0, 6.0]])
+        """
+        rows, cols = _validate_shape(shape)
+        buffer = _as_double_buffer(buffer)
+        if len(buffer) != rows * cols:
+            raise ValueError(f"Buffer of {len(buffer)} elements does not match shape ({rows}, {cols}).")
+        return Matrix._from_buffer(buffer, [rows, cols])
+
+    @staticmethod
+    def from_iter(rows):
+        """
+        Create a matrix from any iterable of rows, each an iterable of numbers (e.g. generators), in one pass.
+
+        Only the row lengths are checked; the elements are written straight into the buffer.
+        """
+        buffer, count, cols = array("d"), 0, None
+        for row in rows:
+            size = len(buffer)
+            buffer.extend(row)
+            if cols is None:
+                cols = len(buffer) - size
+            elif len(buffer) - size != cols:
+                raise ValueError("Matrix rows must all be the same length.")
+            count += 1
+        if cols is None:
+            raise ValueError("Expected at least one row.")
+        return Matrix._from_buffer(buffer, [count, cols])
+
+    @staticmethod
+    def random(shape, seed=None, low=0.0, high=1.0):
+        """
+        Create a matrix of shape (rows, cols) with elements drawn uniformly in [low, high).
+
+        Parameters
+        ----------
+        shape : tuple of int
+            The shape (rows, cols).
+        seed : int, optional
+            The seed of the generator, for reproducible matrices.
+        """
+        rows, cols = _validate_shape(shape)
+        return Matrix._from_buffer(Vector.random(rows * cols, seed, low, high)._buffer, [rows, cols])
+
+    def _view(self, dims, offset, strides):
+        return Matrix._from_buffer(
+            self._buffer, dims, offset, strides,
+            base=self.base if self.base is not None else self,
+        )
+
+
+    # STORAGE
+    @property
+    def data(self):
+        """
+        The matrix rows as a list of lists (a copy, kept for compatibility).
+        """
+        return [row.tolist() for row in self._rows()]
+
+    @property
+    def strides(self):
+        """
+        The number of buffer positions to skip to move by one row and by one column.
+        """
+        return self._strides
+
+    def _is_contiguous(self):
+        rows, cols = self.dims
+        return (rows <= 1 or self._strides[0] == cols) and (cols <= 1 or self._strides[1] == 1)
+
+    def _row_values(self, index):
+        """
+        Return the row `index` as a contiguous buffer (a copy).
+        """
+        cols = self.dims[1]
+        start = self._offset + index * self._strides[0]
+        if self._strides[1] == 1:
+            return _detached(self._buffer[start:start + cols])
+        return _detached(_strided_slice(self._buffer, start, cols, self._strides[1]))
+
+    def _column_values(self, index):
+        """
+        Return the column `index` as a contiguous buffer (a copy).
+        """
+        rows = self.dims[0]
+        start = self._offset + index * self._strides[1]
+        if self._strides[0] == 1:
+            return _detached(self._buffer[start:start + rows])
+        return _detached(_strided_slice(self._buffer, start, rows, self._strides[0]))
+
+    def _rows(self):
+        """
+        Iterate over the rows as contiguous buffers.
+        """
+        return (self._row_values(i) for i in range(self.dims[0]))
+
+    def _row_major(self):
+        """
+        Return all the elements as one row-major contiguous buffer.
+
+        The underlying buffer itself is returned when the matrix covers it entirely
+        in row-major order (no copy), so the result must be treated as read-only.
+        """
+        rows, cols = self.dims
+        buffer = self._buffer
+        if self._is_contiguous():
+            if self._offset == 0 and len(buffer) == rows * cols:
+                return buffer
+            return buffer[self._offset:self._offset + rows * cols]
+        values = array("d")
+        for row in self._rows():
+            values.extend(row)
+        return values
+
+    def _set_row_values(self, index, values):
+        """
+        Overwrite the row `index` with a contiguous buffer of the same length.
+        """
+        self._check_writable()
+        cols = self.dims[1]
+        start = self._offset + index * self._strides[0]
+        if self._strides[1] == 1:
+            self._buffer[start:start + cols] = values
+        else:
+            _strided_assign(self._buffer, start, cols, self._strides[1], values)
+        self._bump_version()
+
+    def _set_row_major(self, values):
+        """
+        Overwrite all the elements with a row-major contiguous buffer.
+        """
+        self._check_writable()
+        rows, cols = self.dims
+        if self._is_contiguous():
+            self._buffer[self._offset:self._offset + rows * cols] = values
+            self._bump_version()
+        else:
+            for i in range(rows):
+                self._set_row_values(i, values[i * cols:(i + 1) * cols])
+
+    def _result(self, values, dims, out):
+        """
+        Wrap the computed elements in a new Matrix, or write them into `out`.
+
+        The values are always fully computed before being written, so `out` may
+        share its buffer with any operand.
+        """
+        if out is None:
+            return Matrix._from_buffer(values, dims)
+        linalgvalidator.validate_object_is_matrix(out)
+        linalgvalidator.validate_matrix_has_shape(out, dims)
+        out._set_row_major(values)
+        return out
+
+    def _bump_version(self):
+        """
+        Record a modification of the buffer, invalidating the results cached for it.
+        """
+        _owner(self)._version += 1
+
+    def _current_version(self):
+        return _owner(self)._version
+
+    def _check_writable(self):
+        if _owner(self)._frozen:
+            raise ValueError("Matrix is frozen (read-only): use unfreeze() or copy() to modify it.")
+
+    def _cached(self, name, compute):
+        """
+        Return a derived quantity, computed once and reused until the buffer is modified.
+        """
+        if self._cache is None:
+            self._cache = {}
+        version = self._current_version()
+        cached = self._cache.get(name)
+        if cached is None or cached[0] != version:
+            cached = (version, compute())
+            self._cache[name] = cached
+        return cached[1]
+
+    def _index(self, row, col):
+        rows, cols = self.dims
+        if row < 0:
+            row += rows
+        if col < 0:
+            col += cols
+        if not (0 <= row < rows and 0 <= col < cols):
+            raise IndexError("Matrix index out of range.")
+        return self._offset + row * self._strides[0] + col * self._strides[1]
+
+    def copy(self):
+        """
+        Return a new Matrix owning a contiguous copy of the elements.
+        """
+        return Matrix._from_buffer(array("d", self._row_major()), self.dims)
+
+
+    # FROZEN MODE
+    def freeze(self):
+        """
+        Make the matrix read-only and cache its derived quantities.
+
+        Once frozen, every write to the buffer (item assignment, row operations,
+        `out=`, in-place operators, in-place LU) raises a ValueError, including writes
+        through views of it: freezing a view freezes the matrix (or vector) owning the
+        buffer. In exchange, the transpose, the row norms, the Frobenius norm, the content
+        hash and the LU factors are computed once and reused, and the matrix is hashable.
+
+        Returns
+        -------
+        Matrix
+            self, to allow `A = Matrix(rows).freeze()`.
+        """
+        _owner(self)._frozen = True
+        return self
+
+    def unfreeze(self):
+        """
+        Make the matrix (and every view of its buffer) writable again, dropping the cached quantities.
+        """
+        _owner(self)._frozen = False
+        self._bump_version()
+        return self
+
+    @property
+    def is_frozen(self):
+        """
+        Whether the buffer of the matrix is read-only (see `freeze`).
+        """
+        return _owner(self)._frozen
+
+
+    # VIEWS
+    def row(self, index):
+        """
+        Return the row `index` as a Vector view sharing the matrix buffer.
+        """
+        rows, cols = self.dims
+        if index < 0:
+            index += rows
+        if not 0 <= index < rows:
+            raise IndexError("Matrix row index out of range.")
+        return Vector._from_buffer(
+            self._buffer, cols,
+            offset=self._offset + index * self._strides[0],
+            stride=self._strides[1],
+            base=self.base if self.base is not None else self,
+        )
+
+    def column(self, index):
+        """
+        Return the column `index` as a Vector view sharing the matrix buffer.
+        """
+        rows, cols = self.dims
+        if index < 0:
+            index += cols
+        if not 0 <= index < cols:
+            raise IndexError("Matrix column index out of range.")
+        return Vector._from_buffer(
+            self._buffer, rows,
+            offset=self._offset + index * self._strides[1],
+            stride=self._strides[0],
+            base=self.base if self.base is not None else self,
+        )
+
+    def _slice_view(self, row_slice, col_slice):
+        rows, cols = self.dims
+        row_start, row_stop, row_step = row_slice.indices(rows)
+        col_start, col_stop, col_step = col_slice.indices(cols)
+        dims = [len(range(row_start, row_stop, row_step)), len(range(col_start, col_stop, col_step))]
+        offset = self._offset + row_start * self._strides[0] + col_start * self._strides[1]
+        strides = (self._strides[0] * row_step, self._strides[1] * col_step)
+        return self._view(dims, offset, strides)
 
-    
 
     # OPERATIONS:
     def transpose(self):
@@ -34,7 +409,8 @@ class Matrix:
         Returns
         -------
         Matrix
-            A new Matrix object where rows become columns and columns become rows.
+            A view where rows become columns and columns become rows. No element is
+            copied: the view shares the buffer of the original matrix.
 
         Example
         -------
@@ -44,21 +420,13 @@ class Matrix:
                 [2, 4]])
         """
 
-        # My implementation
-        new_matrix = []
-        for row_index, row in enumerate(self):
-            for col_index, element in enumerate(row):
-                if row_index == 0:
-                    new_matrix.append([element])
-                else:
-                    new_matrix[col_index].append(element)
-        
-        return Matrix(new_matrix)
-    
-        # Optimized with zip -> transposed_data = [list(col) for col in zip(*self.data)]
+        rows, cols = self.dims
+        if self.is_frozen:
+            return self._cached("transpose", lambda: self._view([cols, rows], self._offset, (self._strides[1], self._strides[0])))
+        return self._view([cols, rows], self._offset, (self._strides[1], self._strides[0]))
     
 
-    def add(self, other):
+    def add(self, other, out=None):
         """
         Add two matrices of the same dimensions, element-wise.
 
@@ -66,25 +434,25 @@ class Matrix:
         ----------
         other : Matrix
             The matrix to add.
+        out : Matrix, optional
+            A matrix of the same shape receiving the result instead of a new matrix
+            (it may be self or other).
 
         Returns
         -------
         Matrix
-            A new Matrix representing the sum.
+            A new Matrix representing the sum (or `out`).
         """
 
-        linalgvalidator.validate_data_is_valid_matrix(other.data)
+        linalgvalidator.validate_object_is_matrix(other)
         linalgvalidator.validate_matrices_have_same_shape(self, other)
 
-        new_matrix = [
-            [a + b for a, b in zip(row_a, row_b)]
-            for row_a, row_b in zip(self, other)
-        ]
+        new_matrix = array("d", map(add, self._row_major(), other._row_major()))
 
-        return Matrix(new_matrix)
+        return self._result(new_matrix, self.dims, out)
     
     
-    def substract(self, other):
+    def substract(self, other, out=None):
         """
         Substract two matrices of the same dimensions, element-wise.
 
@@ -92,25 +460,25 @@ class Matrix:
         ----------
         other : Matrix
             The matrix to substract from self.
+        out : Matrix, optional
+            A matrix of the same shape receiving the result instead of a new matrix
+            (it may be self or other).
 
         Returns
         -------
         Matrix
-            A new Matrix representing the difference.
+            A new Matrix representing the difference (or `out`).
         """
 
-        linalgvalidator.validate_data_is_valid_matrix(other.data)
+        linalgvalidator.validate_object_is_matrix(other)
         linalgvalidator.validate_matrices_have_same_shape(self, other)
 
-        new_matrix = [
-            [a - b for a, b in zip(row_a, row_b)]
-            for row_a, row_b in zip(self, other)
-        ]
+        new_matrix = array("d", map(sub, self._row_major(), other._row_major()))
 
-        return Matrix(new_matrix)
+        return self._result(new_matrix, self.dims, out)
     
     
-    def scalar_multiply(self, scalar):
+    def scalar_multiply(self, scalar, out=None):
         """
         Multiply the matrix by a scalar (element-wise multiplication).
 
@@ -125,19 +493,22 @@ class Matrix:
         ----------
         scalar : int or float
             The scalar to multiply each element of the matrix with.
+        out : Matrix, optional
+            A matrix of the same shape receiving the result instead of a new matrix
+            (it may be self).
 
         Returns
         -------
         Matrix
-            A new matrix with each element multiplied by the scalar.
+            A new matrix with each element multiplied by the scalar (or `out`).
         """
 
         linalgvalidator.validate_data_is_scalar(scalar)
 
-        return Matrix([[a * scalar for a in row] for row in self])
+        return self._result(array("d", [a * scalar for a in self._row_major()]), self.dims, out)
     
     
-    def dot(self, other):
+    def dot(self, other, workers=None, out=None):
         """
         Compute the matrix product (dot product) between two matrices.
 
@@ -149,26 +520,35 @@ class Matrix:
         ----------
         other : Matrix
             The matrix to multiply with (on the right).
+        workers : int, optional
+            The number of processes sharing the rows of the result. Defaults to the
+            global setting (`algebra.parallel.set_workers`, 1 unless changed). Small
+            products are always computed serially.
+        out : Matrix, optional
+            An m × p matrix receiving the result instead of a new matrix. It may be
+            self or other (or share their buffer): the product is always completed
+            before being written.
+
+        Large near-square products go through the Strassen-Winograd recursion
+        (see `algebra.strassen`), which falls back to the classic kernel on blocks
+        smaller than the tuned leaf size.
 
         Returns
         -------
         Matrix
-            The resulting matrix product.
+            The resulting matrix product (or `out`).
         """
 
-        linalgvalidator.validate_data_is_valid_matrix(other.data)
+        linalgvalidator.validate_object_is_matrix(other)
         linalgvalidator.validate_matrices_are_compatible_for_matrix_product(self, other)
 
-        
-        row_vectors = [Vector(row) for row in self.data]
-        col_vectors = [Vector(col) for col in other.transpose().data]
-        
-        new_matrix = [
-            [row.dot(col) for col in col_vectors]
-                for row in row_vectors
-        ]
-        
-        return Matrix(new_matrix)
+        m, n = self.dims
+        p = other.dims[1]
+        if strassen.is_applicable(m, n, p):
+            new_matrix = strassen.matmul(self, other, workers=workers)
+        else:
+            new_matrix = parallel.matmul(self, other, workers)
+        return self._result(new_matrix, [m, p], out)
     
     
     def apply_to_vector(self, vector : Vector):
@@ -193,11 +573,350 @@ class Matrix:
         """
 
         linalgvalidator.validate_object_is_vector(vector)
+        self._validate_applicable_to(vector.length)
+
+        m, n = self.dims
+        if parallel.get_workers() > 1 and m * n >= parallel.PARALLEL_THRESHOLD:
+            column_matrix = Matrix._from_buffer(vector._values(), [vector.length, 1])
+            return self.dot(column_matrix).column(0)
 
-        column_matrix = Matrix([[col] for col in vector.data])
-        result_matrix = self.dot(column_matrix)
-        transformed_vector = [row[0] for row in result_matrix.data]
-        return Vector(transformed_vector)
+        # One dot product per row, straight on the buffers (no column matrix, no transpose)
+        x = vector._values().tolist()
+        rows = self._cached("row_lists", self._row_lists) if self.is_frozen else self._rows()
+        values = array("d", [sumprod(row, x) for row in rows])
+        return Vector._from_buffer(values, m)
+
+    def apply_to_vectors(self, vectors, packed=False):
+        """
+        Apply the matrix to many vectors, e.g. the same weights to a stream of inputs.
+
+        Mathematical definition:
+            uₖ = A ⋅ vₖ for every vector vₖ (the columns of A ⋅ [v₁ ... vₖ]).
+
+        The matrix is unpacked once into row lists, reused for every vector (and
+        cached while the matrix is frozen, so consecutive calls share it too). The
+        vectors are consumed one at a time: a generator of any length can be given.
+
+        Parameters
+        ----------
+        vectors : iterable of Vector, or VectorSet
+            The vectors (size n), e.g. a generator reading them from a file.
+        packed : bool
+            If False (default), results are produced lazily, one Vector per input vector.
+            If True, all the results are computed at once into one VectorSet (a single
+            contiguous k × m block).
+
+        Returns
+        -------
+        generator of Vector, or VectorSet
+            The vectors A ⋅ vₖ (size m), in the order of the input.
+
+        Example
+        -------
+        for u in W.apply_to_vectors(read_vectors("inputs.csv")):
+            process(u)
+        W.apply_to_vectors(batch, packed=True)
+        ➞ VectorSet(count=..., dim=...)
+        """
+        rows = self._cached("row_lists", self._row_lists) if self.is_frozen else self._row_lists()
+        results = self._apply_rows(rows, vectors)
+        if not packed:
+            return results
+
+        from algebra.vector_sets import VectorSet
+
+        values, count = array("d"), 0
+        for result in results:
+            values.extend(result)
+            count += 1
+        return VectorSet._from_buffer(values, count, self.dims[0])
+
+    def _apply_rows(self, rows, vectors):
+        from algebra.vector_sets import VectorSet
+
+        m, n = self.dims
+        if isinstance(vectors, VectorSet):
+            self._validate_applicable_to(vectors.dim)
+            buffer = vectors._buffer
+            inputs = (buffer[k * n:(k + 1) * n].tolist() for k in range(vectors.count))
+        else:
+            inputs = self._checked_vector_values(vectors)
+        for x in inputs:
+            yield Vector._from_buffer(array("d", [sumprod(row, x) for row in rows]), m)
+
+    def _checked_vector_values(self, vectors):
+        for vector in vectors:
+            linalgvalidator.validate_object_is_vector(vector)
+            self._validate_applicable_to(vector.length)
+            yield vector._values().tolist()
+
+    def _row_lists(self):
+        return [row.tolist() for row in self._rows()]
+
+    def _validate_applicable_to(self, length):
+        if length != self.dims[1]:
+            raise ValueError(f"Matrix columns ({self.dims[1]}) must be equal to the vector length ({length}).")
+
+    def row_norms(self):
+        """
+        Compute the magnitude (Euclidean norm) of every row.
+
+        Mathematical definition:
+            ||Aᵢ|| = sqrt(Σ A[i][j]²), for i in [0, m)
+
+        Cached while the matrix is frozen (the returned vector is then frozen too).
+
+        Returns
+        -------
+        Vector
+            The m row norms.
+        """
+        if self.is_frozen:
+            return self._cached("row_norms", lambda: self._compute_row_norms().freeze())
+        return self._compute_row_norms()
+
+    def _compute_row_norms(self):
+        norms = array("d", [sumprod(row, row) ** 0.5 for row in self._rows()])
+        return Vector._from_buffer(norms, len(norms))
+
+    def norm(self):
+        """
+        Compute the Frobenius norm of the matrix (cached while the matrix is frozen).
+
+        Mathematical definition:
+            ||A||_F = sqrt(Σᵢ Σⱼ A[i][j]²)
+        """
+        if self.is_frozen:
+            return self._cached("norm", self._compute_norm)
+        return self._compute_norm()
+
+    def _compute_norm(self):
+        values = self._row_major()
+        return sumprod(values, values) ** 0.5
+
+    def gram(self, weights=None, center=False, workers=None):
+        """
+        Compute the Gram matrix Aᵀ ⋅ A without forming Aᵀ.
+
+        Mathematical definition:
+            G[j][k] = Σᵢ wᵢ ⋅ A[i][j] ⋅ A[i][k]  (wᵢ = 1 by default)
+            With center=True, the columns are first centered on their (weighted) mean.
+
+        G is symmetric: only its upper triangle is computed (about half the products
+        of `self.transpose().dot(self)`), block of rows by block of rows, then mirrored.
+        See `algebra.streaming.gram` for matrices given as a stream of row blocks.
+
+        Parameters
+        ----------
+        weights : Vector, optional
+            The non-negative weight of every row (size m).
+        center : bool
+            If True, compute the scatter matrix Σᵢ wᵢ ⋅ (aᵢ - μ) ⋅ (aᵢ - μ)ᵀ.
+        workers : int, optional
+            The number of processes sharing the row blocks.
+
+        Returns
+        -------
+        Matrix
+            The n × n Gram matrix.
+
+        Example
+        -------
+        Matrix([[1, 2], [3, 4]]).gram()
+        ➞ Matrix([[10, 14], [14, 20]])
+        """
+        from algebra import streaming
+
+        return streaming.gram(streaming.iter_row_blocks(self), weights, center, workers)
+
+    def covariance(self, weights=None, ddof=1, workers=None):
+        """
+        Compute the covariance matrix of the columns (one observation per row).
+
+        Mathematical definition:
+            C = Σᵢ wᵢ ⋅ (aᵢ - μ) ⋅ (aᵢ - μ)ᵀ / (Σᵢ wᵢ - ddof)
+            The weights are frequency weights (wᵢ = 1 by default).
+
+        Only the upper triangle is computed, then mirrored (see `gram`).
+
+        Parameters
+        ----------
+        weights : Vector, optional
+            The non-negative weight of every row (size m).
+        ddof : int
+            The delta degrees of freedom (1: unbiased estimate).
+        workers : int, optional
+            The number of processes sharing the row blocks.
+
+        Returns
+        -------
+        Matrix
+            The n × n covariance matrix.
+
+        Example
+        -------
+        Matrix([[1, 2], [3, 6]]).covariance()
+        ➞ Matrix([[2, 4], [4, 8]])
+        """
+        from algebra import streaming
+
+        return streaming.covariance(streaming.iter_row_blocks(self), weights, ddof, workers)
+
+
+    # ROW OPERATIONS
+    def swap_rows(self, i, j):
+        """
+        Swap the rows i and j in place (elementary row operation Rᵢ ↔ Rⱼ).
+        """
+        if i != j:
+            row_i, row_j = self._row_values(i), self._row_values(j)
+            self._set_row_values(i, row_j)
+            self._set_row_values(j, row_i)
+
+    def scale_row(self, i, factor):
+        """
+        Multiply the row i by a nonzero scalar in place (elementary row operation Rᵢ ← α ⋅ Rᵢ).
+        """
+        linalgvalidator.validate_data_is_scalar(factor)
+
+        self._set_row_values(i, array("d", [factor * a for a in self._row_values(i)]))
+
+    def add_scaled_row(self, target, source, factor):
+        """
+        Add a multiple of the row `source` to the row `target` in place
+        (elementary row operation Rₜ ← Rₜ + α ⋅ Rₛ).
+        """
+        linalgvalidator.validate_data_is_scalar(factor)
+
+        self._set_row_values(target, array("d", [
+            a + factor * b for a, b in zip(self._row_values(target), self._row_values(source))
+        ]))
+
+
+    # LINEAR SYSTEMS
+    def lu(self, inplace=False):
+        """
+        Compute the LU factorization with partial pivoting, P ⋅ A = L ⋅ U.
+
+        Parameters
+        ----------
+        inplace : bool
+            If True, the elements of the matrix are overwritten by the factors
+            (no copy of A is made).
+
+        Returns
+        -------
+        LUFactorization
+            The factors, able to solve systems and to compute the determinant and the inverse.
+        """
+        return LUFactorization(self, inplace=inplace)
+
+    def _cached_lu(self):
+        """
+        Return the LU factors of the matrix, computed once and reused until it is modified.
+        """
+        return self._cached("lu", lambda: LUFactorization(self))
+
+    def solve(self, b : Vector):
+        """
+        Solve the linear system A ⋅ x = b.
+
+        The LU factors of A are computed on the first call and cached on the matrix:
+        every following right-hand side only costs an O(n²) forward/back substitution,
+        until the matrix is modified.
+
+        Parameters
+        ----------
+        b : Vector
+            The right-hand side (size n).
+
+        Returns
+        -------
+        Vector
+            The solution x.
+        """
+        return self._cached_lu().solve(b)
+
+    def solve_many(self, vectors):
+        """
+        Solve A ⋅ x = b for every Vector b of an iterable, with the cached LU factors.
+
+        Returns
+        -------
+        list of Vector
+            The solutions, in the order of the right-hand sides.
+        """
+        return self._cached_lu().solve_many(vectors)
+
+    def determinant(self):
+        """
+        Compute the determinant from the cached LU factors.
+        """
+        return self._cached_lu().determinant()
+
+    def inverse(self):
+        """
+        Compute the inverse from the cached LU factors.
+        """
+        return self._cached_lu().inverse()
+
+    # LAZY EVALUATION
+    def lazy(self):
+        """
+        Start a lazy expression on this matrix.
+
+        Operations on the returned expression are only recorded, and `evaluate()`
+        computes them in one fused pass without intermediate objects
+        (see `algebra.lazy.LazyExpression`).
+
+        Example
+        -------
+        A.lazy().add(B).substract(C).scalar_multiply(0.5).evaluate()
+        """
+        from algebra.lazy import LazyExpression
+
+        return LazyExpression.wrap(self)
+
+
+    # PERSISTENCE
+    def save(self, path):
+        """
+        Write the matrix to a binary file (relative paths are taken from DATA_DIR).
+
+        See `algebra.serialization` for the file format.
+
+        Returns
+        -------
+        str
+            The absolute path of the written file.
+        """
+        from algebra import serialization
+
+        return serialization.save(self, path)
+
+    @staticmethod
+    def load(path, mmap=False):
+        """
+        Read a matrix written by `Matrix.save`.
+
+        Parameters
+        ----------
+        path : str or PathLike
+            The file path, relative to DATA_DIR unless absolute.
+        mmap : bool
+            If True, the file is memory-mapped: the matrix opens instantly and its rows
+            are only read from disk when accessed. The matrix is then frozen
+            (use `.copy()` to modify it).
+
+        Example
+        -------
+        Matrix.load("features.bin", mmap=True)[1000]  # only reads row 1000
+        """
+        from algebra import serialization
+
+        matrix = serialization.load(path, mmap=mmap)
+        linalgvalidator.validate_object_is_matrix(matrix)
+        return matrix
 
 
     # OVERLOAD
@@ -208,18 +927,92 @@ class Matrix:
     def __eq__(self, other):
         if not isinstance(other, Matrix):
             return False
-        return self.data == other.data
+        return self.dims == other.dims and _same_values(self._row_major(), other._row_major())
+
+    def __hash__(self):
+        if not self.is_frozen:
+            raise TypeError("unhashable type: 'Matrix' (only frozen matrices are hashable, see freeze()).")
+        return self._cached("hash", lambda: hash((tuple(self.dims), tuple(self._row_major()))))
     
     def __iter__(self):
-        return iter(self.data)
+        return (self.row(i) for i in range(self.dims[0]))
+
+    def __len__(self):
+        return self.dims[0]
     
     def __getitem__(self, index):
-        return self.data[index]
+        if isinstance(index, tuple):
+            row, col = index
+            if isinstance(row, slice) and isinstance(col, slice):
+                return self._slice_view(row, col)
+            if isinstance(row, slice):
+                return self.column(col)[row]
+            if isinstance(col, slice):
+                return self.row(row)[col]
+            return self._buffer[self._index(row, col)]
+        if isinstance(index, slice):
+            return self._slice_view(index, slice(None))
+        return self.row(index)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, tuple) and not any(isinstance(i, slice) for i in index):
+            linalgvalidator.validate_data_is_scalar(value)
+            self._check_writable()
+            self._buffer[self._index(*index)] = value
+            self._bump_version()
+            return
+        target = self[index]
+        if isinstance(target, Vector):
+            target[:] = value
+            return
+        rows = value.data if isinstance(value, Matrix) else value
+        if len(rows) != target.dims[0]:
+            raise ValueError(f"Cannot assign {len(rows)} rows to a slice of {target.dims[0]} rows.")
+        for i, row in enumerate(rows):
+            target.row(i)[:] = row
     
+    def __add__(self, other):
+        if _is_structured(other):
+            return NotImplemented
+        return self.add(other)
+
+    def __sub__(self, other):
+        if _is_structured(other):
+            return NotImplemented
+        return self.substract(other)
+
+    def __mul__(self, other):
+        return self.scalar_multiply(other)
+
+    def __rmul__(self, other):
+        return self.scalar_multiply(other)
+
+    def __iadd__(self, other):
+        return self.add(other, out=self)
+
+    def __isub__(self, other):
+        return self.substract(other, out=self)
+
+    def __imul__(self, other):
+        return self.scalar_multiply(other, out=self)
+
     def __matmul__(self, other):
         if isinstance(other, Matrix):
             return self.dot(other)
         elif isinstance(other, Vector):
             return self.apply_to_vector(other)
-        else:
-            raise TypeError(f"Unsupported operand type(s) for @: 'Matrix' and '{type(other).__name__}'")
\ No newline at end of file
+        return NotImplemented
+
+
+def _is_structured(x):
+    # Structured matrices (sparse, banded...) are not Matrix instances but convert to one:
+    # `Matrix + S` is left to `S.__radd__`, which only touches the stored elements
+    return not isinstance(x, Matrix) and hasattr(x, "to_matrix")
+
+
+def _validate_shape(shape):
+    if not isinstance(shape, (tuple, list)) or len(shape) != 2:
+        raise ValueError(f"Expected a shape (rows, cols), got {shape!r}.")
+    for size in shape:
+        _validate_size(size)
+    return shape[0], shape[1]
@@ -0,0 +1,325 @@
+import heapq
+import pickle
+from array import array
+from operator import sub
+
+from algebra.kernels import sumprod
+from algebra.matrices import Matrix
+from algebra.validator import LinearAlgebraValidator as linalgvalidator
+from algebra.vector_sets import VectorSet
+
+# Maximum number of points stored in a leaf (searched by brute force).
+LEAF_SIZE = 16
+
+# Dimension above which `build_index` uses a ball tree instead of a KD-tree
+# (bounding boxes stop pruning anything in high dimension).
+KD_TREE_MAX_DIM = 16
+
+# Relative tolerance added to the pruning bounds, so that a rounding error in a
+# bound never discards a point that brute force would return.
+_BOUND_SLACK = 1e-9
+
+
+def build_index(data, leaf_size=LEAF_SIZE):
+    """
+    Build an exact nearest-neighbour index: a KDTree in low dimension, a BallTree above KD_TREE_MAX_DIM.
+
+    Parameters
+    ----------
+    data : list of Vector, Matrix or VectorSet
+        The points to index (the rows of a Matrix).
+    leaf_size : int
+        The maximum number of points in a leaf.
+
+    Returns
+    -------
+    KDTree or BallTree
+        The index.
+    """
+    points = _as_vector_set(data)
+    if points.dim <= KD_TREE_MAX_DIM:
+        return KDTree(points, leaf_size)
+    return BallTree(points, leaf_size)
+
+
+class _SpatialTree:
+
+    def __init__(self, data, leaf_size=LEAF_SIZE):
+        """
+        Index points in a binary tree of nested regions.
+
+        Every node covers a contiguous range of `order` (the point indices sorted
+        by node) and keeps a region containing its points; a query only opens the
+        nodes whose region is closer than the current k-th neighbour. Subclasses
+        define the region (`_build_region`) and its distance to the query
+        (`_lower_bound`).
+
+        Distances are computed exactly like `Vector.distance`, and ties are broken
+        by index, so results are identical to a brute force scan.
+        """
+
+        if not isinstance(leaf_size, int) or isinstance(leaf_size, bool) or leaf_size < 1:
+            raise ValueError("The leaf size must be a positive integer.")
+
+        # The points are copied, so that modifying the source does not corrupt the index
+        points = _as_vector_set(data)
+        points = VectorSet._from_buffer(array("d", points._buffer), len(points), points.dim)
+        self.points = points
+        self.dim = points.dim
+        self.leaf_size = leaf_size
+        self.order = array("q", range(len(points)))
+        self._rows = [points._buffer[i * self.dim:(i + 1) * self.dim] for i in range(len(points))]
+
+        # Nodes, stored in flat arrays (node 0 is the root, -1 means no child)
+        self._start = array("q")
+        self._end = array("q")
+        self._left = array("q")
+        self._right = array("q")
+        self._init_regions()
+        self._build(0, len(points))
+        del self._rows
+
+    def _build(self, start, end):
+        node = len(self._start)
+        self._start.append(start)
+        self._end.append(end)
+        self._left.append(-1)
+        self._right.append(-1)
+        self._build_region(start, end)
+
+        if end - start > self.leaf_size:
+            axis = self._widest_axis(start, end)
+            rows = self._rows
+            self.order[start:end] = array("q", sorted(self.order[start:end], key=lambda i: rows[i][axis]))
+            middle = (start + end) // 2
+            self._left[node] = self._build(start, middle)
+            self._right[node] = self._build(middle, end)
+        return node
+
+    def _widest_axis(self, start, end):
+        rows = [self._rows[i] for i in self.order[start:end]]
+        spreads = [max(column) - min(column) for column in zip(*rows)]
+        return spreads.index(max(spreads))
+
+    def _init_regions(self):
+        raise NotImplementedError
+
+    def _build_region(self, start, end):
+        raise NotImplementedError
+
+    def _lower_bound(self, node, query):
+        raise NotImplementedError
+
+    def _distance(self, query, index):
+        start = index * self.dim
+        difference = list(map(sub, query, self.points._buffer[start:start + self.dim]))
+        return sumprod(difference, difference) ** 0.5
+
+
+    # QUERIES
+    def query(self, v, k=1):
+        """
+        Find the k nearest neighbours of a vector.
+
+        Parameters
+        ----------
+        v : Vector
+            The query vector.
+        k : int
+            The number of neighbours.
+
+        Returns
+        -------
+        tuple of (list, list)
+            The distances (ascending, as returned by `Vector.distance`) and the indices
+            of the k nearest points (ties are broken by the smaller index).
+        """
+        query = self._query_values(v)
+        if not isinstance(k, int) or isinstance(k, bool) or k < 1:
+            raise ValueError("k must be a positive integer.")
+        k = min(k, len(self.points))
+
+        # Max-heap of the k best (distance, index) pairs, stored negated
+        best = []
+
+        def search(node):
+            if len(best) == k and self._lower_bound(node, query) > _loosened(-best[0][0]):
+                return
+            left, right = self._left[node], self._right[node]
+            if left == -1:
+                for index in self.order[self._start[node]:self._end[node]]:
+                    candidate = (-self._distance(query, index), -index)
+                    if len(best) < k:
+                        heapq.heappush(best, candidate)
+                    elif candidate > best[0]:
+                        heapq.heapreplace(best, candidate)
+                return
+            children = sorted((left, right), key=lambda child: self._lower_bound(child, query))
+            for child in children:
+                search(child)
+
+        search(0)
+        neighbours = sorted((-distance, -index) for distance, index in best)
+        return [distance for distance, _ in neighbours], [index for _, index in neighbours]
+
+    def query_radius(self, v, r):
+        """
+        Find all the points within a distance r of a vector.
+
+        Parameters
+        ----------
+        v : Vector
+            The query vector.
+        r : int or float
+            The radius (points at exactly r are included).
+
+        Returns
+        -------
+        tuple of (list, list)
+            The distances (ascending) and the indices of the points.
+        """
+        query = self._query_values(v)
+        linalgvalidator.validate_data_is_scalar(r)
+
+        neighbours = []
+        nodes = [0]
+        while nodes:
+            node = nodes.pop()
+            if self._lower_bound(node, query) > _loosened(r):
+                continue
+            if self._left[node] == -1:
+                for index in self.order[self._start[node]:self._end[node]]:
+                    distance = self._distance(query, index)
+                    if distance <= r:
+                        neighbours.append((distance, index))
+            else:
+                nodes.extend((self._left[node], self._right[node]))
+
+        neighbours.sort()
+        return [distance for distance, _ in neighbours], [index for _, index in neighbours]
+
+    def query_many(self, vectors, k=1):
+        """
+        Run `query` for a batch of vectors (a list of Vector, the rows of a Matrix or a VectorSet).
+
+        Returns
+        -------
+        list of tuple of (list, list)
+            One (distances, indices) pair per query vector.
+        """
+        return [self.query(v, k) for v in _as_vector_set(vectors)]
+
+    def query_radius_many(self, vectors, r):
+        """
+        Run `query_radius` for a batch of vectors.
+
+        Returns
+        -------
+        list of tuple of (list, list)
+            One (distances, indices) pair per query vector.
+        """
+        return [self.query_radius(v, r) for v in _as_vector_set(vectors)]
+
+    def _query_values(self, v):
+        linalgvalidator.validate_object_is_vector(v)
+        if v.length != self.dim:
+            raise ValueError(f"Query vector ({v.length}) and indexed points ({self.dim}) are not the same dimension.")
+        return v._values().tolist()
+
+
+    # SERIALIZATION
+    def save(self, path):
+        """
+        Write the index (points and tree) to a file, so it can be loaded without being rebuilt.
+        """
+        with open(path, "wb") as file:
+            pickle.dump(self, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def load(path):
+        """
+        Read an index written by `save`.
+        """
+        with open(path, "rb") as file:
+            index = pickle.load(file)
+        if not isinstance(index, _SpatialTree):
+            raise TypeError("The file does not contain a nearest-neighbour index.")
+        return index
+
+
+    # OVERLOAD
+    def __len__(self):
+        return len(self.points)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(count={len(self.points)}, dim={self.dim}, nodes={len(self._start)})"
+
+
+class KDTree(_SpatialTree):
+    """
+    Exact nearest-neighbour index splitting space along one coordinate per level.
+
+    Each node keeps the bounding box of its points; the distance from a query to
+    the box is a lower bound of the distance to any of its points. Well suited to
+    low dimensions (up to about 16).
+
+    Example
+    -------
+    tree = KDTree([Vector([0, 0]), Vector([1, 1]), Vector([5, 5])])
+    tree.query(Vector([0.9, 1]), k=2)
+    ➞ ([0.1, 1.345...], [1, 0])
+    """
+
+    def _init_regions(self):
+        self._lows = array("d")
+        self._highs = array("d")
+
+    def _build_region(self, start, end):
+        rows = [self._rows[i] for i in self.order[start:end]]
+        for column in zip(*rows):
+            self._lows.append(min(column))
+            self._highs.append(max(column))
+
+    def _lower_bound(self, node, query):
+        first = node * self.dim
+        lows, highs = self._lows[first:first + self.dim], self._highs[first:first + self.dim]
+        gaps = [low - x if x < low else (x - high if x > high else 0.0) for x, low, high in zip(query, lows, highs)]
+        return sumprod(gaps, gaps) ** 0.5
+
+
+class BallTree(_SpatialTree):
+    """
+    Exact nearest-neighbour index of nested balls.
+
+    Each node keeps the centroid of its points and the radius of the smallest ball
+    around it containing them; by the triangle inequality, ||q - c|| - radius is a
+    lower bound of the distance from q to any of its points. Unlike bounding boxes,
+    the bound does not degrade with the dimension.
+    """
+
+    def _init_regions(self):
+        self._centers = array("d")
+        self._radii = array("d")
+
+    def _build_region(self, start, end):
+        rows = [self._rows[i] for i in self.order[start:end]]
+        center = [sum(column) / len(rows) for column in zip(*rows)]
+        self._centers.extend(center)
+        self._radii.append(max(self._distance(center, i) for i in self.order[start:end]))
+
+    def _lower_bound(self, node, query):
+        first = node * self.dim
+        difference = list(map(sub, query, self._centers[first:first + self.dim]))
+        return max(sumprod(difference, difference) ** 0.5 - self._radii[node], 0.0)
+
+
+def _loosened(bound):
+    return bound + _BOUND_SLACK * (1.0 + bound)
+
+
+def _as_vector_set(data):
+    if isinstance(data, VectorSet):
+        return data
+    if isinstance(data, Matrix):
+        return VectorSet.from_matrix(data)
+    return VectorSet(data)
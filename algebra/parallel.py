@@ -0,0 +1,166 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from algebra import kernels
+
+# Products with fewer multiply-adds (m × n × p) than this are always computed serially:
+# below it, starting processes and dispatching tasks costs more than the work itself.
+PARALLEL_THRESHOLD = 128 ** 3
+
+# Number of row blocks handed to each worker (more blocks balance the load better).
+BLOCKS_PER_WORKER = 2
+
+_settings = {"workers": 1}
+_pool = {"workers": None, "executor": None}
+
+
+# --------------------
+# SETTINGS
+# --------------------
+
+def set_workers(workers):
+    """
+    Set the number of worker processes used by default by `Matrix.dot` and `@`.
+
+    Parameters
+    ----------
+    workers : int or None
+        The number of processes. 1 disables parallelism (the default),
+        None uses every available core.
+    """
+    _settings["workers"] = check_workers(workers)
+
+
+def get_workers():
+    """
+    Return the number of worker processes used by default.
+    """
+    return _settings["workers"]
+
+
+def check_workers(workers):
+    """
+    Validate a number of worker processes (None means every available core) and return it.
+    """
+    if workers is None:
+        return os.cpu_count() or 1
+    if not isinstance(workers, int) or isinstance(workers, bool) or workers < 1:
+        raise ValueError("The number of workers must be a positive integer.")
+    return workers
+
+
+def get_executor(workers):
+    """
+    Return the shared process pool, (re)started with `workers` processes if needed.
+
+    Used by the other modules running block tasks in parallel (see `algebra.streaming`).
+    """
+    if _pool["workers"] != workers:
+        if _pool["executor"] is not None:
+            _pool["executor"].shutdown()
+        _pool["executor"] = ProcessPoolExecutor(max_workers=workers)
+        _pool["workers"] = workers
+    return _pool["executor"]
+
+
+def shutdown():
+    """
+    Stop the worker processes (they are started again on the next parallel product).
+    """
+    if _pool["executor"] is not None:
+        _pool["executor"].shutdown()
+    _pool["workers"] = _pool["executor"] = None
+
+
+# --------------------
+# MATRIX PRODUCT
+# --------------------
+
+def matmul(A, B, workers=None, threshold=PARALLEL_THRESHOLD):
+    """
+    Compute the raw product A ⋅ B, splitting the output rows across worker processes.
+
+    A, B and the output live in `multiprocessing.shared_memory` blocks: every task only
+    receives the block names and a range of rows, so the operands are never pickled.
+    Small products (fewer than `threshold` multiply-adds) or a single worker fall back
+    to the serial kernel.
+
+    Parameters
+    ----------
+    A : Matrix
+        The left operand (m × n).
+    B : Matrix
+        The right operand (n × p).
+    workers : int or None
+        The number of processes. Defaults to the value set with `set_workers`.
+    threshold : int
+        The minimum number of multiply-adds for which processes are used.
+
+    Returns
+    -------
+    array
+        The m × p product as a row-major `array('d')`.
+    """
+
+    workers = get_workers() if workers is None else check_workers(workers)
+    m, n = A.dims
+    p = B.dims[1]
+    if workers == 1 or m < 2 or m * n * p < threshold:
+        return kernels.matmul(A, B)
+
+    a_block = _share(A._row_major())
+    b_block = _share(B._row_major())
+    out_block = SharedMemory(create=True, size=8 * m * p)
+    try:
+        chunk = -(-m // (workers * BLOCKS_PER_WORKER))
+        tasks = [
+            get_executor(workers).submit(
+                _matmul_row_block, a_block.name, b_block.name, out_block.name,
+                m, n, p, start, min(start + chunk, m),
+            )
+            for start in range(0, m, chunk)
+        ]
+        for task in tasks:
+            task.result()
+
+        product = array("d")
+        product.frombytes(out_block.buf[:8 * m * p])
+        return product
+    finally:
+        for block in (a_block, b_block, out_block):
+            block.close()
+            block.unlink()
+
+
+def _share(values):
+    """
+    Copy a buffer of doubles into a new shared memory block.
+    """
+    nbytes = 8 * len(values)
+    block = SharedMemory(create=True, size=max(nbytes, 1))
+    block.buf[:nbytes] = memoryview(values).cast("B")
+    return block
+
+
+def _matmul_row_block(a_name, b_name, out_name, m, n, p, start, stop):
+    """
+    Worker task: compute the rows [start, stop) of the product into the output block.
+    """
+    blocks = [SharedMemory(name=name) for name in (a_name, b_name, out_name)]
+    try:
+        _compute_row_block(blocks, m, n, p, start, stop)
+    finally:
+        for block in blocks:
+            block.close()
+
+
+def _compute_row_block(blocks, m, n, p, start, stop):
+    from algebra.matrices import Matrix
+
+    a_block, b_block, out_block = blocks
+    A = Matrix._from_buffer(a_block.buf[:8 * m * n].cast("d"), [m, n])
+    B = Matrix._from_buffer(b_block.buf[:8 * n * p].cast("d"), [n, p])
+    out = out_block.buf[:8 * m * p].cast("d")
+    out[start * p:stop * p] = kernels.matmul(A[start:stop], B)
@@ -0,0 +1,277 @@
+from array import array
+from itertools import islice
+from operator import add
+
+from algebra.kernels import sumprod
+from algebra.matrices import Matrix
+from algebra.validator import LinearAlgebraValidator as linalgvalidator
+from algebra.vector_sets import VectorSet
+from algebra.vectors import Vector
+
+
+class Pipeline:
+
+    def __init__(self, steps=()):
+        """
+        A chain of transformations applied lazily to a stream of vectors.
+
+        A pipeline is built step by step (every method returns a new Pipeline, so a
+        pipeline can be extended and shared freely), then `run` pulls the vectors one
+        at a time (or one micro-batch at a time) through the steps: only the current
+        item or batch is held in memory, whatever the length of the stream.
+
+        Before running, consecutive affine steps (scale, add_bias, apply) are fused
+        into a single x ↦ A ⋅ x + b computed ahead of time, so every item goes through
+        one matrix-vector product instead of one pass per step. Two matrices are only
+        multiplied together when the fused matrix is cheaper to apply than the pair
+        (a 1000 → 10 → 1000 bottleneck is kept as two products).
+
+        Example
+        -------
+        pipeline = Pipeline().scale(0.5).add_bias(b).apply(W).normalize()
+        for u in pipeline.run(read_vectors("inputs.csv"), batch_size=64):
+            process(u)
+        """
+        self._steps = tuple(steps)
+        self.input_dim, self.output_dim = _dims(self._steps)
+
+
+    # STEPS
+    def scale(self, scalar):
+        """
+        Multiply every vector by a scalar (see `Vector.scalar_multiply`).
+        """
+        linalgvalidator.validate_data_is_scalar(scalar)
+        return self._then(("scale", scalar))
+
+    def add_bias(self, bias : Vector):
+        """
+        Add a bias vector to every vector (see `Vector.add`).
+        """
+        linalgvalidator.validate_object_is_vector(bias)
+        return self._then(("bias", bias))
+
+    def apply(self, matrix : Matrix):
+        """
+        Apply a matrix to every vector (see `Matrix.apply_to_vector`).
+        """
+        linalgvalidator.validate_object_is_matrix(matrix)
+        return self._then(("apply", matrix))
+
+    def normalize(self):
+        """
+        Divide every vector by its magnitude (a zero vector raises a ZeroDivisionError).
+        """
+        return self._then(("normalize", None))
+
+    def then(self, other):
+        """
+        Chain another pipeline after this one.
+        """
+        if not isinstance(other, Pipeline):
+            raise TypeError("Expected a Pipeline object as input.")
+        return Pipeline(self._steps + other._steps)
+
+    def _then(self, step):
+        return Pipeline(self._steps + (step,))
+
+
+    # EXECUTION
+    def run(self, vectors, batch_size=None, packed=False):
+        """
+        Transform a stream of vectors lazily.
+
+        The steps are compiled (affine steps fused) when the run starts: later changes
+        to the matrices and biases of the pipeline do not affect a running stream.
+
+        Parameters
+        ----------
+        vectors : iterable of Vector, or VectorSet
+            The input vectors, e.g. a generator.
+        batch_size : int, optional
+            If given, items are pulled and transformed `batch_size` at a time, which
+            amortizes the per-item overhead of every step over the batch.
+        packed : bool
+            With `batch_size`, yield one VectorSet per micro-batch instead of one Vector per item.
+
+        Returns
+        -------
+        generator of Vector (or of VectorSet)
+            The transformed vectors, in the order of the input.
+        """
+        if batch_size is not None and (not isinstance(batch_size, int) or isinstance(batch_size, bool) or batch_size < 1):
+            raise ValueError("The batch size must be a positive integer.")
+        if packed and batch_size is None:
+            raise ValueError("packed=True needs a batch_size.")
+
+        return self._run(self.compile(), self._checked_values(vectors), batch_size, packed)
+
+    def _run(self, stages, inputs, batch_size, packed):
+        if batch_size is None:
+            for x in inputs:
+                batch = [x]
+                for stage in stages:
+                    batch = stage(batch)
+                yield Vector._from_buffer(array("d", batch[0]), len(batch[0]))
+            return
+
+        while True:
+            batch = list(islice(inputs, batch_size))
+            if not batch:
+                return
+            for stage in stages:
+                batch = stage(batch)
+            if packed:
+                values = array("d")
+                for x in batch:
+                    values.extend(x)
+                yield VectorSet._from_buffer(values, len(batch), len(batch[0]))
+            else:
+                for x in batch:
+                    yield Vector._from_buffer(array("d", x), len(x))
+
+    def __call__(self, vectors, batch_size=None, packed=False):
+        return self.run(vectors, batch_size, packed)
+
+    def compile(self):
+        """
+        Return the stages run on every batch, after fusion of the consecutive affine steps.
+
+        Every stage is a function transforming a batch (a list of lists of floats).
+        """
+        stages, affine = [], None
+        for op, operand in self._steps:
+            if op == "normalize":
+                if affine is not None:
+                    stages.append(affine.stage())
+                    affine = None
+                stages.append(_normalize)
+                continue
+            if affine is None:
+                affine = _Affine()
+            if op == "scale":
+                affine.scale(operand)
+            elif op == "bias":
+                affine.add_bias(operand)
+            elif not affine.apply(operand):
+                # Fusing would make the product more expensive: keep two stages
+                stages.append(affine.stage())
+                affine = _Affine()
+                affine.apply(operand)
+        if affine is not None:
+            stages.append(affine.stage())
+        return stages
+
+    def _checked_values(self, vectors):
+        if isinstance(vectors, VectorSet):
+            if self.input_dim is not None and vectors.dim != self.input_dim:
+                raise ValueError(f"The pipeline expects vectors of size {self.input_dim}, got {vectors.dim}.")
+            buffer, dim = vectors._buffer, vectors.dim
+            for k in range(vectors.count):
+                yield buffer[k * dim:(k + 1) * dim].tolist()
+            return
+        for vector in vectors:
+            linalgvalidator.validate_object_is_vector(vector)
+            if self.input_dim is not None and vector.length != self.input_dim:
+                raise ValueError(f"The pipeline expects vectors of size {self.input_dim}, got {vector.length}.")
+            yield vector._values().tolist()
+
+
+    # OVERLOAD
+    def __repr__(self):
+        steps = " → ".join(op for op, _ in self._steps) or "identity"
+        return f"Pipeline({steps}, input_dim={self.input_dim}, output_dim={self.output_dim})"
+
+    def __len__(self):
+        return len(self._steps)
+
+
+class _Affine:
+
+    def __init__(self):
+        """
+        An affine map x ↦ A ⋅ x + b being fused, with A = s ⋅ I until a matrix is applied.
+        """
+        self.matrix = None
+        self.scalar = 1.0
+        self.bias = None
+
+    def scale(self, scalar):
+        if self.matrix is None:
+            self.scalar *= scalar
+        else:
+            self.matrix = self.matrix.scalar_multiply(scalar)
+        if self.bias is not None:
+            self.bias = self.bias.scalar_multiply(scalar)
+
+    def add_bias(self, bias):
+        self.bias = bias.copy() if self.bias is None else self.bias.add(bias)
+
+    def apply(self, matrix):
+        """
+        Compose M ⋅ (A ⋅ x + b) = (M ⋅ A) ⋅ x + M ⋅ b, unless M ⋅ A costs more per item than M and A.
+        """
+        if self.matrix is None:
+            self.matrix = matrix.scalar_multiply(self.scalar) if self.scalar != 1 else matrix.copy()
+        else:
+            (p, m), n = matrix.dims, self.matrix.dims[1]
+            if p * n > p * m + m * n:
+                return False
+            self.matrix = matrix.dot(self.matrix)
+        if self.bias is not None:
+            self.bias = matrix.apply_to_vector(self.bias)
+        return True
+
+    def stage(self):
+        bias = self.bias._values().tolist() if self.bias is not None else None
+        if self.matrix is None:
+            return _scale_stage(self.scalar, bias)
+        return _matrix_stage(self.matrix._row_lists(), bias)
+
+
+def _scale_stage(scalar, bias):
+    def stage(batch):
+        if scalar != 1:
+            batch = [[value * scalar for value in x] for x in batch]
+        if bias is not None:
+            batch = [list(map(add, x, bias)) for x in batch]
+        return batch
+    return stage
+
+
+def _matrix_stage(rows, bias):
+    def stage(batch):
+        if bias is None:
+            return [[sumprod(row, x) for row in rows] for x in batch]
+        return [[sumprod(row, x) + b for row, b in zip(rows, bias)] for x in batch]
+    return stage
+
+
+def _normalize(batch):
+    normalized = []
+    for x in batch:
+        magnitude = sumprod(x, x) ** 0.5
+        if magnitude == 0:
+            raise ZeroDivisionError("Cannot normalize a zero vector.")
+        normalized.append([value / magnitude for value in x])
+    return normalized
+
+
+def _dims(steps):
+    """
+    Return the input and output sizes of the steps (None while not fixed by a bias or a matrix).
+    """
+    input_dim = current = None
+    for op, operand in steps:
+        if op == "bias":
+            size = operand.length
+        elif op == "apply":
+            size = operand.dims[1]
+        else:
+            continue
+        if current is not None and current != size:
+            raise ValueError(f"Step {op!r} expects vectors of size {size}, the previous steps produce size {current}.")
+        if input_dim is None:
+            input_dim = size
+        current = operand.dims[0] if op == "apply" else size
+    return input_dim, current
@@ -0,0 +1,140 @@
+import mmap as _mmap
+import os
+import struct
+import sys
+from array import array
+
+from algebra.matrices import Matrix
+from algebra.vectors import Vector
+from config.paths import DATA_DIR
+
+# File layout (all integers little-endian):
+#   magic (4 bytes) | format version (u8) | dtype (1 char) | byte order (1 char) | ndim (u8)
+#   | shape (ndim × u64) | elements (raw doubles, row-major)
+# The header is a multiple of 8 bytes, so the elements are aligned for a zero-copy mmap.
+MAGIC = b"ALGB"
+FORMAT_VERSION = 1
+DTYPE = b"d"
+BYTE_ORDER = b"<"
+
+_PREAMBLE = struct.Struct("<4sBccB")
+_DIMENSION = struct.Struct("<Q")
+
+# Number of elements written at once when saving a non-contiguous view.
+_WRITE_CHUNK = 1 << 16
+
+
+def resolve_path(path):
+    """
+    Return the absolute path of a data file: relative paths are taken from DATA_DIR.
+    """
+    return os.path.join(DATA_DIR, os.fspath(path))
+
+
+def save(x, path):
+    """
+    Write a Matrix or a Vector to a binary file.
+
+    Parameters
+    ----------
+    x : Matrix or Vector
+        The object to save (views are saved as their own elements only).
+    path : str or PathLike
+        The file path, relative to DATA_DIR unless absolute. Missing directories are created.
+
+    Returns
+    -------
+    str
+        The absolute path of the written file.
+    """
+    if isinstance(x, Matrix):
+        shape, values = x.dims, x._row_major()
+    elif isinstance(x, Vector):
+        shape, values = [x.length], x._values()
+    else:
+        raise TypeError("Expected a Matrix or a Vector object as input.")
+    if isinstance(values, memoryview) and not values.c_contiguous:
+        # A strided view of a memoryview buffer (from_flat, mmap) cannot be written as is
+        values = array("d", values.tobytes())
+
+    path = resolve_path(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, DTYPE, BYTE_ORDER, len(shape)))
+        for dimension in shape:
+            file.write(_DIMENSION.pack(dimension))
+        for start in range(0, len(values), _WRITE_CHUNK):
+            file.write(_little_endian(values[start:start + _WRITE_CHUNK]))
+    return path
+
+
+def load(path, mmap=False):
+    """
+    Read a Matrix or a Vector written by `save`.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        The file path, relative to DATA_DIR unless absolute.
+    mmap : bool
+        If True, the file is memory-mapped instead of read: opening is instant whatever
+        its size, elements are only read from disk when accessed, and processes mapping
+        the same file share the page cache. The result is frozen (writing to it raises
+        a ValueError, see `Matrix.freeze`; use `.copy()` for a writable object).
+
+    Returns
+    -------
+    Matrix or Vector
+        The loaded object.
+    """
+    path = resolve_path(path)
+    with open(path, "rb") as file:
+        shape, header_size = _read_header(file)
+        count = 1
+        for dimension in shape:
+            count *= dimension
+
+        if mmap and count and sys.byteorder == "little":
+            mapping = _mmap.mmap(file.fileno(), 0, access=_mmap.ACCESS_READ)
+            if len(mapping) < header_size + 8 * count:
+                raise ValueError(f"Truncated file: expected {count} elements.")
+            buffer = memoryview(mapping)[header_size:header_size + 8 * count].cast("d")
+        else:
+            buffer = array("d")
+            buffer.frombytes(file.read(8 * count))
+            if len(buffer) != count:
+                raise ValueError(f"Truncated file: expected {count} elements, found {len(buffer)}.")
+            if sys.byteorder != "little":
+                buffer.byteswap()
+
+    if len(shape) == 1:
+        loaded = Vector._from_buffer(buffer, shape[0])
+    else:
+        loaded = Matrix._from_buffer(buffer, shape)
+    return loaded.freeze() if mmap else loaded
+
+
+def _read_header(file):
+    preamble = file.read(_PREAMBLE.size)
+    if len(preamble) != _PREAMBLE.size:
+        raise ValueError("Not a matrix file (header too short).")
+    magic, version, dtype, byte_order, ndim = _PREAMBLE.unpack(preamble)
+    if magic != MAGIC:
+        raise ValueError("Not a matrix file (bad magic number).")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported format version {version}.")
+    if dtype != DTYPE or byte_order != BYTE_ORDER:
+        raise ValueError(f"Unsupported element type {dtype + byte_order!r}, expected {DTYPE + BYTE_ORDER!r}.")
+    if ndim not in (1, 2):
+        raise ValueError(f"Unsupported number of dimensions {ndim}.")
+
+    shape = [_DIMENSION.unpack(file.read(_DIMENSION.size))[0] for _ in range(ndim)]
+    return shape, _PREAMBLE.size + ndim * _DIMENSION.size
+
+
+def _little_endian(values):
+    if sys.byteorder == "little":
+        return values
+    values = array("d", values)
+    values.byteswap()
+    return values
@@ -0,0 +1,451 @@
+from array import array
+
+from algebra.kernels import sumprod
+from algebra.matrices import Matrix
+from algebra.validator import LinearAlgebraValidator as linalgvalidator
+from algebra.vectors import Vector
+
+CSR = "csr"
+CSC = "csc"
+
+
+class SparseMatrix:
+
+    def __init__(self, data : list, layout=CSR):
+        """
+        Create a SparseMatrix from a list of lists (rows of scalar values), keeping only the nonzeros.
+
+        Storage:
+            In the CSR (compressed sparse row) layout, the nonzeros of row i are
+            values[indptr[i]:indptr[i + 1]], in the columns indices[indptr[i]:indptr[i + 1]].
+            The CSC (compressed sparse column) layout is the same structure along columns.
+            Every operation costs time proportional to the number of nonzeros, not to
+            the number of elements.
+
+        Parameters
+        ----------
+        data : list of lists
+            The matrix data, with the same rules as for `Matrix`.
+        layout : str
+            "csr" (fast row access and products) or "csc" (fast column access).
+        """
+
+        # Validations
+        linalgvalidator.validate_data_is_valid_matrix(data)
+        _validate_layout(layout)
+
+        indptr, indices, values = array("q", [0]), array("q"), array("d")
+        for row in data:
+            for j, value in enumerate(row):
+                if value:
+                    indices.append(j)
+                    values.append(value)
+            indptr.append(len(values))
+
+        sparse = SparseMatrix._from_arrays(indptr, indices, values, [len(data), len(data[0])], CSR)
+        if layout == CSC:
+            sparse = sparse.to_csc()
+        self._set_arrays(sparse.indptr, sparse.indices, sparse.values, sparse.dims, layout)
+
+
+    @classmethod
+    def _from_arrays(cls, indptr, indices, values, dims, layout):
+        """
+        Build a SparseMatrix directly from its compressed arrays, without validation.
+        """
+        sparse = cls.__new__(cls)
+        sparse._set_arrays(indptr, indices, values, dims, layout)
+        return sparse
+
+    def _set_arrays(self, indptr, indices, values, dims, layout):
+        self.indptr = indptr
+        self.indices = indices
+        self.values = values
+        self.dims = [dims[0], dims[1]]
+        self.layout = layout
+
+
+    # CONVERSIONS
+    @classmethod
+    def from_matrix(cls, matrix : Matrix, layout=CSR):
+        """
+        Build a SparseMatrix from the nonzero elements of a dense Matrix.
+        """
+        linalgvalidator.validate_object_is_matrix(matrix)
+        _validate_layout(layout)
+
+        indptr, indices, values = array("q", [0]), array("q"), array("d")
+        for row in matrix._rows():
+            for j, value in enumerate(row):
+                if value:
+                    indices.append(j)
+                    values.append(value)
+            indptr.append(len(values))
+
+        sparse = cls._from_arrays(indptr, indices, values, matrix.dims, CSR)
+        return sparse.to_csc() if layout == CSC else sparse
+
+    def to_matrix(self):
+        """
+        Return the dense Matrix holding the same elements.
+        """
+        rows, cols = self.dims
+        dense = array("d", bytes(8 * rows * cols))
+        row_stride, col_stride = (cols, 1) if self.layout == CSR else (1, cols)
+        indptr, indices, values = self.indptr, self.indices, self.values
+        for major in range(len(indptr) - 1):
+            for k in range(indptr[major], indptr[major + 1]):
+                dense[major * row_stride + indices[k] * col_stride] = values[k]
+        return Matrix._from_buffer(dense, self.dims)
+
+    def to_csr(self):
+        """
+        Return the matrix in the CSR layout (self if it already is).
+        """
+        if self.layout == CSR:
+            return self
+        return self.transpose()._recompressed().transpose()
+
+    def to_csc(self):
+        """
+        Return the matrix in the CSC layout (self if it already is).
+        """
+        if self.layout == CSC:
+            return self
+        return self.transpose()._recompressed().transpose()
+
+    def _recompressed(self):
+        """
+        Return the same matrix compressed along the other axis (CSR <-> CSC), in O(nnz).
+        """
+        majors, minors = (self.dims[0], self.dims[1]) if self.layout == CSR else (self.dims[1], self.dims[0])
+        indptr, indices, values = self.indptr, self.indices, self.values
+
+        counts = [0] * (minors + 1)
+        for index in indices:
+            counts[index + 1] += 1
+        for i in range(minors):
+            counts[i + 1] += counts[i]
+
+        new_indptr = array("q", counts)
+        new_indices = array("q", bytes(8 * len(indices)))
+        new_values = array("d", bytes(8 * len(values)))
+        position = counts[:-1]
+        for major in range(majors):
+            for k in range(indptr[major], indptr[major + 1]):
+                slot = position[indices[k]]
+                new_indices[slot] = major
+                new_values[slot] = values[k]
+                position[indices[k]] += 1
+
+        return SparseMatrix._from_arrays(new_indptr, new_indices, new_values, self.dims, _other_layout(self.layout))
+
+
+    # PROPERTIES
+    @property
+    def nnz(self):
+        """
+        The number of stored nonzero elements.
+        """
+        return len(self.values)
+
+    @property
+    def density(self):
+        """
+        The fraction of nonzero elements.
+        """
+        rows, cols = self.dims
+        return self.nnz / (rows * cols) if rows * cols else 0.0
+
+
+    # OPERATIONS
+    def transpose(self):
+        """
+        Transpose the matrix in O(1).
+
+        The CSR arrays of A are exactly the CSC arrays of Aᵀ (and vice versa), so the
+        result shares the arrays of self and only swaps the dims and the layout.
+        """
+        return SparseMatrix._from_arrays(
+            self.indptr, self.indices, self.values, [self.dims[1], self.dims[0]], _other_layout(self.layout)
+        )
+
+    def scalar_multiply(self, scalar):
+        """
+        Multiply every element by a scalar (only the nonzeros are touched).
+        """
+        linalgvalidator.validate_data_is_scalar(scalar)
+
+        values = array("d", [value * scalar for value in self.values])
+        return SparseMatrix._from_arrays(self.indptr, self.indices, values, self.dims, self.layout)
+
+    def add(self, other):
+        """
+        Add another matrix element-wise.
+
+        Parameters
+        ----------
+        other : SparseMatrix or Matrix
+            The matrix to add, of the same shape.
+
+        Returns
+        -------
+        SparseMatrix or Matrix
+            A SparseMatrix (in the layout of self) when both operands are sparse,
+            otherwise a dense Matrix.
+        """
+        if not isinstance(other, Matrix):
+            _validate_object_is_sparse_matrix(other)
+        linalgvalidator.validate_matrices_have_same_shape(self, other)
+
+        if isinstance(other, Matrix):
+            dense = other.copy()
+            buffer, cols = dense._buffer, self.dims[1]
+            csr = self.to_csr()
+            for i in range(self.dims[0]):
+                for k in range(csr.indptr[i], csr.indptr[i + 1]):
+                    buffer[i * cols + csr.indices[k]] += csr.values[k]
+            return dense
+
+        other = other.to_csr() if self.layout == CSR else other.to_csc()
+        indptr, indices, values = array("q", [0]), array("q"), array("d")
+        for major in range(len(self.indptr) - 1):
+            sums = dict(zip(*self._major_slice(major)))
+            for index, value in zip(*other._major_slice(major)):
+                sums[index] = sums.get(index, 0.0) + value
+            for index in sorted(sums):
+                if sums[index]:
+                    indices.append(index)
+                    values.append(sums[index])
+            indptr.append(len(values))
+        return SparseMatrix._from_arrays(indptr, indices, values, self.dims, self.layout)
+
+    def _without_zeros(self):
+        indptr, indices, values = array("q", [0]), array("q"), array("d")
+        for major in range(len(self.indptr) - 1):
+            for index, value in zip(*self._major_slice(major)):
+                if value:
+                    indices.append(index)
+                    values.append(value)
+            indptr.append(len(values))
+        return SparseMatrix._from_arrays(indptr, indices, values, self.dims, self.layout)
+
+    def _major_slice(self, major):
+        start, stop = self.indptr[major], self.indptr[major + 1]
+        return self.indices[start:stop], self.values[start:stop]
+
+    def apply_to_vector(self, vector : Vector):
+        """
+        Apply the matrix to a vector, in O(nnz).
+
+        Returns
+        -------
+        Vector
+            The vector A ⋅ v.
+        """
+        linalgvalidator.validate_object_is_vector(vector)
+        if self.dims[1] != vector.length:
+            raise ValueError(f"Matrix columns ({self.dims[1]}) and Vector ({vector.length}) must have the same length.")
+
+        x = vector._values()
+        indptr, indices, values = self.indptr, self.indices, self.values
+        if self.layout == CSR:
+            result = array("d", [
+                sumprod(values[indptr[i]:indptr[i + 1]], [x[j] for j in indices[indptr[i]:indptr[i + 1]]])
+                for i in range(self.dims[0])
+            ])
+        else:
+            result = array("d", bytes(8 * self.dims[0]))
+            for j in range(self.dims[1]):
+                xj = x[j]
+                if xj:
+                    for k in range(indptr[j], indptr[j + 1]):
+                        result[indices[k]] += values[k] * xj
+        return Vector._from_buffer(result, self.dims[0])
+
+    def dot(self, other):
+        """
+        Compute the matrix product with a dense or a sparse matrix.
+
+        Parameters
+        ----------
+        other : Matrix or SparseMatrix
+            The matrix to multiply with (on the right).
+
+        Returns
+        -------
+        Matrix or SparseMatrix
+            A dense Matrix for a sparse × dense product (in O(nnz ⋅ p)), a CSR
+            SparseMatrix for a sparse × sparse product (Gustavson's algorithm, in
+            time proportional to the number of multiplied nonzeros).
+        """
+        if not isinstance(other, Matrix):
+            _validate_object_is_sparse_matrix(other)
+        linalgvalidator.validate_matrices_are_compatible_for_matrix_product(self, other)
+
+        csr = self.to_csr()
+        if isinstance(other, Matrix):
+            p = other.dims[1]
+            other_rows = [other._row_values(k) for k in range(other.dims[0])]
+            result = array("d")
+            for i in range(self.dims[0]):
+                row = [0.0] * p
+                for k in range(csr.indptr[i], csr.indptr[i + 1]):
+                    value = csr.values[k]
+                    row = [r + value * b for r, b in zip(row, other_rows[csr.indices[k]])]
+                result.extend(row)
+            return Matrix._from_buffer(result, [self.dims[0], p])
+
+        other = other.to_csr()
+        indptr, indices, values = array("q", [0]), array("q"), array("d")
+        for i in range(self.dims[0]):
+            sums = {}
+            for k in range(csr.indptr[i], csr.indptr[i + 1]):
+                value = csr.values[k]
+                for index, other_value in zip(*other._major_slice(csr.indices[k])):
+                    sums[index] = sums.get(index, 0.0) + value * other_value
+            for index in sorted(sums):
+                if sums[index]:
+                    indices.append(index)
+                    values.append(sums[index])
+            indptr.append(len(values))
+        return SparseMatrix._from_arrays(indptr, indices, values, [self.dims[0], other.dims[1]], CSR)
+
+    def _dense_dot(self, matrix):
+        """
+        Compute the dense × sparse product matrix ⋅ self, in O(m ⋅ nnz).
+        """
+        linalgvalidator.validate_matrices_are_compatible_for_matrix_product(matrix, self)
+
+        csc = self.to_csc()
+        columns = [
+            (csc.indices[csc.indptr[j]:csc.indptr[j + 1]], csc.values[csc.indptr[j]:csc.indptr[j + 1]])
+            for j in range(self.dims[1])
+        ]
+        result = array("d")
+        for row in matrix._rows():
+            result.extend([sumprod(values, [row[k] for k in indices]) for indices, values in columns])
+        return Matrix._from_buffer(result, [matrix.dims[0], self.dims[1]])
+
+
+    # OVERLOAD
+    def __repr__(self):
+        return f"SparseMatrix(dims={self.dims}, nnz={self.nnz}, layout={self.layout!r})"
+
+    def __eq__(self, other):
+        if isinstance(other, SparseMatrix):
+            other = other.to_matrix()
+        if not isinstance(other, Matrix):
+            return False
+        return self.to_matrix() == other
+
+    def __add__(self, other):
+        return self.add(other)
+
+    def __radd__(self, other):
+        return self.add(other)
+
+    def __sub__(self, other):
+        return self.add(other * -1)
+
+    def __rsub__(self, other):
+        return self.scalar_multiply(-1).add(other)
+
+    def __mul__(self, other):
+        return self.scalar_multiply(other)
+
+    def __rmul__(self, other):
+        return self.scalar_multiply(other)
+
+    def __matmul__(self, other):
+        if isinstance(other, (Matrix, SparseMatrix)):
+            return self.dot(other)
+        elif isinstance(other, Vector):
+            return self.apply_to_vector(other)
+        return NotImplemented
+
+    def __rmatmul__(self, other):
+        if isinstance(other, Matrix):
+            return self._dense_dot(other)
+        return NotImplemented
+
+
+class COOBuilder:
+
+    def __init__(self, dims):
+        """
+        Collect (row, column, value) triplets one by one to build a SparseMatrix.
+
+        Triplets can arrive in any order, and duplicates are summed when building,
+        which makes the builder suited to streamed data.
+
+        Parameters
+        ----------
+        dims : list
+            The shape [rows, columns] of the matrix to build.
+        """
+        self.dims = [dims[0], dims[1]]
+        self.rows = array("q")
+        self.cols = array("q")
+        self.values = array("d")
+
+    def add(self, row, col, value):
+        """
+        Append one triplet.
+        """
+        linalgvalidator.validate_data_is_scalar(value)
+        if not (0 <= row < self.dims[0] and 0 <= col < self.dims[1]):
+            raise IndexError(f"Position ({row}, {col}) is outside of a {self.dims[0]}×{self.dims[1]} matrix.")
+        self.rows.append(row)
+        self.cols.append(col)
+        self.values.append(value)
+
+    def extend(self, triplets):
+        """
+        Append every (row, column, value) triplet of an iterable.
+        """
+        for row, col, value in triplets:
+            self.add(row, col, value)
+
+    def __len__(self):
+        return len(self.values)
+
+    def build(self, layout=CSR):
+        """
+        Return the SparseMatrix holding the collected triplets (duplicates summed, zeros dropped).
+        """
+        _validate_layout(layout)
+
+        rows, cols, values = self.rows, self.cols, self.values
+        indptr, indices, sums = array("q", [0] * (self.dims[0] + 1)), array("q"), array("d")
+        current = None
+        for k in sorted(range(len(values)), key=lambda k: (rows[k], cols[k])):
+            position = (rows[k], cols[k])
+            if position == current:
+                sums[-1] += values[k]
+            else:
+                current = position
+                indices.append(cols[k])
+                sums.append(values[k])
+                indptr[rows[k] + 1] += 1
+        for i in range(self.dims[0]):
+            indptr[i + 1] += indptr[i]
+
+        sparse = SparseMatrix._from_arrays(indptr, indices, sums, self.dims, CSR)
+        if any(value == 0 for value in sums):
+            sparse = sparse._without_zeros()
+        return sparse.to_csc() if layout == CSC else sparse
+
+
+def _validate_layout(layout):
+    if layout not in (CSR, CSC):
+        raise ValueError(f"Unknown sparse layout {layout!r}, expected 'csr' or 'csc'.")
+
+
+def _validate_object_is_sparse_matrix(x):
+    if not isinstance(x, SparseMatrix):
+        raise TypeError("Expected a SparseMatrix or a Matrix object as input.")
+
+
+def _other_layout(layout):
+    return CSC if layout == CSR else CSR
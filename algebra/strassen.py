@@ -0,0 +1,235 @@
+import json
+import os
+import random
+import time
+from array import array
+
+from algebra import parallel
+from config.paths import TUNING_FILE
+
+# Default size under which the recursion stops and the classic kernel takes over.
+# `autotune` measures the best value for the host and stores it in TUNING_FILE.
+LEAF_SIZE = 256
+
+# Strassen is only used for near-square products: max(m, n, p) / min(m, n, p) <= MAX_ASPECT_RATIO.
+MAX_ASPECT_RATIO = 2
+
+_settings = {"leaf_size": None}
+
+
+# --------------------
+# SETTINGS
+# --------------------
+
+def get_leaf_size():
+    """
+    Return the leaf size: the tuned value stored for this host if any, else LEAF_SIZE.
+    """
+    if _settings["leaf_size"] is None:
+        _settings["leaf_size"] = _load_tuned_leaf_size() or LEAF_SIZE
+    return _settings["leaf_size"]
+
+
+def set_leaf_size(leaf_size):
+    """
+    Set the size under which the recursion falls back to the classic kernel.
+    """
+    if not isinstance(leaf_size, int) or isinstance(leaf_size, bool) or leaf_size < 1:
+        raise ValueError("The leaf size must be a positive integer.")
+    _settings["leaf_size"] = leaf_size
+
+
+def is_applicable(m, n, p, leaf_size=None):
+    """
+    Tell whether the Strassen path should be used for an (m × n) ⋅ (n × p) product.
+
+    One level of recursion only pays off when its blocks are at least leaf-sized
+    themselves: the smallest dimension must be at least twice the leaf size.
+    """
+    leaf_size = get_leaf_size() if leaf_size is None else leaf_size
+    smallest, largest = min(m, n, p), max(m, n, p)
+    return smallest >= 2 * leaf_size and largest <= MAX_ASPECT_RATIO * smallest
+
+
+def _load_tuned_leaf_size():
+    try:
+        with open(TUNING_FILE) as file:
+            leaf_size = json.load(file).get("strassen_leaf_size")
+    except (OSError, ValueError, AttributeError):
+        return None
+    # A hand-edited or corrupted file falls back to the default
+    if not isinstance(leaf_size, int) or isinstance(leaf_size, bool) or leaf_size < 1:
+        return None
+    return leaf_size
+
+
+def _store_tuned_leaf_size(leaf_size):
+    tuning = {}
+    try:
+        with open(TUNING_FILE) as file:
+            tuning = json.load(file)
+    except (OSError, ValueError):
+        pass
+    tuning["strassen_leaf_size"] = leaf_size
+    os.makedirs(os.path.dirname(TUNING_FILE), exist_ok=True)
+    with open(TUNING_FILE, "w") as file:
+        json.dump(tuning, file, indent=2)
+
+
+# --------------------
+# MATRIX PRODUCT
+# --------------------
+
+def matmul(A, B, leaf_size=None, workers=None):
+    """
+    Compute the raw product A ⋅ B with the Strassen-Winograd recursion.
+
+    Mathematical definition:
+        A and B are split into 2 × 2 blocks and C = A ⋅ B is obtained with 7 block
+        products and 15 block additions (Winograd's variant) instead of 8 products:
+            S₁ = A₂₁ + A₂₂   S₂ = S₁ - A₁₁   S₃ = A₁₁ - A₂₁   S₄ = A₁₂ - S₂
+            T₁ = B₁₂ - B₁₁   T₂ = B₂₂ - T₁   T₃ = B₂₂ - B₁₂   T₄ = T₂ - B₂₁
+            M₁ = A₁₁B₁₁  M₂ = A₁₂B₂₁  M₃ = S₄B₂₂  M₄ = A₂₂T₄  M₅ = S₁T₁  M₆ = S₂T₂  M₇ = S₃T₃
+            U₂ = M₁ + M₆   U₃ = U₂ + M₇   U₄ = U₂ + M₅
+            C₁₁ = M₁ + M₂   C₁₂ = U₄ + M₃   C₂₁ = U₃ - M₄   C₂₂ = U₃ + M₅
+        which brings the cost down to O(n^log₂7) ≈ O(n^2.81).
+
+    The blocks are views of the operands (no copy). Odd dimensions are padded with
+    one zero row or column at the level where they appear, and the recursion stops
+    below `leaf_size`, where the classic kernel (serial or multi-process) is used.
+
+    Parameters
+    ----------
+    A : Matrix
+        The left operand (m × n).
+    B : Matrix
+        The right operand (n × p).
+    leaf_size : int, optional
+        The size under which the classic kernel is used. Defaults to `get_leaf_size()`.
+    workers : int, optional
+        The number of processes used by the classic kernel on the leaves.
+
+    Returns
+    -------
+    array
+        The m × p product as a row-major `array('d')`.
+    """
+
+    leaf_size = get_leaf_size() if leaf_size is None else leaf_size
+    return _multiply(A, B, leaf_size, workers)._row_major()
+
+
+def _multiply(A, B, leaf_size, workers):
+    from algebra.matrices import Matrix
+
+    m, n = A.dims
+    p = B.dims[1]
+    if min(m, n, p) <= leaf_size:
+        return Matrix._from_buffer(parallel.matmul(A, B, workers), [m, p])
+
+    if m % 2 or n % 2 or p % 2:
+        A_even = _pad(A, m + m % 2, n + n % 2)
+        B_even = _pad(B, n + n % 2, p + p % 2)
+        return _multiply(A_even, B_even, leaf_size, workers)[:m, :p]
+
+    h, k, l = m // 2, n // 2, p // 2
+    A11, A12, A21, A22 = A[:h, :k], A[:h, k:], A[h:, :k], A[h:, k:]
+    B11, B12, B21, B22 = B[:k, :l], B[:k, l:], B[k:, :l], B[k:, l:]
+
+    S1 = A21.add(A22)
+    S2 = S1.substract(A11)
+    S3 = A11.substract(A21)
+    S4 = A12.substract(S2)
+    T1 = B12.substract(B11)
+    T2 = B22.substract(T1)
+    T3 = B22.substract(B12)
+    T4 = T2.substract(B21)
+
+    M1 = _multiply(A11, B11, leaf_size, workers)
+    U2 = M1.add(_multiply(S2, T2, leaf_size, workers))
+    U3 = U2.add(_multiply(S3, T3, leaf_size, workers))
+    M5 = _multiply(S1, T1, leaf_size, workers)
+
+    C11 = M1.add(_multiply(A12, B21, leaf_size, workers))
+    C12 = U2.add(M5).add(_multiply(S4, B22, leaf_size, workers))
+    C21 = U3.substract(_multiply(A22, T4, leaf_size, workers))
+    C22 = U3.add(M5)
+
+    values = array("d")
+    for top, bottom in ((C11, C12), (C21, C22)):
+        for i in range(top.dims[0]):
+            values.extend(top._row_values(i))
+            values.extend(bottom._row_values(i))
+    return Matrix._from_buffer(values, [m, p])
+
+
+def _pad(A, rows, cols):
+    """
+    Return A completed with zero rows and columns up to (rows × cols).
+    """
+    from algebra.matrices import Matrix
+
+    if A.dims == [rows, cols]:
+        return A
+    zeros = array("d", bytes(8 * (cols - A.dims[1])))
+    values = array("d")
+    for row in A._rows():
+        values.extend(row)
+        values.extend(zeros)
+    values.extend(array("d", bytes(8 * cols * (rows - A.dims[0]))))
+    return Matrix._from_buffer(values, [rows, cols])
+
+
+# --------------------
+# AUTOTUNING
+# --------------------
+
+def autotune(size=512, candidates=(32, 64, 128, 256), repeat=1, save=True, seed=0):
+    """
+    Measure the fastest leaf size on this machine and make it the default.
+
+    Every candidate leaf size is timed on a random size × size product, together with
+    the classic kernel alone (equivalent to a leaf size of `size`). The winner is set
+    with `set_leaf_size` and, when `save` is True, stored in TUNING_FILE so that later
+    processes pick it up.
+
+    Parameters
+    ----------
+    size : int
+        The dimension of the square matrices used for the measurements.
+    candidates : tuple of int
+        The leaf sizes to try.
+    repeat : int
+        The number of runs per candidate (the best time is kept).
+    save : bool
+        Whether to store the result for later processes.
+    seed : int
+        The seed of the random test matrices.
+
+    Returns
+    -------
+    dict
+        The measured timings in seconds by leaf size, and the chosen `leaf_size`.
+    """
+    from algebra.matrices import Matrix
+
+    rng = random.Random(seed)
+    A, B = (
+        Matrix._from_buffer(array("d", [rng.uniform(-1, 1) for _ in range(size * size)]), [size, size])
+        for _ in range(2)
+    )
+
+    timings = {}
+    for leaf_size in sorted(set(candidates) | {size}):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            _multiply(A, B, leaf_size, workers=1)
+            best = min(best, time.perf_counter() - start)
+        timings[leaf_size] = best
+
+    leaf_size = min(timings, key=timings.get)
+    set_leaf_size(leaf_size)
+    if save:
+        _store_tuned_leaf_size(leaf_size)
+    return {"timings": timings, "leaf_size": leaf_size}
@@ -0,0 +1,338 @@
+from array import array
+from collections import deque
+from operator import add, mul, sub
+
+from algebra import parallel
+from algebra.kernels import sumprod
+from algebra.matrices import Matrix
+from algebra.validator import LinearAlgebraValidator as linalgvalidator
+from algebra.vectors import Vector
+
+# Default number of rows per block for `iter_row_blocks`.
+BLOCK_SIZE = 1024
+
+# Number of blocks handed to the worker processes ahead of the one being accumulated,
+# per worker: it bounds the number of blocks held in memory at the same time.
+BLOCKS_IN_FLIGHT_PER_WORKER = 2
+
+
+def iter_row_blocks(matrix : Matrix, block_size=BLOCK_SIZE):
+    """
+    Split a matrix into views of at most `block_size` consecutive rows.
+
+    Useful to stream a memory-mapped matrix (see `Matrix.load(..., mmap=True)`):
+    only the rows of the block being processed are read from disk.
+    """
+    linalgvalidator.validate_object_is_matrix(matrix)
+    if not isinstance(block_size, int) or isinstance(block_size, bool) or block_size < 1:
+        raise ValueError("The block size must be a positive integer.")
+
+    for start in range(0, matrix.dims[0], block_size):
+        yield matrix[start:start + block_size]
+
+
+def apply_to_vector(blocks, v : Vector, workers=None):
+    """
+    Compute A ⋅ v for a matrix A given as a stream of row blocks.
+
+    Mathematical definition:
+        If A is the stack of the blocks A₁, ..., A_b, then A ⋅ v is the
+        concatenation of the Aₖ ⋅ v.
+
+    Parameters
+    ----------
+    blocks : iterable of Matrix
+        The row blocks of A (m × n), in order, e.g. from `iter_csv_blocks` or `iter_row_blocks`.
+    v : Vector
+        The vector (size n).
+    workers : int or None
+        The number of processes computing blocks concurrently. Defaults to the value
+        set with `algebra.parallel.set_workers`.
+
+    Returns
+    -------
+    Vector
+        A ⋅ v (size m). Only a few blocks are held in memory at a time.
+    """
+    linalgvalidator.validate_object_is_vector(v)
+    values = v._values()
+    if not isinstance(values, array):
+        values = array("d", values)
+
+    def tasks():
+        for block in _checked_blocks(blocks, v.length):
+            yield _block_apply, (_block_values(block), block.dims, values)
+
+    result = array("d")
+    for partial in _map_blocks(tasks(), workers):
+        result.extend(partial)
+    return Vector._from_buffer(result, len(result))
+
+
+def transpose_apply_to_vector(blocks, v : Vector, workers=None):
+    """
+    Compute Aᵀ ⋅ v for a matrix A given as a stream of row blocks.
+
+    Mathematical definition:
+        If A is the stack of the blocks A₁, ..., A_b and v the stack of the matching
+        pieces v₁, ..., v_b, then Aᵀ ⋅ v = Σ Aₖᵀ ⋅ vₖ.
+
+    Parameters
+    ----------
+    blocks : iterable of Matrix
+        The row blocks of A (m × n), in order.
+    v : Vector
+        The vector (size m, the total number of rows of the blocks).
+    workers : int or None
+        The number of processes computing blocks concurrently.
+
+    Returns
+    -------
+    Vector
+        Aᵀ ⋅ v (size n).
+    """
+    linalgvalidator.validate_object_is_vector(v)
+    values = v._values()
+    consumed = [0]
+
+    def tasks():
+        for block in _checked_blocks(blocks):
+            start, stop = consumed[0], consumed[0] + block.dims[0]
+            if stop > v.length:
+                raise ValueError(f"The blocks have more rows than the vector has elements ({v.length}).")
+            consumed[0] = stop
+            yield _block_transpose_apply, (_block_values(block), block.dims, array("d", values[start:stop]))
+
+    total = _sum_blocks(tasks(), workers)
+    if consumed[0] != v.length:
+        raise ValueError(f"The blocks have {consumed[0]} rows but the vector has {v.length} elements.")
+    return Vector._from_buffer(total, len(total))
+
+
+def gram(blocks, weights=None, center=False, workers=None):
+    """
+    Compute Aᵀ ⋅ A (or a weighted or centered variant) for a matrix A given as a stream of row blocks.
+
+    Mathematical definition:
+        Aᵀ ⋅ W ⋅ A = Σᵢ wᵢ ⋅ aᵢ ⋅ aᵢᵀ, over the rows aᵢ of A (W = diag(w), w = 1 by default).
+        Centered: Σᵢ wᵢ ⋅ (aᵢ - μ) ⋅ (aᵢ - μ)ᵀ, μ being the weighted mean of the rows.
+
+    The result is symmetric: only its upper triangle is accumulated (half of the
+    products), and mirrored once at the end. Aᵀ is never formed: every block only
+    contributes the sums of its own rows. Centered blocks are merged with their
+    means (Chan's pairwise update), which stays accurate when the columns have
+    a large mean, unlike Σ aᵢ ⋅ aᵢᵀ - n ⋅ μ ⋅ μᵀ.
+
+    Parameters
+    ----------
+    blocks : iterable of Matrix
+        The row blocks of A (m × n), in order.
+    weights : Vector, optional
+        The non-negative weight of every row (size m).
+    center : bool
+        If True, center the rows on their (weighted) mean first (the scatter matrix).
+    workers : int or None
+        The number of processes computing blocks concurrently.
+
+    Returns
+    -------
+    Matrix
+        The n × n symmetric matrix.
+    """
+    _, _, scatter, n = _moments(blocks, weights, center, workers)
+    return Matrix._from_buffer(_mirror(scatter, n), [n, n])
+
+
+def covariance(blocks, weights=None, ddof=1, workers=None):
+    """
+    Compute the covariance matrix of the columns of A, given as a stream of row blocks.
+
+    Mathematical definition:
+        C = Σᵢ wᵢ ⋅ (aᵢ - μ) ⋅ (aᵢ - μ)ᵀ / (Σᵢ wᵢ - ddof)
+        The weights are frequency weights: a weight of 2 counts the row twice.
+
+    Parameters
+    ----------
+    blocks : iterable of Matrix
+        The row blocks of A (m × n), in order: one observation per row, one variable per column.
+    weights : Vector, optional
+        The non-negative weight of every row (size m).
+    ddof : int
+        The delta degrees of freedom (1 for the unbiased estimate, 0 for the maximum likelihood one).
+    workers : int or None
+        The number of processes computing blocks concurrently.
+
+    Returns
+    -------
+    Matrix
+        The n × n covariance matrix.
+    """
+    weight, _, scatter, n = _moments(blocks, weights, True, workers)
+    if weight - ddof <= 0:
+        raise ValueError(f"The total weight of the rows ({weight}) must be greater than ddof ({ddof}).")
+    scale = 1 / (weight - ddof)
+    return Matrix._from_buffer(_mirror(array("d", [value * scale for value in scatter]), n), [n, n])
+
+
+def _moments(blocks, weights, center, workers):
+    """
+    Return the total weight, the means (if centered), the packed upper triangle of the scatter and n.
+    """
+    if weights is not None:
+        linalgvalidator.validate_object_is_vector(weights)
+        weight_values = weights._values()
+        if any(w < 0 for w in weight_values):
+            raise ValueError("Weights must be non-negative.")
+    consumed, columns = [0], []
+
+    def tasks():
+        for block in _checked_blocks(blocks):
+            columns.append(block.dims[1])
+            start, stop = consumed[0], consumed[0] + block.dims[0]
+            consumed[0] = stop
+            block_weights = None
+            if weights is not None:
+                if stop > weights.length:
+                    raise ValueError(f"The blocks have more rows than there are weights ({weights.length}).")
+                block_weights = array("d", weight_values[start:stop])
+            yield _block_moments, (_block_values(block), block.dims, block_weights, center)
+
+    total = None
+    # Blocks are merged in order, so the rounding does not depend on `workers`
+    for partial in _map_blocks(tasks(), workers):
+        total = partial if total is None else _merge_moments(total, partial, center)
+    if weights is not None and consumed[0] != weights.length:
+        raise ValueError(f"The blocks have {consumed[0]} rows but there are {weights.length} weights.")
+    weight, means, scatter = total
+    return weight, means, scatter, columns[0]
+
+
+def _merge_moments(a, b, center):
+    weight_a, means_a, scatter_a = a
+    weight_b, means_b, scatter_b = b
+    weight = weight_a + weight_b
+    scatter = array("d", map(add, scatter_a, scatter_b))
+    if not center or weight_a == 0 or weight_b == 0:
+        means = means_b if center and weight_a == 0 else means_a
+        return weight, means, scatter
+
+    # Chan et al.: S = Sₐ + S_b + (wₐ ⋅ w_b / w) ⋅ δ ⋅ δᵀ, with δ = μ_b - μₐ
+    delta = array("d", map(sub, means_b, means_a))
+    factor = weight_a * weight_b / weight
+    means = array("d", [mean + d * weight_b / weight for mean, d in zip(means_a, delta)])
+    n, position = len(delta), 0
+    for j in range(n):
+        scale = factor * delta[j]
+        stop = position + n - j
+        scatter[position:stop] = array("d", map(add, scatter[position:stop], [scale * d for d in delta[j:]]))
+        position = stop
+    return weight, means, scatter
+
+
+def _mirror(packed, n):
+    """
+    Expand a packed upper triangle (row j holding the columns j..n-1) into a full symmetric n × n buffer.
+    """
+    full = array("d", bytes(8 * n * n))
+    position = 0
+    for j in range(n):
+        stop = position + n - j
+        full[j * n + j:(j + 1) * n] = packed[position:stop]
+        full[j * n + j::n] = packed[position:stop]
+        position = stop
+    return full
+
+
+# --------------------
+# DRIVER
+# --------------------
+
+def _checked_blocks(blocks, columns=None):
+    empty = True
+    for block in blocks:
+        linalgvalidator.validate_object_is_matrix(block)
+        if columns is None:
+            columns = block.dims[1]
+        elif block.dims[1] != columns:
+            raise ValueError(f"Row block has {block.dims[1]} columns, expected {columns}.")
+        empty = False
+        yield block
+    if empty:
+        raise ValueError("Expected at least one row block.")
+
+
+def _block_values(block):
+    values = block._row_major()
+    return values if isinstance(values, array) else array("d", values)
+
+
+def _map_blocks(tasks, workers):
+    """
+    Run the (function, arguments) tasks and yield their results in order.
+
+    With several workers, tasks are submitted to the process pool at most
+    `workers × BLOCKS_IN_FLIGHT_PER_WORKER` ahead of the result being consumed,
+    so memory stays bounded whatever the length of the stream.
+    """
+    workers = parallel.get_workers() if workers is None else parallel.check_workers(workers)
+    if workers == 1:
+        for function, arguments in tasks:
+            yield function(*arguments)
+        return
+
+    executor = parallel.get_executor(workers)
+    pending = deque()
+    for function, arguments in tasks:
+        pending.append(executor.submit(function, *arguments))
+        if len(pending) >= workers * BLOCKS_IN_FLIGHT_PER_WORKER:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _sum_blocks(tasks, workers):
+    # Partial results are added in block order, so the rounding does not depend on `workers`
+    total = None
+    for partial in _map_blocks(tasks, workers):
+        total = partial if total is None else array("d", map(add, total, partial))
+    return total
+
+
+# --------------------
+# BLOCK KERNELS (run in the worker processes)
+# --------------------
+
+def _block_apply(values, dims, v):
+    m, n = dims
+    return array("d", [sumprod(values[i * n:(i + 1) * n], v) for i in range(m)])
+
+
+def _block_transpose_apply(values, dims, v):
+    n = dims[1]
+    return array("d", [sumprod(values[j::n], v) for j in range(n)])
+
+
+def _block_moments(values, dims, weights, center):
+    """
+    Return the weight, the column means (if centered) and the packed upper triangle of the scatter of a block.
+
+    The columns are read from the block (at most a block of rows), and every upper
+    pair (j, k), k ≥ j, is a single dot product: n(n + 1)/2 of them instead of n².
+    """
+    m, n = dims
+    # Lists: the dot products below are faster on lists than on arrays of doubles
+    columns = [values[j::n].tolist() for j in range(n)]
+    weight = float(m) if weights is None else sum(weights)
+    means = None
+    if center:
+        if weight == 0:
+            return 0.0, array("d", bytes(8 * n)), array("d", bytes(4 * n * (n + 1)))
+        sums = [sum(column) for column in columns] if weights is None else [sumprod(column, weights) for column in columns]
+        means = array("d", [total / weight for total in sums])
+        columns = [[x - mean for x in column] for column, mean in zip(columns, means)]
+    weighted = columns if weights is None else [list(map(mul, column, weights)) for column in columns]
+
+    scatter = array("d")
+    for j in range(n):
+        scatter.extend([sumprod(weighted[j], columns[k]) for k in range(j, n)])
+    return weight, means, scatter
@@ -0,0 +1,554 @@
+from array import array
+from operator import add, mul
+
+from algebra.matrices import Matrix
+from algebra.validator import LinearAlgebraValidator as linalgvalidator
+from algebra.vectors import Vector
+
+
+class BandedMatrix:
+
+    def __init__(self, data : list, lower, upper):
+        """
+        Create an n × n BandedMatrix from a list of lists, keeping only its diagonals -lower..upper.
+
+        Storage:
+            A[i][j] is zero whenever j - i < -lower or j - i > upper. Only the
+            lower + upper + 1 diagonals of the band are stored, each as an `array('d')`:
+            diagonal k (k = j - i) holds its n - |k| elements, the element (i, j) being
+            at position min(i, j). Products, transposition and additions work diagonal by
+            diagonal, in O(n ⋅ bandwidth) instead of O(n²) or O(n³).
+
+        Results stay structured when the algebra guarantees it: the sum and the product
+        of banded matrices are banded (with a wider band), a product of lower triangular
+        matrices is lower triangular, a product of diagonal matrices is diagonal.
+        Mixed operations with a dense Matrix return a dense Matrix.
+
+        Parameters
+        ----------
+        data : list of lists
+            The square matrix data, with the same rules as for `Matrix`.
+        lower : int
+            The number of nonzero diagonals below the main diagonal.
+        upper : int
+            The number of nonzero diagonals above the main diagonal.
+        """
+        linalgvalidator.validate_data_is_valid_matrix(data)
+        self._set_band(data, lower, upper)
+
+    def _set_band(self, data, lower, upper):
+        """
+        Store the band of validated rows (the data is not validated again).
+        """
+        buffer = array("d")
+        for row in data:
+            buffer.extend(row)
+        banded = BandedMatrix.from_matrix(Matrix._from_buffer(buffer, [len(data), len(data[0])]), lower, upper)
+        self._set_diagonals(banded.dims[0], lower, upper, banded._diagonals)
+
+
+    @classmethod
+    def _from_diagonals(cls, n, lower, upper, diagonals):
+        """
+        Build a structured matrix directly from its diagonals, without validation.
+        """
+        structured = cls.__new__(cls)
+        structured._set_diagonals(n, lower, upper, diagonals)
+        return structured
+
+    def _set_diagonals(self, n, lower, upper, diagonals):
+        self.dims = [n, n]
+        self.lower = lower
+        self.upper = upper
+        self._diagonals = diagonals
+
+
+    # CONVERSIONS
+    @classmethod
+    def from_matrix(cls, matrix : Matrix, lower, upper):
+        """
+        Build a BandedMatrix from the band of a dense square Matrix.
+
+        Raises a ValueError if an element outside of the band is nonzero.
+        """
+        linalgvalidator.validate_object_is_matrix(matrix)
+        linalgvalidator.validate_matrix_is_square(matrix)
+        n = matrix.dims[0]
+        _validate_bandwidths(n, lower, upper)
+
+        rows = [row.tolist() for row in matrix._rows()]
+        for i, row in enumerate(rows):
+            if any(row[:max(i - lower, 0)]) or any(row[i + upper + 1:]):
+                raise ValueError(f"Row {i} has nonzero elements outside of the band (-{lower}, {upper}).")
+        diagonals = [
+            array("d", [rows[t - min(k, 0)][t + max(k, 0)] for t in range(n - abs(k))])
+            for k in range(-lower, upper + 1)
+        ]
+        return _structured(n, lower, upper, diagonals)
+
+    def to_matrix(self):
+        """
+        Return the dense Matrix holding the same elements.
+        """
+        n = self.dims[0]
+        dense = array("d", bytes(8 * n * n))
+        for k, diagonal in self._bands():
+            start = k if k >= 0 else -k * n
+            dense[start:start + len(diagonal) * (n + 1):n + 1] = diagonal
+        return Matrix._from_buffer(dense, self.dims)
+
+    def diagonal(self, k=0):
+        """
+        Return the diagonal k (k = j - i: 0 is the main diagonal, k > 0 above it) as a Vector.
+        """
+        n = self.dims[0]
+        if not -n < k < n:
+            raise IndexError(f"Diagonal {k} is outside of a {n}×{n} matrix.")
+        if -self.lower <= k <= self.upper:
+            values = array("d", self._diagonal(k))
+        else:
+            values = array("d", bytes(8 * (n - abs(k))))
+        return Vector._from_buffer(values, len(values))
+
+    def _diagonal(self, k):
+        return self._diagonals[k + self.lower]
+
+    def _bands(self):
+        """
+        Iterate over the stored diagonals as (k, values) pairs.
+        """
+        return zip(range(-self.lower, self.upper + 1), self._diagonals)
+
+
+    # PROPERTIES
+    @property
+    def bandwidth(self):
+        """
+        The number of stored diagonals (lower + upper + 1).
+        """
+        return self.lower + self.upper + 1
+
+    @property
+    def is_lower_triangular(self):
+        return self.upper == 0
+
+    @property
+    def is_upper_triangular(self):
+        return self.lower == 0
+
+
+    # OPERATIONS
+    def transpose(self):
+        """
+        Transpose the matrix in O(1).
+
+        The element (i, j) of diagonal k is stored at position min(i, j), which is also
+        the position of the element (j, i) of diagonal -k: the transpose shares the
+        diagonals of self in reverse order.
+        """
+        return _structured(self.dims[0], self.upper, self.lower, self._diagonals[::-1])
+
+    def scalar_multiply(self, scalar):
+        """
+        Multiply every element by a scalar (only the band is touched).
+        """
+        linalgvalidator.validate_data_is_scalar(scalar)
+
+        diagonals = [array("d", [value * scalar for value in diagonal]) for _, diagonal in self._bands()]
+        return _structured(self.dims[0], self.lower, self.upper, diagonals)
+
+    def add(self, other):
+        """
+        Add another matrix element-wise.
+
+        Parameters
+        ----------
+        other : BandedMatrix (or subclass) or Matrix
+            The matrix to add, of the same shape.
+
+        Returns
+        -------
+        BandedMatrix or Matrix
+            A structured matrix covering both bands (DiagonalMatrix, TriangularMatrix
+            or BandedMatrix) when both operands are structured, otherwise a dense Matrix
+            (a copy of `other` with the band of self added, in O(n ⋅ bandwidth)).
+        """
+        if not isinstance(other, Matrix):
+            _validate_object_is_banded_matrix(other)
+        linalgvalidator.validate_matrices_have_same_shape(self, other)
+
+        n = self.dims[0]
+        if isinstance(other, Matrix):
+            dense = other.copy()
+            buffer = dense._buffer
+            for k, diagonal in self._bands():
+                start = k if k >= 0 else -k * n
+                stop = start + len(diagonal) * (n + 1)
+                buffer[start:stop:n + 1] = array("d", map(add, buffer[start:stop:n + 1], diagonal))
+            return dense
+
+        lower, upper = max(self.lower, other.lower), max(self.upper, other.upper)
+        diagonals = []
+        for k in range(-lower, upper + 1):
+            mine = self._diagonal(k) if -self.lower <= k <= self.upper else None
+            theirs = other._diagonal(k) if -other.lower <= k <= other.upper else None
+            if mine is None or theirs is None:
+                diagonals.append(array("d", mine if theirs is None else theirs))
+            else:
+                diagonals.append(array("d", map(add, mine, theirs)))
+        return _structured(n, lower, upper, diagonals)
+
+    def apply_to_vector(self, vector : Vector):
+        """
+        Apply the matrix to a vector, in O(n ⋅ bandwidth).
+
+        Returns
+        -------
+        Vector
+            The vector A ⋅ v.
+        """
+        linalgvalidator.validate_object_is_vector(vector)
+        linalgvalidator.validate_matrix_and_vector_have_same_length(self, vector)
+
+        result = self._apply(vector._values())
+        return Vector._from_buffer(result, len(result))
+
+    def _apply(self, x):
+        """
+        Compute A ⋅ x for a buffer x, one diagonal at a time.
+        """
+        n = self.dims[0]
+        y = [0.0] * n
+        for k, diagonal in self._bands():
+            if k >= 0:
+                # y[i] += A[i][i + k] ⋅ x[i + k], for i in [0, n - k)
+                y[:n - k] = map(add, y[:n - k], map(mul, diagonal, x[k:]))
+            else:
+                # y[j - k] += A[j - k][j] ⋅ x[j], for j in [0, n + k)
+                y[-k:] = map(add, y[-k:], map(mul, diagonal, x[:n + k]))
+        return array("d", y)
+
+    def dot(self, other):
+        """
+        Multiply by another matrix.
+
+        Parameters
+        ----------
+        other : BandedMatrix (or subclass) or Matrix
+            The right operand (n × p).
+
+        Returns
+        -------
+        BandedMatrix or Matrix
+            A structured matrix when both operands are structured (diagonals -(l₁ + l₂)
+            to u₁ + u₂, in O(n ⋅ bandwidth₁ ⋅ bandwidth₂)), otherwise a dense Matrix
+            (in O(n ⋅ bandwidth ⋅ p)).
+        """
+        if not isinstance(other, Matrix):
+            _validate_object_is_banded_matrix(other)
+        linalgvalidator.validate_matrices_are_compatible_for_matrix_product(self, other)
+
+        if isinstance(other, Matrix):
+            n, p = other.dims
+            product = array("d", bytes(8 * n * p))
+            for j in range(p):
+                product[j::p] = self._apply(other._column_values(j))
+            return Matrix._from_buffer(product, [n, p])
+
+        if isinstance(other, IdentityMatrix):
+            return self._copy()
+        return _band_product(self, other)
+
+    def _dense_dot(self, matrix):
+        """
+        Compute M ⋅ A for a dense Matrix M (m × n): every row of the result is Aᵀ ⋅ (row of M).
+        """
+        linalgvalidator.validate_matrices_are_compatible_for_matrix_product(matrix, self)
+
+        transposed = self.transpose()
+        product = array("d")
+        for row in matrix._rows():
+            product.extend(transposed._apply(row))
+        return Matrix._from_buffer(product, [matrix.dims[0], self.dims[1]])
+
+    def solve(self, b : Vector):
+        """
+        Solve A ⋅ x = b for a triangular band (lower = 0 or upper = 0) by substitution, in O(n ⋅ bandwidth).
+
+        Mathematical definition:
+            For a lower triangular A (forward substitution):
+            xᵢ = (bᵢ - Σ A[i][j] ⋅ xⱼ, for j in [i - lower, i)) / A[i][i]
+            and symmetrically from the last row for an upper triangular A.
+
+        Returns
+        -------
+        Vector
+            The solution x.
+        """
+        linalgvalidator.validate_object_is_vector(b)
+        linalgvalidator.validate_matrix_and_vector_have_same_length(self, b)
+        if not (self.is_lower_triangular or self.is_upper_triangular):
+            raise ValueError("Substitution needs a triangular band (lower = 0 or upper = 0); use Matrix.solve.")
+
+        n = self.dims[0]
+        pivots = self._diagonal(0)
+        if any(pivot == 0 for pivot in pivots):
+            raise ValueError("Matrix is singular.")
+
+        x = b._values().tolist()
+        if self.is_lower_triangular:
+            bands = [(k, self._diagonal(-k)) for k in range(1, self.lower + 1)]
+            for i in range(n):
+                # A[i][i - k] is stored at position i - k of diagonal -k
+                x[i] = (x[i] - sum(diagonal[i - k] * x[i - k] for k, diagonal in bands if k <= i)) / pivots[i]
+        else:
+            bands = [(k, self._diagonal(k)) for k in range(1, self.upper + 1)]
+            for i in reversed(range(n)):
+                # A[i][i + k] is stored at position i of diagonal k
+                x[i] = (x[i] - sum(diagonal[i] * x[i + k] for k, diagonal in bands if i + k < n)) / pivots[i]
+        return Vector._from_buffer(array("d", x), n)
+
+    def determinant(self):
+        """
+        Compute the determinant of a triangular band: the product of its diagonal.
+        """
+        if not (self.is_lower_triangular or self.is_upper_triangular):
+            return self.to_matrix().determinant()
+        determinant = 1.0
+        for pivot in self._diagonal(0):
+            determinant *= pivot
+        return determinant
+
+    def _copy(self):
+        return _structured(self.dims[0], self.lower, self.upper, [array("d", diagonal) for _, diagonal in self._bands()])
+
+
+    # OVERLOAD
+    def __repr__(self):
+        return f"{type(self).__name__}(dims={self.dims}, lower={self.lower}, upper={self.upper})"
+
+    def __eq__(self, other):
+        if isinstance(other, BandedMatrix):
+            other = other.to_matrix()
+        if not isinstance(other, Matrix):
+            return False
+        return self.to_matrix() == other
+
+    def __getitem__(self, index):
+        i, j = index
+        n = self.dims[0]
+        if not (-n <= i < n and -n <= j < n):
+            raise IndexError("Matrix index out of range.")
+        i, j = i % n, j % n
+        k = j - i
+        if -self.lower <= k <= self.upper:
+            return self._diagonal(k)[min(i, j)]
+        return 0.0
+
+    def __add__(self, other):
+        return self.add(other)
+
+    def __radd__(self, other):
+        return self.add(other)
+
+    def __sub__(self, other):
+        return self.add(other * -1)
+
+    def __rsub__(self, other):
+        return self.scalar_multiply(-1).add(other)
+
+    def __mul__(self, other):
+        return self.scalar_multiply(other)
+
+    def __rmul__(self, other):
+        return self.scalar_multiply(other)
+
+    def __matmul__(self, other):
+        if isinstance(other, (Matrix, BandedMatrix)):
+            return self.dot(other)
+        elif isinstance(other, Vector):
+            return self.apply_to_vector(other)
+        return NotImplemented
+
+    def __rmatmul__(self, other):
+        if isinstance(other, Matrix):
+            return self._dense_dot(other)
+        return NotImplemented
+
+
+class TriangularMatrix(BandedMatrix):
+
+    def __init__(self, data : list, lower=True):
+        """
+        Create a lower (or upper) triangular n × n matrix from a list of lists.
+
+        Only the n(n + 1)/2 elements of the triangle are stored (as the diagonals of a
+        band of width n), `solve` runs a forward (or back) substitution in O(n²), and
+        products or sums of triangular matrices of the same kind stay triangular.
+
+        Parameters
+        ----------
+        data : list of lists
+            The square matrix data; the elements outside of the triangle must be zero.
+        lower : bool
+            True for a lower triangular matrix, False for an upper triangular one.
+        """
+        linalgvalidator.validate_data_is_valid_matrix(data)
+        n = len(data)
+        self._set_band(data, n - 1 if lower else 0, 0 if lower else n - 1)
+
+
+class DiagonalMatrix(BandedMatrix):
+
+    def __init__(self, values):
+        """
+        Create the n × n diagonal matrix diag(d₁, ..., dₙ).
+
+        Only the n diagonal elements are stored: products and matrix-vector products
+        scale rows (or columns) in O(n) per column, the transpose is the matrix itself
+        and the inverse is diag(1/d₁, ..., 1/dₙ).
+
+        Parameters
+        ----------
+        values : list or Vector
+            The diagonal elements.
+        """
+        if isinstance(values, Vector):
+            values = values.data
+        linalgvalidator.validate_data_is_list(values)
+        linalgvalidator.validate_data_only_contains_scalars(values)
+
+        self._set_diagonals(len(values), 0, 0, [array("d", values)])
+
+    def transpose(self):
+        """
+        Return the matrix itself (a diagonal matrix is symmetric).
+        """
+        return self
+
+    def inverse(self):
+        """
+        Return the inverse diag(1/d₁, ..., 1/dₙ), in O(n).
+        """
+        diagonal = self._diagonal(0)
+        if any(value == 0 for value in diagonal):
+            raise ValueError("Matrix is singular.")
+        return DiagonalMatrix._from_diagonals(self.dims[0], 0, 0, [array("d", [1 / value for value in diagonal])])
+
+
+class IdentityMatrix(DiagonalMatrix):
+
+    def __init__(self, n):
+        """
+        Create the n × n identity matrix Iₙ, which stores no element at all.
+
+        Products with the identity return a copy of the other operand, I ⋅ v and
+        the solution of I ⋅ x = b a copy of the vector, and element reads compare
+        indices, without any arithmetic. The diagonal of ones is only built when an
+        operation needs it (sums, scaling, conversion to a dense Matrix).
+
+        Parameters
+        ----------
+        n : int
+            The size of the matrix.
+        """
+        if not isinstance(n, int) or isinstance(n, bool) or n < 1:
+            raise ValueError("The size of an identity matrix must be a positive integer.")
+
+        self._set_diagonals(n, 0, 0, None)
+
+    def _diagonal(self, k):
+        return array("d", [1.0]) * self.dims[0]
+
+    def _bands(self):
+        return iter([(0, self._diagonal(0))])
+
+    def _apply(self, x):
+        return array("d", x)
+
+    def solve(self, b : Vector):
+        linalgvalidator.validate_object_is_vector(b)
+        linalgvalidator.validate_matrix_and_vector_have_same_length(self, b)
+
+        return b.copy()
+
+    def inverse(self):
+        return self
+
+    def determinant(self):
+        return 1.0
+
+    def dot(self, other):
+        if not isinstance(other, Matrix):
+            _validate_object_is_banded_matrix(other)
+        linalgvalidator.validate_matrices_are_compatible_for_matrix_product(self, other)
+
+        return other.copy() if isinstance(other, Matrix) else other._copy()
+
+    def _dense_dot(self, matrix):
+        linalgvalidator.validate_matrices_are_compatible_for_matrix_product(matrix, self)
+
+        return matrix.copy()
+
+    def _copy(self):
+        return IdentityMatrix(self.dims[0])
+
+    def __getitem__(self, index):
+        i, j = index
+        n = self.dims[0]
+        if not (-n <= i < n and -n <= j < n):
+            raise IndexError("Matrix index out of range.")
+        return 1.0 if i % n == j % n else 0.0
+
+
+def _band_product(A, B):
+    """
+    Multiply two banded matrices diagonal by diagonal.
+
+    Mathematical definition:
+        The diagonal k₁ of A times the diagonal k₂ of B contributes to the diagonal
+        k₁ + k₂ of C: C[i][i + k₁ + k₂] += A[i][i + k₁] ⋅ B[i + k₁][i + k₁ + k₂].
+    """
+    n = A.dims[0]
+    lower, upper = min(A.lower + B.lower, n - 1), min(A.upper + B.upper, n - 1)
+    product = [[0.0] * (n - abs(k)) for k in range(-lower, upper + 1)]
+
+    for ka, a in A._bands():
+        for kb, b in B._bands():
+            kc = ka + kb
+            if not -lower <= kc <= upper:
+                continue
+            # Valid rows i: 0 ≤ i, i + ka, i + kc < n
+            first, last = max(0, -ka, -kc), min(n, n - ka, n - kc)
+            if first >= last:
+                continue
+            length = last - first
+            start_a, start_b, start_c = first + min(0, ka), first + ka + min(0, kb), first + min(0, kc)
+            c = product[kc + lower]
+            c[start_c:start_c + length] = map(
+                add, c[start_c:start_c + length], map(mul, a[start_a:start_a + length], b[start_b:start_b + length])
+            )
+
+    return _structured(n, lower, upper, [array("d", diagonal) for diagonal in product])
+
+
+def _structured(n, lower, upper, diagonals):
+    """
+    Wrap diagonals in the most specific structured type for their band.
+    """
+    if lower == 0 and upper == 0:
+        return DiagonalMatrix._from_diagonals(n, 0, 0, diagonals)
+    if (lower, upper) in ((n - 1, 0), (0, n - 1)):
+        return TriangularMatrix._from_diagonals(n, lower, upper, diagonals)
+    return BandedMatrix._from_diagonals(n, lower, upper, diagonals)
+
+
+def _validate_bandwidths(n, lower, upper):
+    for bandwidth in (lower, upper):
+        if not isinstance(bandwidth, int) or isinstance(bandwidth, bool) or not 0 <= bandwidth < n:
+            raise ValueError(f"Bandwidths must be integers in [0, {n - 1}], got {bandwidth!r}.")
+
+
+def _validate_object_is_banded_matrix(x):
+    if not isinstance(x, BandedMatrix):
+        raise TypeError("Expected a Matrix or a structured matrix as input.")
@@ -1,6 +1,56 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+# Validation policies, from the safest to the fastest:
+#   full  -> structure and type of every element are checked
+#   shape -> structure and dimensions are checked, elements are not inspected
+#   off   -> nothing is checked (invalid inputs lead to undefined results)
+FULL = "full"
+SHAPE = "shape"
+OFF = "off"
+VALIDATION_POLICIES = (FULL, SHAPE, OFF)
+
+_policy_override = ContextVar("validation_policy", default=None)
+
+
+def _skipped_when_off(validation):
+    """
+    Make a validation a no-op when the active (or given) policy is OFF.
+    """
+    @wraps(validation)
+    def wrapper(cls, *args, policy=None):
+        if cls.get_policy(policy) == OFF:
+            return
+        return validation(cls, *args)
+    return wrapper
+
 
 class LinearAlgebraValidator:
 
+    # --------------------
+    # POLICY
+    # --------------------
+
+    _global_policy = FULL
+
+    @classmethod
+    def set_policy(cls, policy):
+        cls.validate_policy(policy)
+        cls._global_policy = policy
+
+    @classmethod
+    def get_policy(cls, policy=None):
+        if policy is not None:
+            cls.validate_policy(policy)
+            return policy
+        return _policy_override.get() or cls._global_policy
+
+    @staticmethod
+    def validate_policy(policy):
+        if policy not in VALIDATION_POLICIES:
+            raise ValueError(f"Unknown validation policy {policy!r}, expected one of {VALIDATION_POLICIES}.")
+
     # --------------------
     # DATA TYPES
     # --------------------
@@ -15,38 +65,44 @@ class LinearAlgebraValidator:
     
     @staticmethod
     def _is_vector(x):
-        return x.__class__.__name__ == "Vector"
+        return any(cls.__name__ == "Vector" for cls in type(x).__mro__)
     
     @staticmethod
     def _is_matrix(x):
-        return x.__class__.__name__ == "Matrix"
+        return any(cls.__name__ == "Matrix" for cls in type(x).__mro__)
 
     @classmethod
     def _is_list_of_scalars(cls, data):
         return all(cls._is_scalar(x) for x in data)
 
     @classmethod
+    @_skipped_when_off
     def validate_data_is_list(cls, data):
         if not cls._is_list(data):
             raise TypeError("Expected a list as input.")
     
     @classmethod
+    @_skipped_when_off
     def validate_object_is_vector(cls, data):
         if not cls._is_vector(data):
             raise TypeError("Expected a Vector object as input.")
     
     @classmethod
+    @_skipped_when_off
     def validate_object_is_matrix(cls, data):
         if not cls._is_matrix(data):
             raise TypeError("Expected a Matrix object as input.")
 
     @classmethod
+    @_skipped_when_off
     def validate_data_is_scalar(cls, data):
         if not cls._is_scalar(data):
             raise TypeError("Expected a scalar value (non-boolean int or float).")
 
     @classmethod
-    def validate_data_only_contains_scalars(cls, data):
+    def validate_data_only_contains_scalars(cls, data, policy=None):
+        if cls.get_policy(policy) != FULL:
+            return
         if not cls._is_list_of_scalars(data):
             raise TypeError("List must contain only scalar values (int or float, excluding bool).")
 
@@ -61,7 +117,7 @@ class LinearAlgebraValidator:
     
     @staticmethod
     def _are_same_sized_vectors(x1, x2):
-        return len(x1.data) == len(x2.data)
+        return x1.length == x2.length
     
     @staticmethod
     def _are_same_shape_matrices(X1, X2):
@@ -76,31 +132,52 @@ class LinearAlgebraValidator:
         row_lengths = [len(row) for row in rows_list]
         return len(set(row_lengths)) == 1
     
+    @staticmethod
+    def _is_square_matrix(X):
+        return X.dims[0] == X.dims[1]
+
     def _are_same_length_matrix_and_vector(A, b):
         return A.dims[0] == b.length
          
 
     @classmethod
+    @_skipped_when_off
     def validate_vector_is_in_2d(cls, x):
         if not cls._is_2d_vector(x):
             raise ValueError("Expected a 2D vector (list of length 2).")
     
     @classmethod
+    @_skipped_when_off
     def validate_vectors_have_same_size(cls, x1, x2):
         if not cls._are_same_sized_vectors(x1, x2):
             raise ValueError("Vectors are not the same dimension.")
     
     @classmethod
+    @_skipped_when_off
     def validate_matrices_have_same_shape(cls, x1, x2):
         if not cls._are_same_shape_matrices(x1, x2):
             raise ValueError("Matrices are not the same shape.")
     
     @classmethod
+    @_skipped_when_off
     def validate_matrix_and_vector_have_same_length(cls, A, b):
         if not cls._are_same_length_matrix_and_vector(A, b):
             raise ValueError(f"Matrix ({A.dims[0]}) and Vector ({b.length}) mist have the same length.")
     
     @classmethod
+    @_skipped_when_off
+    def validate_matrix_has_shape(cls, X, dims):
+        if list(X.dims) != list(dims):
+            raise ValueError(f"Expected a {dims[0]}×{dims[1]} matrix, got a {X.dims[0]}×{X.dims[1]} matrix.")
+
+    @classmethod
+    @_skipped_when_off
+    def validate_matrix_is_square(cls, X):
+        if not cls._is_square_matrix(X):
+            raise ValueError(f"Expected a square matrix, got a {X.dims[0]}×{X.dims[1]} matrix.")
+
+    @classmethod
+    @_skipped_when_off
     def validate_matrices_are_compatible_for_matrix_product(cls, x1, x2):
         if not cls._are_compatible_for_matrix_product(x1, x2):
             raise ValueError(f"First matrix columns ({x1.dims[0]}) must be equal to second matrix rows ({x2.dims[1]}).")
@@ -111,7 +188,11 @@ class LinearAlgebraValidator:
     # --------------------
 
     @classmethod
-    def validate_data_is_valid_matrix(cls, data):
+    def validate_data_is_valid_matrix(cls, data, policy=None):
+
+        policy = cls.get_policy(policy)
+        if policy == OFF:
+            return
         
         if not cls._is_list(data):
             raise TypeError("Expected a list as input.")
@@ -119,7 +200,7 @@ class LinearAlgebraValidator:
         for row in data:
             if not cls._is_list(row):
                 raise TypeError("Each row must be a list.")
-            if not cls._is_list_of_scalars(row):
+            if policy == FULL and not cls._is_list_of_scalars(row):
                 raise TypeError("Each row must only contain scalar values.")
         
         if not cls._are_same_sized_rows(data):
@@ -134,8 +215,27 @@ class LinearAlgebraValidator:
         return x.magnitude() != 0
     
     @classmethod
+    @_skipped_when_off
     def validate_vector_has_non_null_magnitude(cls, x):
         if not cls._has_non_null_magnitude(x):
             raise ZeroDivisionError("Cannot compute cosine similarity with a zero vector.")
+
+
+@contextmanager
+def validation_policy(policy):
+    """
+    Use a validation policy ("full", "shape" or "off") inside a `with` block.
+
+    Example
+    -------
+    with validation_policy("off"):
+        X = Matrix(rows)  # rows produced by trusted code, not inspected
+    """
+    LinearAlgebraValidator.validate_policy(policy)
+    token = _policy_override.set(policy)
+    try:
+        yield
+    finally:
+        _policy_override.reset(token)
     
     
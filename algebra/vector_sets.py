@@ -0,0 +1,262 @@
+from array import array
+from operator import sub
+
+from algebra import parallel
+from algebra.kernels import sumprod
+from algebra.matrices import Matrix
+from algebra.validator import LinearAlgebraValidator as linalgvalidator
+from algebra.vectors import Vector, _owner
+
+# Number of rows of the result computed at once by the pairwise methods.
+BLOCK_SIZE = 256
+
+METRICS = ("dot", "cosine", "distance")
+
+# Squared distances below this fraction of ||vᵢ||² + ||wⱼ||² are recomputed from the
+# differences: the expansion ||vᵢ||² + ||wⱼ||² - 2 ⋅ vᵢ · wⱼ cancels out for them.
+EXACT_DISTANCE_RATIO = 1e-4
+
+
+class VectorSet:
+
+    def __init__(self, vectors : list):
+        """
+        Create a VectorSet: a collection of vectors of the same length stored contiguously.
+
+        Storage:
+            The N vectors of length d are stored one after the other in one
+            `array('d')` buffer (like the rows of an N × d Matrix). Indexing returns
+            Vector views on this buffer.
+
+        Parameters
+        ----------
+        vectors : list of Vector
+            The vectors, all of the same length (at least one).
+        """
+
+        # Validations
+        linalgvalidator.validate_data_is_list(vectors)
+        if not vectors:
+            raise ValueError("A VectorSet needs at least one vector.")
+        for vector in vectors:
+            linalgvalidator.validate_object_is_vector(vector)
+            linalgvalidator.validate_vectors_have_same_size(vectors[0], vector)
+
+        buffer = array("d")
+        for vector in vectors:
+            buffer.extend(vector._values())
+        self._set_buffer(buffer, len(vectors), vectors[0].length)
+
+
+    @classmethod
+    def _from_buffer(cls, buffer, count, dim, base=None):
+        """
+        Build a VectorSet directly on top of a row-major buffer, without validation.
+        """
+        vector_set = cls.__new__(cls)
+        vector_set._set_buffer(buffer, count, dim, base)
+        return vector_set
+
+    def _set_buffer(self, buffer, count, dim, base=None):
+        self._buffer = buffer
+        self.count = count
+        self.dim = dim
+        self.base = base
+        self._version = 0
+        self._frozen = False
+        self._norms = None
+
+    @classmethod
+    def from_matrix(cls, matrix : Matrix):
+        """
+        Build a VectorSet from the rows of a Matrix (without copy when the rows are contiguous).
+        """
+        linalgvalidator.validate_object_is_matrix(matrix)
+
+        values = matrix._row_major()
+        base = _owner(matrix) if values is matrix._buffer else None
+        return cls._from_buffer(values, matrix.dims[0], matrix.dims[1], base)
+
+    def as_matrix(self):
+        """
+        Return the N × d Matrix whose rows are the vectors (a view sharing the buffer).
+        """
+        return Matrix._from_buffer(self._buffer, [self.count, self.dim], base=_owner(self))
+
+
+    # NORMS
+    def norms(self):
+        """
+        Return the magnitudes of all the vectors, computed once and cached until a vector is modified.
+
+        Returns
+        -------
+        array
+            ||vᵢ|| for every vector vᵢ, as an `array('d')`.
+        """
+        version = _owner(self)._version
+        if self._norms is None or self._norms[0] != version:
+            dim, buffer = self.dim, self._buffer
+            norms = array("d")
+            for i in range(self.count):
+                row = buffer[i * dim:(i + 1) * dim]
+                norms.append(sumprod(row, row) ** 0.5)
+            self._norms = (version, norms)
+        return self._norms[1]
+
+
+    # PAIRWISE COMPUTATIONS
+    def iter_pairwise(self, other=None, metric="dot", block_size=BLOCK_SIZE, workers=None):
+        """
+        Compute a pairwise matrix block of rows by block of rows.
+
+        Only one block of `block_size` rows of the result is in memory at a time,
+        which makes it possible to consume an N × M result that would not fit in memory.
+
+        Parameters
+        ----------
+        other : VectorSet, optional
+            The second set (M vectors). Defaults to self.
+        metric : str
+            "dot" (vᵢ · wⱼ), "cosine" (cosine similarity) or "distance" (Euclidean distance).
+        block_size : int
+            The number of rows of the result in one block.
+        workers : int, optional
+            The number of processes used for the dot products of each block
+            (see `algebra.parallel`).
+
+        Yields
+        ------
+        tuple of (int, Matrix)
+            The index of the first row of the block, and the block (block_size × M).
+        """
+        other = self if other is None else other
+        _validate_object_is_vector_set(other)
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric {metric!r}, expected one of {METRICS}.")
+        if self.dim != other.dim:
+            raise ValueError(f"Vectors are not the same dimension ({self.dim} and {other.dim}).")
+
+        if metric == "cosine":
+            for norms in (self.norms(), other.norms()):
+                if 0.0 in norms:
+                    raise ZeroDivisionError("Cannot compute cosine similarity with a zero vector.")
+            self_norms, other_norms = self.norms(), other.norms()
+        elif metric == "distance":
+            self_squares = [norm * norm for norm in self.norms()]
+            other_squares = [norm * norm for norm in other.norms()]
+
+        others = other.as_matrix().transpose()
+        rows = self.as_matrix()
+        for start in range(0, self.count, block_size):
+            stop = min(start + block_size, self.count)
+            block = parallel.matmul(rows[start:stop], others, workers)
+
+            if metric == "cosine":
+                for i in range(start, stop):
+                    first, norm = (i - start) * other.count, self_norms[i]
+                    block[first:first + other.count] = array("d", [
+                        dot / (norm * other_norm)
+                        for dot, other_norm in zip(block[first:first + other.count], other_norms)
+                    ])
+            elif metric == "distance":
+                for i in range(start, stop):
+                    first, square = (i - start) * other.count, self_squares[i]
+                    distances = []
+                    for j, (dot, other_square) in enumerate(zip(block[first:first + other.count], other_squares)):
+                        squared = square + other_square - 2 * dot
+                        if squared <= EXACT_DISTANCE_RATIO * (square + other_square):
+                            # Close points far from the origin: the expansion cancels out, use the differences
+                            squared = self._squared_distance(i, other, j)
+                        distances.append(max(squared, 0.0) ** 0.5)
+                    block[first:first + other.count] = array("d", distances)
+                    if other is self:
+                        block[first + i] = 0.0
+
+            yield start, Matrix._from_buffer(block, [stop - start, other.count])
+
+    def _squared_distance(self, i, other, j):
+        dim = self.dim
+        differences = list(map(sub, self._buffer[i * dim:(i + 1) * dim], other._buffer[j * dim:(j + 1) * dim]))
+        return sumprod(differences, differences)
+
+    def _pairwise(self, other, metric, block_size, workers):
+        values = array("d")
+        for _, block in self.iter_pairwise(other, metric, block_size, workers):
+            values.extend(block._buffer)
+        other = self if other is None else other
+        return Matrix._from_buffer(values, [self.count, other.count])
+
+    def dot_matrix(self, other=None, block_size=BLOCK_SIZE, workers=None):
+        """
+        Compute the matrix of all the dot products vᵢ · wⱼ (Gram matrix when other is None).
+
+        Returns
+        -------
+        Matrix
+            The N × M matrix of dot products.
+        """
+        return self._pairwise(other, "dot", block_size, workers)
+
+    def cosine_similarity_matrix(self, other=None, block_size=BLOCK_SIZE, workers=None):
+        """
+        Compute the matrix of all the cosine similarities (vᵢ · wⱼ) / (||vᵢ|| ⋅ ||wⱼ||).
+
+        The norms are computed once per vector (and cached), not once per pair.
+
+        Returns
+        -------
+        Matrix
+            The N × M matrix of cosine similarities.
+        """
+        return self._pairwise(other, "cosine", block_size, workers)
+
+    def pairwise_distances(self, other=None, block_size=BLOCK_SIZE, workers=None):
+        """
+        Compute the matrix of all the Euclidean distances ||vᵢ - wⱼ||.
+
+        Mathematical definition:
+            ||vᵢ - wⱼ||² = ||vᵢ||² + ||wⱼ||² - 2 ⋅ (vᵢ · wⱼ)
+            which only needs the dot products and the cached norms.
+
+        The expansion loses precision when ||vᵢ - wⱼ||² is small compared with
+        ||vᵢ||² + ||wⱼ||² (close points far from the origin: [1e8, 0] and [1e8 + 1, 0]
+        would be at distance 0). Those entries, below EXACT_DISTANCE_RATIO times the sum
+        of the squared norms, are recomputed from the differences like `Vector.distance`;
+        the others keep a relative error of about 1e-12 at most.
+
+        Returns
+        -------
+        Matrix
+            The N × M matrix of distances.
+        """
+        return self._pairwise(other, "distance", block_size, workers)
+
+
+    # OVERLOAD
+    def __repr__(self):
+        return f"VectorSet(count={self.count}, dim={self.dim})"
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("VectorSet index out of range.")
+        return Vector._from_buffer(self._buffer, self.dim, offset=index * self.dim, base=_owner(self))
+
+    def __iter__(self):
+        return (self[i] for i in range(self.count))
+
+    def __rmatmul__(self, other):
+        # Matrix @ VectorSet: the matrix applied to every vector, as one packed VectorSet
+        if isinstance(other, Matrix):
+            return other.apply_to_vectors(self, packed=True)
+        return NotImplemented
+
+
+def _validate_object_is_vector_set(x):
+    if not isinstance(x, VectorSet):
+        raise TypeError("Expected a VectorSet object as input.")
@@ -1,54 +1,294 @@
+import random as _random
+from array import array
+from operator import add, sub
+
+from algebra.kernels import sumprod
 from algebra.validator import LinearAlgebraValidator as linalgvalidator
 
 class Vector():
 
-    def __init__(self, data : list):
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = ("_buffer", "_offset", "_stride", "length", "base", "_version", "_frozen", "_cache", "__weakref__")
+
+    def __init__(self, data : list, validation=None):
+        """
+        Create a Vector object from a list of scalar values.
+
+        The values are stored as raw doubles in a contiguous `array('d')` buffer.
+        A Vector may also be a view (a row or a column of a Matrix, a slice of another
+        Vector): it then shares the buffer of its `base` and reads its elements with
+        an offset and a stride instead of copying them.
+
+        Parameters
+        ----------
+        data : list
+            The vector components. Each element must be a scalar value (int or float).
+        validation : str, optional
+            The validation policy for this call: "full" (every element is checked),
+            "shape" (only the container is checked) or "off". Defaults to the active
+            policy (see `algebra.validator.validation_policy`).
+        """
+
 
-        
         # --- Validations ---
-        linalgvalidator.validate_data_is_list(data)
-        linalgvalidator.validate_data_only_contains_scalars(data)
+        linalgvalidator.validate_data_is_list(data, policy=validation)
+        linalgvalidator.validate_data_only_contains_scalars(data, policy=validation)
 
-        self.data = data
+        self._buffer = array("d", data)
+        self._offset = 0
+        self._stride = 1
         self.length = len(data)
-    
-    def __repr__(self):
-        return f"Vector({self.data})"
-    
-    def __eq__(self, other):
-        if not isinstance(other, Vector):
-            return False
-        return self.data == other.data
+        self.base = None
+        self._version = 0
+        self._frozen = False
+        self._cache = None
+
+
+    @classmethod
+    def _from_buffer(cls, buffer, length, offset=0, stride=1, base=None):
+        """
+        Build a Vector directly on top of an existing buffer, without validation.
+
+        Used internally for results computed by the library and for views.
+        """
+        vector = cls.__new__(cls)
+        vector._buffer = buffer
+        vector._offset = offset
+        vector._stride = stride
+        vector.length = length
+        vector.base = base
+        vector._version = 0
+        vector._frozen = False
+        vector._cache = None
+        return vector
+
+
+    # BULK CONSTRUCTORS
+    # The values are produced by the library (or copied into a buffer of doubles), so
+    # the element-by-element validation of the constructor is skipped.
+    @staticmethod
+    def zeros(length):
+        """
+        Create the vector of `length` zeros.
+        """
+        _validate_size(length)
+        return Vector._from_buffer(array("d", bytes(8 * length)), length)
+
+    @staticmethod
+    def ones(length):
+        """
+        Create the vector of `length` ones.
+        """
+        return Vector.full(length, 1.0)
+
+    @staticmethod
+    def full(length, value):
+        """
+        Create a vector of `length` components all equal to `value`.
+        """
+        _validate_size(length)
+        linalgvalidator.validate_data_is_scalar(value)
+        return Vector._from_buffer(array("d", [value]) * length, length)
+
+    @staticmethod
+    def from_flat(buffer, shape=None):
+        """
+        Create a vector from a flat buffer of numbers.
+
+        Parameters
+        ----------
+        buffer : array('d'), memoryview of doubles or sequence of numbers
+            The components. An `array('d')` or a memoryview of doubles is used as is
+            (no copy: the vector shares it); anything else is copied into an `array('d')`.
+        shape : int or tuple of int, optional
+            The expected length, checked against the buffer.
+        """
+        buffer = _as_double_buffer(buffer)
+        if shape is not None:
+            length = shape[0] if isinstance(shape, (tuple, list)) else shape
+            if length != len(buffer):
+                raise ValueError(f"Buffer of {len(buffer)} elements does not match length {length}.")
+        return Vector._from_buffer(buffer, len(buffer))
+
+    @staticmethod
+    def from_iter(iterable):
+        """
+        Create a vector from any iterable of numbers (e.g. a generator), in one pass.
+        """
+        buffer = array("d", iterable)
+        return Vector._from_buffer(buffer, len(buffer))
+
+    @staticmethod
+    def random(length, seed=None, low=0.0, high=1.0):
+        """
+        Create a vector of components drawn uniformly in [low, high).
+
+        Parameters
+        ----------
+        length : int
+            The number of components.
+        seed : int, optional
+            The seed of the generator, for reproducible vectors.
+        """
+        _validate_size(length)
+        draw = _random.Random(seed).random
+        scale = high - low
+        return Vector._from_buffer(array("d", [low + scale * draw() for _ in range(length)]), length)
+
+
+    # STORAGE
+    @property
+    def data(self):
+        """
+        The vector components as a list (a copy, kept for compatibility).
+        """
+        return self._values().tolist()
+
+    def _values(self):
+        """
+        Return the components as a contiguous buffer.
+
+        The buffer itself is returned when the vector covers it entirely (no copy),
+        so the result must be treated as read-only.
+        """
+        buffer = self._buffer
+        if self._stride == 1:
+            if self._offset == 0 and self.length == len(buffer):
+                return buffer
+            return buffer[self._offset:self._offset + self.length]
+        return _detached(_strided_slice(buffer, self._offset, self.length, self._stride))
+
+    def _set_values(self, values):
+        """
+        Overwrite the components with a contiguous buffer of the same length.
+        """
+        self._check_writable()
+        if self._stride == 1:
+            self._buffer[self._offset:self._offset + self.length] = values
+        else:
+            _strided_assign(self._buffer, self._offset, self.length, self._stride, values)
+        self._bump_version()
+
+    def _result(self, values, out):
+        """
+        Wrap the computed components in a new Vector, or write them into `out`.
+
+        The values are always fully computed before being written, so `out` may
+        share its buffer with any operand.
+        """
+        if out is None:
+            return Vector._from_buffer(values, self.length)
+        linalgvalidator.validate_object_is_vector(out)
+        linalgvalidator.validate_vectors_have_same_size(self, out)
+        out._set_values(values)
+        return out
+
+    def _bump_version(self):
+        """
+        Record a modification of the buffer, invalidating the results cached for it.
+        """
+        _owner(self)._version += 1
+
+    def _current_version(self):
+        return _owner(self)._version
+
+    def _check_writable(self):
+        if _owner(self)._frozen:
+            raise ValueError("Vector is frozen (read-only): use unfreeze() or copy() to modify it.")
+
+    def _cached(self, name, compute):
+        """
+        Return a derived quantity, computed once and reused until the buffer is modified.
+        """
+        if self._cache is None:
+            self._cache = {}
+        version = _owner(self)._version
+        cached = self._cache.get(name)
+        if cached is None or cached[0] != version:
+            cached = (version, compute())
+            self._cache[name] = cached
+        return cached[1]
+
+    def _index(self, index):
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("Vector index out of range.")
+        return self._offset + index * self._stride
+
+    def copy(self):
+        """
+        Return a new Vector owning a contiguous copy of the components.
+        """
+        return Vector._from_buffer(array("d", self._values()), self.length)
+
+
+    # FROZEN MODE
+    def freeze(self):
+        """
+        Make the vector read-only and cache its derived quantities.
+
+        Once frozen, every write to the buffer raises a ValueError, including writes
+        through views of it (freezing a view freezes the object owning the buffer).
+        In exchange, the magnitude and the content hash are computed once and reused,
+        and the vector is hashable: a query compared against a frozen corpus only
+        computes the norms of the corpus once.
+
+        Returns
+        -------
+        Vector
+            self, to allow `v = Vector(values).freeze()`.
+        """
+        _owner(self)._frozen = True
+        return self
+
+    def unfreeze(self):
+        """
+        Make the vector (and every view of its buffer) writable again, dropping the cached quantities.
+        """
+        _owner(self)._frozen = False
+        self._bump_version()
+        return self
+
+    @property
+    def is_frozen(self):
+        """
+        Whether the buffer of the vector is read-only (see `freeze`).
+        """
+        return _owner(self)._frozen
+
 
 
-    
     # VECTOR OPERATIONS
-    def scalar_multiply(self, scalar):
+    def scalar_multiply(self, scalar, out=None):
         """
         Multiply the vector by a scalar.
         Mathematical definition:
             For a vector v = [v₁, v₂, ..., vₙ] and scalar α, the scalar product is α * v = [α⋅v₁, α⋅v₂, ..., α⋅vₙ]
         This operation is one of the two axioms of linearity (homogeneity).
-        
+
         Parameters
         ----------
         scalar : int or float
             The scalar value to multiply with the vector.
+        out : Vector, optional
+            A vector of the same size receiving the result instead of a new vector
+            (it may be self).
 
         Returns
         -------
         Vector
-            A new vector resulting from the multiplication.
+            A new vector resulting from the multiplication (or `out`).
         """
 
         # --- Validations ---
         linalgvalidator.validate_data_is_scalar(scalar)
 
 
-        return Vector([scalar * value for value in self.data])
-    
-    
-    def add(self, vector2 : "Vector"):
+        return self._result(array("d", [scalar * value for value in self._values()]), out)
+
+
+    def add(self, vector2 : "Vector", out=None):
         """
         Add two vectors of the same dimension.
 
@@ -60,21 +300,24 @@ class Vector():
         ----------
         vector2 : Vector
             The vector to add to self.
+        out : Vector, optional
+            A vector of the same size receiving the result instead of a new vector
+            (it may be self or vector2).
 
         Returns
         -------
         Vector
-            A new vector representing the sum.
+            A new vector representing the sum (or `out`).
         """
 
         # --- Validations ---
         linalgvalidator.validate_object_is_vector(vector2)
         linalgvalidator.validate_vectors_have_same_size(self, vector2)
 
-        return Vector([a + b for a, b in zip(self.data, vector2.data)])
-    
-    
-    def substract(self, vector2 : "Vector"):
+        return self._result(array("d", map(add, self._values(), vector2._values())), out)
+
+
+    def substract(self, vector2 : "Vector", out=None):
         """
         Substract another vector from this one.
 
@@ -86,20 +329,23 @@ class Vector():
         ----------
         vector2 : Vector
             The vector to substract from self.
+        out : Vector, optional
+            A vector of the same size receiving the result instead of a new vector
+            (it may be self or vector2).
 
         Returns
         -------
         Vector
-            A new vector representing the difference.
+            A new vector representing the difference (or `out`).
         """
 
         # --- Validations ---
         linalgvalidator.validate_object_is_vector(vector2)
         linalgvalidator.validate_vectors_have_same_size(self, vector2)
 
-        return Vector([a - b for a, b in zip(self.data, vector2.data)])
-    
-    
+        return self._result(array("d", map(sub, self._values(), vector2._values())), out)
+
+
     def dot(self, vector2: "Vector"):
         """
         Compute the dot product between two vectors of the same dimension, the sum of the products of every corresponding components.
@@ -122,11 +368,11 @@ class Vector():
         linalgvalidator.validate_object_is_vector(vector2)
         linalgvalidator.validate_vectors_have_same_size(self, vector2)
 
-        
-        dot_product = sum(a * b for a, b in zip(self.data, vector2.data))
+
+        dot_product = sumprod(self._values(), vector2._values())
         return dot_product
 
-    
+
     def magnitude(self):
         """
         Compute the magnitude (Euclidean norm) of the vector.
@@ -140,10 +386,16 @@ class Vector():
             The Euclidean norm of the vector.
         """
 
-        magnitude = sum(a**2 for a in self.data) ** 0.5
+        if _owner(self)._frozen:
+            return self._cached("magnitude", self._compute_magnitude)
+        return self._compute_magnitude()
+
+    def _compute_magnitude(self):
+        values = self._values()
+        magnitude = sumprod(values, values) ** 0.5
         return magnitude
-    
-    
+
+
     def distance(self, vector2: "Vector"):
         """
         Compute the Euclidean distance between two vectors.
@@ -166,11 +418,11 @@ class Vector():
         linalgvalidator.validate_object_is_vector(vector2)
         linalgvalidator.validate_vectors_have_same_size(self, vector2)
 
-        
+
         distance = self.substract(vector2).magnitude()
         return distance
-    
-    
+
+
     def cosine_similarity(self, vector2: "Vector"):
         """
         Compute the cosine similarity between two vectors.
@@ -192,36 +444,188 @@ class Vector():
         # --- Validations ---
         linalgvalidator.validate_object_is_vector(vector2)
         linalgvalidator.validate_vectors_have_same_size(self, vector2)
-        linalgvalidator.validate_vector_has_non_null_magnitude(self)
-        linalgvalidator.validate_vector_has_non_null_magnitude(vector2)
 
-        
-        cosine = self.dot(vector2) / (self.magnitude() * vector2.magnitude())
+        # Each magnitude is computed once (and not at all for a frozen vector)
+        magnitudes = self.magnitude() * vector2.magnitude()
+        if magnitudes == 0:
+            raise ZeroDivisionError("Cannot compute cosine similarity with a zero vector.")
+
+        cosine = self.dot(vector2) / magnitudes
         return cosine
 
 
 
+    # LAZY EVALUATION
+    def lazy(self):
+        """
+        Start a lazy expression on this vector.
+
+        Operations on the returned expression are only recorded, and `evaluate()`
+        computes them in one fused pass without intermediate objects
+        (see `algebra.lazy.LazyExpression`).
+
+        Example
+        -------
+        v.lazy().add(w).scalar_multiply(0.5).evaluate()
+        """
+        from algebra.lazy import LazyExpression
+
+        return LazyExpression.wrap(self)
+
+
+    # PERSISTENCE
+    def save(self, path):
+        """
+        Write the vector to a binary file (relative paths are taken from DATA_DIR).
+
+        See `algebra.serialization` for the file format.
+        """
+        from algebra import serialization
+
+        return serialization.save(self, path)
+
+    @staticmethod
+    def load(path, mmap=False):
+        """
+        Read a vector written by `Vector.save` (memory-mapped and frozen if `mmap` is True).
+        """
+        from algebra import serialization
+
+        vector = serialization.load(path, mmap=mmap)
+        linalgvalidator.validate_object_is_vector(vector)
+        return vector
+
+
+
     # OVERLOAD
     def __repr__(self):
         return f"Vector({self.data})"
-    
+
+    def __eq__(self, other):
+        if not isinstance(other, Vector):
+            return False
+        return self.length == other.length and _same_values(self._values(), other._values())
+
+    def __hash__(self):
+        if not self.is_frozen:
+            raise TypeError("unhashable type: 'Vector' (only frozen vectors are hashable, see freeze()).")
+        return self._cached("hash", lambda: hash(tuple(self._values())))
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        return iter(self._values())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length)
+            length = len(range(start, stop, step))
+            return Vector._from_buffer(
+                self._buffer, length,
+                offset=self._offset + start * self._stride,
+                stride=self._stride * step,
+                base=self.base if self.base is not None else self,
+            )
+        return self._buffer[self._index(index)]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            view = self[index]
+            values = list(value)
+            if len(values) != view.length:
+                raise ValueError(f"Cannot assign {len(values)} values to a slice of length {view.length}.")
+            for i, element in enumerate(values):
+                view[i] = element
+            return
+        linalgvalidator.validate_data_is_scalar(value)
+        self._check_writable()
+        self._buffer[self._index(index)] = value
+        self._bump_version()
+
     def __add__(self, other):
         return self.add(other)
-    
+
     def __sub__(self, other):
         return self.substract(other)
-    
+
     def __mul__(self, other):
         linalgvalidator.validate_data_is_scalar(other)
         return self.scalar_multiply(other)
-    
 
-    def __rmul__(self, other):
-        return self.__mul__(other)
+    def __iadd__(self, other):
+        return self.add(other, out=self)
 
+    def __isub__(self, other):
+        return self.substract(other, out=self)
 
+    def __imul__(self, other):
+        return self.scalar_multiply(other, out=self)
 
 
-        
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
 
 
+# BUFFER HELPERS
+def _validate_size(size):
+    if not isinstance(size, int) or isinstance(size, bool) or size < 0:
+        raise ValueError(f"Sizes must be non-negative integers, got {size!r}.")
+
+
+def _as_double_buffer(buffer):
+    """
+    Return `buffer` itself if it already holds doubles, else a copy as an `array('d')`.
+    """
+    if isinstance(buffer, array) and buffer.typecode == "d":
+        return buffer
+    if isinstance(buffer, memoryview) and buffer.format == "d" and buffer.ndim == 1:
+        return buffer
+    return array("d", buffer)
+
+
+def _strided_slice(buffer, start, length, step):
+    """
+    Copy `length` elements of `buffer` read from `start` every `step` positions.
+    """
+    if length == 0:
+        return buffer[0:0]
+    stop = start + length * step
+    if stop < 0:
+        stop = None
+    return buffer[start:stop:step]
+
+
+def _detached(values):
+    # Slicing an array copies it, slicing a memoryview (from_flat, mmap) does not and
+    # may leave it strided: reads must be contiguous and unaffected by later writes
+    return values if isinstance(values, array) else array("d", values.tobytes())
+
+
+def _strided_assign(buffer, start, length, step, values):
+    """
+    Write `length` values into `buffer` from `start` every `step` positions.
+    """
+    if length == 0:
+        return
+    stop = start + length * step
+    if stop < 0:
+        stop = None
+    buffer[start:stop:step] = values
+
+
+def _owner(obj):
+    """
+    Return the object owning the buffer of a Vector or a Matrix (its base, or itself).
+    """
+    return obj.base if obj.base is not None else obj
+
+
+def _same_values(values1, values2):
+    """
+    Compare two buffers element-wise, whatever their concrete type.
+    """
+    if type(values1) is type(values2):
+        return values1 == values2
+    return list(values1) == list(values2)
@@ -0,0 +1,251 @@
+"""
+Benchmark the core Vector/Matrix operations over a sweep of sizes, and detect regressions.
+
+Every benchmark reports operations per second (best of several timed rounds) and the
+peak memory allocated by one call (measured separately with tracemalloc).
+
+Usage:
+    python benchmarks/bench_algebra.py                        # run and print the results
+    python benchmarks/bench_algebra.py --save                 # ... and store them as the baseline
+    python benchmarks/bench_algebra.py --compare              # ... and fail if slower or bigger than the baseline
+    python benchmarks/bench_algebra.py --compare --threshold 0.3 --memory-threshold 0.5 --only dot add --sizes 32 128
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from algebra.augmented_matrices import AugmentedMatrix
+from algebra.matrices import Matrix
+from algebra.validator import LinearAlgebraValidator as linalgvalidator
+from algebra.vector_sets import VectorSet
+from algebra.vectors import Vector
+from config.paths import BENCHMARK_BASELINE_FILE
+
+SIZES = [16, 64, 256]
+
+# A run fails when an operation is slower than (1 - THRESHOLD) × its baseline speed.
+THRESHOLD = 0.2
+
+# A run fails when an operation allocates more than (1 + MEMORY_THRESHOLD) × its baseline
+# peak memory, plus MEMORY_SLACK bytes so that tiny peaks do not fail on allocator noise.
+MEMORY_THRESHOLD = 0.2
+MEMORY_SLACK = 1024
+
+# Number of vectors of the batched benchmarks.
+BATCH_SIZE = 64
+
+# Minimum duration of one timed round (the operation is repeated until it is reached).
+MIN_ROUND_TIME = 0.05
+
+
+# --------------------
+# BENCHMARKS
+# --------------------
+# Each benchmark takes a size n and a random generator, prepares its inputs (not timed)
+# and returns the function to time.
+
+def bench_construction(n, rng):
+    rows = random_rows(n, rng)
+    return lambda: Matrix(rows)
+
+
+def bench_validation(n, rng):
+    rows = random_rows(n, rng)
+    return lambda: linalgvalidator.validate_data_is_valid_matrix(rows, policy="full")
+
+
+def bench_transpose(n, rng):
+    A = Matrix(random_rows(n, rng))
+    return lambda: A.transpose().copy()
+
+
+def bench_add(n, rng):
+    A, B = Matrix(random_rows(n, rng)), Matrix(random_rows(n, rng))
+    return lambda: A.add(B)
+
+
+def bench_dot(n, rng):
+    A, B = Matrix(random_rows(n, rng)), Matrix(random_rows(n, rng))
+    return lambda: A.dot(B, workers=1)
+
+
+def bench_apply_to_vector(n, rng):
+    A, v = Matrix(random_rows(n, rng)), Vector(random_rows(1, rng, n)[0])
+    return lambda: A.apply_to_vector(v)
+
+
+def bench_apply_to_vectors(n, rng):
+    A = Matrix(random_rows(n, rng))
+    batch = VectorSet([Vector(row) for row in random_rows(BATCH_SIZE, rng, n)])
+    return lambda: A.apply_to_vectors(batch, packed=True)
+
+
+def bench_augmented(n, rng):
+    A, b = Matrix(random_rows(n, rng)), Vector(random_rows(1, rng, n)[0])
+    return lambda: AugmentedMatrix(A, b).data
+
+
+BENCHMARKS = {
+    "construction": bench_construction,
+    "validation": bench_validation,
+    "transpose": bench_transpose,
+    "add": bench_add,
+    "dot": bench_dot,
+    "apply_to_vector": bench_apply_to_vector,
+    "apply_to_vectors": bench_apply_to_vectors,
+    "augmented": bench_augmented,
+}
+
+
+def random_rows(m, rng, n=None):
+    n = m if n is None else n
+    return [[rng.uniform(-1, 1) for _ in range(n)] for _ in range(m)]
+
+
+# --------------------
+# MEASURES
+# --------------------
+
+def measure(function, repeat=3, min_round_time=MIN_ROUND_TIME):
+    """
+    Time a function and measure the peak memory allocated by one call.
+
+    Returns
+    -------
+    dict
+        "ops_per_sec": the best rate over `repeat` rounds of at least `min_round_time` seconds,
+        "peak_bytes": the peak traced allocation of one call.
+    """
+    calls, elapsed = 1, 0.0
+    while True:
+        elapsed = _round(function, calls)
+        if elapsed >= min_round_time:
+            break
+        calls = calls * 2 if elapsed == 0 else max(calls * 2, int(calls * min_round_time / elapsed) + 1)
+    best = min([elapsed] + [_round(function, calls) for _ in range(repeat - 1)])
+
+    tracemalloc.start()
+    try:
+        function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {"ops_per_sec": calls / best, "peak_bytes": peak}
+
+
+def _round(function, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return time.perf_counter() - start
+
+
+def run(names=None, sizes=SIZES, repeat=3, seed=0, min_round_time=MIN_ROUND_TIME, report=print):
+    """
+    Run the benchmarks over the sizes.
+
+    Returns
+    -------
+    dict
+        {benchmark name: {size (str): {"ops_per_sec": ..., "peak_bytes": ...}}}
+    """
+    names = list(BENCHMARKS) if names is None else names
+    results = {}
+    for name in names:
+        if name not in BENCHMARKS:
+            raise ValueError(f"Unknown benchmark {name!r}, expected one of {list(BENCHMARKS)}.")
+        results[name] = {}
+        for n in sizes:
+            function = BENCHMARKS[name](n, random.Random(seed))
+            result = measure(function, repeat, min_round_time)
+            results[name][str(n)] = result
+            if report is not None:
+                report(f"{name:>16} {n:>6} {result['ops_per_sec']:>14.1f} {result['peak_bytes'] / 1024:>12.1f}")
+    return results
+
+
+def compare(results, baseline, threshold=THRESHOLD, memory_threshold=MEMORY_THRESHOLD):
+    """
+    Compare results with a baseline.
+
+    Returns
+    -------
+    list of str
+        One message per operation slower than (1 - threshold) × its baseline speed, and
+        one per operation whose peak memory exceeds (1 + memory_threshold) × its baseline
+        peak plus MEMORY_SLACK bytes (operations missing from the baseline are ignored).
+    """
+    regressions = []
+    for name, by_size in results.items():
+        for size, result in by_size.items():
+            reference = baseline.get(name, {}).get(size)
+            if reference is None:
+                continue
+            ratio = result["ops_per_sec"] / reference["ops_per_sec"]
+            if ratio < 1 - threshold:
+                regressions.append(
+                    f"{name} (n={size}): {result['ops_per_sec']:.1f} ops/s, "
+                    f"{(1 - ratio) * 100:.0f}% slower than the baseline ({reference['ops_per_sec']:.1f} ops/s)"
+                )
+            if "peak_bytes" in result and "peak_bytes" in reference:
+                peak, reference_peak = result["peak_bytes"], reference["peak_bytes"]
+                if peak > (1 + memory_threshold) * reference_peak + MEMORY_SLACK:
+                    regressions.append(
+                        f"{name} (n={size}): {peak / 1024:.1f} KiB peak memory, "
+                        f"more than the baseline ({reference_peak / 1024:.1f} KiB)"
+                    )
+    return regressions
+
+
+def load_baseline(path):
+    with open(path) as file:
+        return json.load(file)["results"]
+
+
+def save_baseline(results, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    document = {"python": sys.version.split()[0], "created": time.strftime("%Y-%m-%dT%H:%M:%S"), "results": results}
+    with open(path, "w") as file:
+        json.dump(document, file, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="benchmarks to run (default: all)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", default=BENCHMARK_BASELINE_FILE, help="baseline JSON file")
+    parser.add_argument("--save", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="fail if slower or bigger than the baseline")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="tolerated slowdown (0.2 = 20%%)")
+    parser.add_argument("--memory-threshold", type=float, default=MEMORY_THRESHOLD, help="tolerated peak memory increase (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    print(f"{'benchmark':>16} {'size':>6} {'ops/sec':>14} {'peak (KiB)':>12}")
+    results = run(args.only, args.sizes, args.repeat, args.seed)
+
+    status = 0
+    if args.compare:
+        regressions = compare(results, load_baseline(args.baseline), args.threshold, args.memory_threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            status = 1
+        else:
+            print(f"No regression beyond {args.threshold:.0%} (speed) and {args.memory_threshold:.0%} (memory) against {args.baseline}.")
+    if args.save:
+        save_baseline(results, args.baseline)
+        print(f"Baseline written to {args.baseline}.")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+Compare the blocked matrix multiply kernel (`kernels.matmul`) with the former row × column
+implementation.
+
+The kernel is timed directly: `Matrix.dot` may dispatch large products to Strassen-Winograd
+or to worker processes, which would mix other algorithms into the comparison.
+
+Usage:
+    python benchmarks/bench_matmul.py                 # sizes 64, 256 and 1024
+    python benchmarks/bench_matmul.py --sizes 64 256  # custom sizes
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from algebra import kernels
+from algebra.matrices import Matrix
+from algebra.validator import LinearAlgebraValidator as linalgvalidator
+
+
+def legacy_dot(A, B):
+    """
+    The former `Matrix.dot` on list-of-lists data: transpose B, validate every row and
+    column as a Vector, then compute m × p generator-based dot products.
+    """
+    linalgvalidator.validate_data_is_valid_matrix(B)
+    transposed = [list(col) for col in zip(*B)]
+    linalgvalidator.validate_data_is_valid_matrix(transposed)
+    for vector in A + transposed:
+        linalgvalidator.validate_data_is_list(vector)
+        linalgvalidator.validate_data_only_contains_scalars(vector)
+    result = [[sum(a * b for a, b in zip(row, col)) for col in transposed] for row in A]
+    linalgvalidator.validate_data_is_valid_matrix(result)
+    return result
+
+
+def random_matrix(n, rng):
+    return Matrix([[rng.uniform(-1, 1) for _ in range(n)] for _ in range(n)])
+
+
+def best_time(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 256, 1024])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'size':>6} {'legacy (s)':>12} {'blocked (s)':>12} {'speedup':>9}")
+    for n in args.sizes:
+        A, B = random_matrix(n, rng), random_matrix(n, rng)
+        A_rows, B_rows = A.data, B.data
+        repeat = args.repeat if n <= 256 else 1
+        legacy = best_time(lambda: legacy_dot(A_rows, B_rows), repeat)
+        blocked = best_time(lambda: kernels.matmul(A, B), repeat)
+        print(f"{n:>6} {legacy:>12.4f} {blocked:>12.4f} {legacy / blocked:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,3 +2,6 @@ import os
 
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 DATA_DIR = os.path.join(PROJECT_ROOT, "src", "datasets")
+CACHE_DIR = os.path.join(PROJECT_ROOT, ".cache")
+TUNING_FILE = os.path.join(CACHE_DIR, "tuning.json")
+BENCHMARK_BASELINE_FILE = os.path.join(CACHE_DIR, "benchmark_baseline.json")
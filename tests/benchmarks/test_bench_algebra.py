@@ -0,0 +1,60 @@
+import os
+import tempfile
+
+from benchmarks import bench_algebra
+
+
+def test_benchmarks_run_every_operation():
+    results = bench_algebra.run(sizes=[4], repeat=1, min_round_time=0.0, report=None)
+    assert list(results) == list(bench_algebra.BENCHMARKS)
+    for by_size in results.values():
+        assert by_size["4"]["ops_per_sec"] > 0
+        assert by_size["4"]["peak_bytes"] >= 0
+
+
+def test_benchmark_compare_detects_regressions():
+    baseline = {"dot": {"64": {"ops_per_sec": 100.0, "peak_bytes": 0}}}
+    assert bench_algebra.compare({"dot": {"64": {"ops_per_sec": 85.0}}}, baseline, threshold=0.2) == []
+    assert len(bench_algebra.compare({"dot": {"64": {"ops_per_sec": 70.0}}}, baseline, threshold=0.2)) == 1
+    assert bench_algebra.compare({"add": {"64": {"ops_per_sec": 1.0}}}, baseline) == []
+
+
+def test_benchmark_compare_detects_memory_regressions():
+    baseline = {"dot": {"64": {"ops_per_sec": 100.0, "peak_bytes": 100_000}}}
+    assert bench_algebra.compare({"dot": {"64": {"ops_per_sec": 100.0, "peak_bytes": 110_000}}}, baseline) == []
+    regressions = bench_algebra.compare({"dot": {"64": {"ops_per_sec": 100.0, "peak_bytes": 200_000}}}, baseline)
+    assert len(regressions) == 1 and "peak memory" in regressions[0]
+    assert bench_algebra.compare({"dot": {"64": {"ops_per_sec": 100.0, "peak_bytes": 200_000}}}, baseline, memory_threshold=1.5) == []
+
+
+def test_benchmark_baseline_round_trip():
+    results = bench_algebra.run(["add"], sizes=[4], repeat=1, min_round_time=0.0, report=None)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "baseline.json")
+        bench_algebra.save_baseline(results, path)
+        assert bench_algebra.load_baseline(path) == results
+
+
+def test_benchmark_main_exit_status():
+    arguments = ["--only", "add", "--sizes", "4", "--repeat", "1", "--compare"]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "baseline.json")
+        # A baseline no machine can reach is a regression, a baseline every machine beats is not
+        bench_algebra.save_baseline({"add": {"4": {"ops_per_sec": 1e15, "peak_bytes": 0}}}, path)
+        assert bench_algebra.main(arguments + ["--baseline", path]) == 1
+        bench_algebra.save_baseline({"add": {"4": {"ops_per_sec": 1e-9, "peak_bytes": 1e15}}}, path)
+        assert bench_algebra.main(arguments + ["--baseline", path]) == 0
+        # Fast enough, but a 32 × 32 sum allocates more than MEMORY_SLACK over a baseline of no allocation
+        arguments = ["--only", "add", "--sizes", "32", "--repeat", "1", "--compare"]
+        bench_algebra.save_baseline({"add": {"32": {"ops_per_sec": 1e-9, "peak_bytes": 0}}}, path)
+        assert bench_algebra.main(arguments + ["--baseline", path]) == 1
+
+
+if __name__ == '__main__':
+    test_benchmarks_run_every_operation()
+    test_benchmark_compare_detects_regressions()
+    test_benchmark_compare_detects_memory_regressions()
+    test_benchmark_baseline_round_trip()
+    test_benchmark_main_exit_status()
+
+    print("All tests passed. ✅")
@@ -0,0 +1,66 @@
+from algebra.chains import multi_dot, plan_chain
+from algebra.matrices import Matrix
+from algebra.sparse import SparseMatrix
+from algebra.structured import DiagonalMatrix
+from algebra.vectors import Vector
+
+A = Matrix([[1, 2], [3, 4], [5, 6]])          # 3 × 2
+B = Matrix([[1, 0, 2, 1], [0, 1, 1, 3]])      # 2 × 4
+C = Matrix([[1], [2], [0], [1]])              # 4 × 1
+v = Vector([1, -1])
+
+def test_plan_chooses_cheapest_order():
+    plan = plan_chain([Matrix.zeros((10, 100)), Matrix.zeros((100, 5)), Matrix.zeros((5, 50))])
+    assert plan.order == ((0, 1), 2)
+    assert plan.flops == 2 * (10 * 100 * 5 + 10 * 5 * 50)
+    plan = plan_chain([Matrix.zeros((50, 5)), Matrix.zeros((5, 100)), Matrix.zeros((100, 10))])
+    assert plan.order == (0, (1, 2))
+    assert plan.parenthesization() == "(A0 (A1 A2))"
+    assert plan.naive_flops == 2 * (50 * 5 * 100 + 50 * 100 * 10)
+    assert plan.speedup > 1
+
+def test_plan_vector_is_a_column():
+    X = Matrix.zeros((1000, 100))
+    plan = plan_chain([X.transpose(), X, Matrix.zeros((100, 100)), Vector.zeros(100)])
+    assert plan.order == (0, (1, (2, 3)))
+    assert plan.shapes[-1] == (100, 1)
+    assert plan.flops == 2 * (100 * 100 + 1000 * 100 + 100 * 1000)
+
+def test_multi_dot_matches_left_to_right():
+    assert multi_dot([A, B, C]) == A @ B @ C
+    assert multi_dot([A, B, B.transpose()]) == A @ B @ B.transpose()
+    assert multi_dot([A.transpose(), A, v]) == A.transpose() @ A @ v
+    assert isinstance(multi_dot([A, v]), Vector)
+
+def test_multi_dot_returns_plan():
+    result, plan = multi_dot([A, B, C], return_plan=True)
+    assert result == A @ B @ C
+    assert plan.order == (0, (1, 2))
+    assert str(plan).startswith("(A0 (A1 A2))")
+
+def test_multi_dot_single_operand_is_a_copy():
+    result = multi_dot([A])
+    assert result == A and result is not A
+
+def test_multi_dot_structured_operands():
+    D = DiagonalMatrix([2, 3])
+    assert multi_dot([A, D, SparseMatrix([[1, 0], [0, 1]]), v]) == A @ Matrix([[2, 0], [0, 3]]) @ v
+
+def test_multi_dot_errors():
+    for operands, error in (([], ValueError), ([A, A], ValueError), ([v, A], ValueError), ([A, [1, 2]], TypeError)):
+        try:
+            multi_dot(operands)
+            assert False
+        except error:
+            assert True
+
+
+if __name__ == '__main__':
+    test_plan_chooses_cheapest_order()
+    test_plan_vector_is_a_column()
+    test_multi_dot_matches_left_to_right()
+    test_multi_dot_returns_plan()
+    test_multi_dot_single_operand_is_a_copy()
+    test_multi_dot_structured_operands()
+    test_multi_dot_errors()
+    print("All tests passed. ✅")
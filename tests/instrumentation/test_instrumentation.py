@@ -0,0 +1,117 @@
+from algebra import instrumentation
+from algebra.augmented_matrices import AugmentedMatrix
+from algebra.instrumentation import add_hook, profile, remove_hook
+from algebra.matrices import Matrix
+from algebra.validator import LinearAlgebraValidator
+from algebra.vectors import Vector
+
+
+def test_instrumentation_is_off_by_default():
+    assert not instrumentation.is_enabled()
+    assert Matrix.__dict__["dot"].__module__ == "algebra.matrices"
+
+
+def test_profile_records_operations():
+    A, B = Matrix([[1, 2], [3, 4], [5, 6]]), Matrix([[1, 0, 2], [0, 1, 3]])
+    with profile() as p:
+        A.dot(B)
+        A.dot(B)
+        A.transpose()
+    assert not instrumentation.is_enabled()
+    assert Matrix.__dict__["dot"].__module__ == "algebra.matrices"
+
+    dot = p.stats["Matrix.dot"]
+    assert dot["calls"] == 2
+    assert dot["elements"] == 18
+    assert dot["shapes"] == {((3, 2), (2, 3)): 2}
+    assert dot["time"] >= dot["validation_time"] > 0
+    assert p.stats["Matrix.transpose"]["elements"] == 0
+    assert p.validation_time > 0
+    assert "Matrix.dot" in p.report()
+
+
+def test_validation_time_is_not_counted_twice():
+    v, w = Vector([1, 2]), Vector([3, 4])
+    with profile() as p:
+        v.cosine_similarity(w)
+        LinearAlgebraValidator.validate_vector_has_non_null_magnitude(v)
+    cosine = p.stats["Vector.cosine_similarity"]
+    assert cosine["calls"] == 1
+    assert p.stats["Vector.magnitude"]["calls"] == 3
+    assert cosine["validation_time"] <= cosine["time"]
+    total = sum(stats["validation_time"] for name, stats in p.stats.items() if name.startswith("LinearAlgebraValidator."))
+    assert abs(total - p.validation_time) < 1e-12
+
+
+def test_hook_api():
+    events = []
+    add_hook(events.append)
+    try:
+        Vector([1, 2, 3]).scalar_multiply(2)
+    finally:
+        remove_hook(events.append)
+    Vector([1, 2]).scalar_multiply(2)
+
+    operations = [event["operation"] for event in events]
+    assert operations.count("Vector.__init__") == 1
+    assert "Vector.scalar_multiply" in operations
+    assert "LinearAlgebraValidator.validate_data_is_list" in operations
+    construction = events[operations.index("Vector.__init__")]
+    assert construction["elements"] == 3 and construction["validation_time"] > 0
+
+
+def test_out_results_are_not_counted_as_allocated():
+    v = Vector([1, 2])
+    with profile() as p:
+        v.add(v, out=v)
+    assert p.stats["Vector.add"]["elements"] == 0
+
+
+def test_instrumentation_keeps_behaviour():
+    with profile():
+        assert Matrix([[2, 0], [0, 4]]).solve(Vector([2, 4])) == Vector([1, 1])
+        try:
+            Vector([1, 2]).add(Vector([1]))
+            assert False
+        except ValueError:
+            assert True
+    assert LinearAlgebraValidator.get_policy() == "full"
+
+
+def test_instrument_rejects_inherited_methods():
+    try:
+        instrumentation.instrument(AugmentedMatrix, "add")
+        assert False
+    except AttributeError:
+        assert True
+    assert (AugmentedMatrix, "add") not in instrumentation.OPERATIONS
+    with profile() as p:
+        Matrix([[1]]).add(Matrix([[1]]))
+    assert p.stats["Matrix.add"]["calls"] == 1
+
+
+def test_failed_install_restores_every_method():
+    dot = Matrix.__dict__["dot"]
+    instrumentation.OPERATIONS.append((Matrix, "no_such_method"))
+    try:
+        with profile():
+            assert False
+    except KeyError:
+        assert True
+    finally:
+        instrumentation.OPERATIONS.remove((Matrix, "no_such_method"))
+    assert Matrix.__dict__["dot"] is dot
+    assert not instrumentation.is_enabled()
+
+
+if __name__ == '__main__':
+    test_instrumentation_is_off_by_default()
+    test_profile_records_operations()
+    test_validation_time_is_not_counted_twice()
+    test_hook_api()
+    test_out_results_are_not_counted_as_allocated()
+    test_instrumentation_keeps_behaviour()
+    test_instrument_rejects_inherited_methods()
+    test_failed_install_restores_every_method()
+
+    print("All tests passed. ✅")
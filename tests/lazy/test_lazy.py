@@ -0,0 +1,50 @@
+from algebra import lazy
+from algebra.matrices import Matrix
+from algebra.vectors import Vector
+
+A = Matrix([[1, 2], [3, 4]])
+B = Matrix([[5, 6], [7, 8]])
+C = Matrix([[1, 1], [1, 1]])
+
+def test_lazy_chain_matches_eager_chain():
+    expression = A.lazy().add(B).substract(C).scalar_multiply(0.5)
+    assert expression.evaluate() == A.add(B).substract(C).scalar_multiply(0.5)
+
+def test_lazy_operators():
+    assert ((A.lazy() + B - C) * 0.5).evaluate() == Matrix([[2.5, 3.5], [4.5, 5.5]])
+    assert (2 * (-A.lazy())).evaluate() == A.scalar_multiply(-2)
+
+def test_lazy_vectors():
+    v, w = Vector([1, 2]), Vector([3, 4])
+    assert (v.lazy() - w + v).evaluate() == Vector([-1, 0])
+
+def test_lazy_common_subexpressions_are_shared():
+    total = A.lazy() + B
+    expression = total + total * 2
+    inputs, scalars = [], []
+    lazy._compile(expression, inputs, scalars)
+    assert len(inputs) == 2
+    assert expression.evaluate() == A.add(B).scalar_multiply(3)
+
+def test_lazy_products():
+    v = Vector([1, -1])
+    assert (A.lazy() @ B + C).evaluate() == (A @ B).add(C)
+    assert (A.lazy().add(B) @ v).evaluate() == A.add(B) @ v
+
+def test_lazy_shape_mismatch():
+    try:
+        A.lazy() + Matrix([[1, 2, 3]])
+        assert False
+    except ValueError:
+        assert True
+
+
+if __name__ == '__main__':
+    test_lazy_chain_matches_eager_chain()
+    test_lazy_operators()
+    test_lazy_vectors()
+    test_lazy_common_subexpressions_are_shared()
+    test_lazy_products()
+    test_lazy_shape_mismatch()
+
+    print("All tests passed. ✅")
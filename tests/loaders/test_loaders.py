@@ -0,0 +1,104 @@
+import os
+import tempfile
+
+from algebra import serialization
+from algebra.loaders import iter_csv_blocks, load_csv
+from algebra.matrices import Matrix
+
+
+def _write(directory, name, content):
+    path = os.path.join(directory, name)
+    with open(path, "w") as file:
+        file.write(content)
+    return path
+
+
+def test_load_csv_with_header():
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write(directory, "data.csv", "x,y,z\n1,2,3\n4.5,-5,6e1\n")
+        assert load_csv(path) == Matrix([[1, 2, 3], [4.5, -5, 60]])
+
+
+def test_load_csv_without_header():
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write(directory, "data.csv", "1,2\n3,4\n")
+        assert load_csv(path) == Matrix([[1, 2], [3, 4]])
+        assert load_csv(path, header=True) == Matrix([[3, 4]])
+
+
+def test_load_tsv_and_type_inference():
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write(directory, "data.tsv", "a\tflag\n1\ttrue\n2\tFalse\n")
+        assert load_csv(path) == Matrix([[1, 1], [2, 0]])
+
+
+def test_column_selection():
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write(directory, "data.csv", "id,x,y\nfirst,1,2\nsecond,3,4\n")
+        assert load_csv(path, columns=["y", "x"]) == Matrix([[2, 1], [4, 3]])
+        assert load_csv(path, columns=[-1], header=True) == Matrix([[2], [4]])
+        try:
+            load_csv(path)
+            assert False
+        except ValueError:
+            assert True
+
+
+def test_iter_csv_blocks():
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write(directory, "data.csv", "".join(f"{i},{2 * i}\n" for i in range(10)))
+        blocks = list(iter_csv_blocks(path, block_size=4))
+        assert [block.dims for block in blocks] == [[4, 2], [4, 2], [2, 2]]
+        assert blocks[2] == Matrix([[8, 16], [9, 18]])
+
+
+def test_load_csv_into_preallocated_buffer():
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write(directory, "data.csv", "1,2\n3,4\n\n5,6\n")
+        assert load_csv(path, rows=3) == Matrix([[1, 2], [3, 4], [5, 6]])
+        for rows in (2, 4):
+            try:
+                load_csv(path, rows=rows)
+                assert False
+            except ValueError:
+                assert True
+
+
+def test_load_csv_errors_report_line():
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write(directory, "data.csv", "1,2\n3,oops\n")
+        try:
+            load_csv(path)
+            assert False
+        except ValueError as error:
+            assert "line 2" in str(error)
+        path = _write(directory, "ragged.csv", "1,2\n3\n")
+        try:
+            list(iter_csv_blocks(path))
+            assert False
+        except ValueError:
+            assert True
+
+
+def test_relative_paths_use_data_dir():
+    original = serialization.DATA_DIR
+    with tempfile.TemporaryDirectory() as directory:
+        serialization.DATA_DIR = directory
+        try:
+            _write(directory, "data.csv", "1,2\n")
+            assert load_csv("data.csv") == Matrix([[1, 2]])
+        finally:
+            serialization.DATA_DIR = original
+
+
+if __name__ == '__main__':
+    test_load_csv_with_header()
+    test_load_csv_without_header()
+    test_load_tsv_and_type_inference()
+    test_column_selection()
+    test_iter_csv_blocks()
+    test_load_csv_into_preallocated_buffer()
+    test_load_csv_errors_report_line()
+    test_relative_paths_use_data_dir()
+
+    print("All tests passed. ✅")
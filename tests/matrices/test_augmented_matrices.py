@@ -19,7 +19,105 @@ def test_augmented_matrix_incompatible_dimensions():
     except ValueError:
         assert True
 
+def test_augmented_matrix_does_not_copy():
+    A = Matrix([[1, 2], 
+                [3, 4]])
+    Ab = AugmentedMatrix(A, Vector([5, 6]))
+    assert not Ab.is_materialized
+    assert Ab[1, 2] == 6
+    assert Ab.data == [[1, 2, 5], [3, 4, 6]]
+    assert Ab @ Matrix([[1], [1], [1]]) == Matrix([[8], [13]])
+    assert not Ab.is_materialized
+
+def test_augmented_matrix_several_right_hand_sides():
+    A = Matrix([[1, 2], 
+                [3, 4]])
+    B = Matrix([[5, 7], 
+                [6, 8]])
+    assert AugmentedMatrix(A, B) == AugmentedMatrix(A, [Vector([5, 6]), Vector([7, 8])])
+    assert AugmentedMatrix(A, B).dims == [2, 4]
+
+def test_augmented_matrix_copy_on_write():
+    A = Matrix([[1, 2], 
+                [3, 4]])
+    b = Vector([5, 6])
+    Ab = AugmentedMatrix(A, b)
+    Ab.add_scaled_row(1, 0, -3)
+    Ab.scale_row(1, -0.5)
+    Ab.swap_rows(0, 1)
+    assert Ab.is_materialized
+    assert Ab == Matrix([[0, 1, 4.5], [1, 2, 5]])
+    assert A == Matrix([[1, 2], [3, 4]])
+    assert b == Vector([5, 6])
+
+def test_augmented_matrix_reads_do_not_materialize():
+    A = Matrix([[1, 2], 
+                [3, 4]])
+    Ab = AugmentedMatrix(A, Vector([5, 6]))
+    assert Ab[1] == Vector([3, 4, 6])
+    assert Ab.column(2) == Vector([5, 6])
+    assert [row.data for row in Ab] == [[1, 2, 5], [3, 4, 6]]
+    assert Ab.transpose() == Matrix([[1, 3], [2, 4], [5, 6]])
+    assert Ab[:, 1:] == Matrix([[2, 5], [4, 6]])
+    assert not Ab.is_materialized
+    try:
+        Ab[0][0] = 10
+        assert False
+    except ValueError:
+        assert True
+    assert A == Matrix([[1, 2], [3, 4]])
+
+def test_augmented_matrix_solves_modified_system():
+    Ab = AugmentedMatrix(Matrix([[2, 0], [0, 4]]), Vector([2, 2]))
+    Ab[0, 0] = 1
+    assert Ab.solve() == Vector([2, 0.5])
+    Ab = AugmentedMatrix(Matrix([[2, 0], [0, 4]]), [Vector([2, 2]), Vector([4, 4])])
+    Ab[1, 3] = 8
+    assert Ab.solve() == [Vector([1, 0.5]), Vector([2, 2])]
+
+def test_augmented_matrix_slices_copy_requested_elements():
+    A = Matrix([[1, 2], 
+                [3, 4], 
+                [5, 6]])
+    Ab = AugmentedMatrix(A, Vector([7, 8, 9]))
+    assert Ab[0:1] == Matrix([[1, 2, 7]])
+    assert Ab[:, :1] == Matrix([[1], [3], [5]])
+    assert Ab[::-2, 1:] == Matrix([[6, 9], [2, 7]])
+    assert Ab.transpose()[2:, 1:] == Matrix([[8, 9]])
+    assert Ab[1:, 2:].is_frozen
+    assert not Ab.is_materialized
+
+def test_augmented_matrix_frozen_write_does_not_materialize():
+    Ab = AugmentedMatrix(Matrix([[1, 2], [3, 4]]), Vector([5, 6])).freeze()
+    try:
+        Ab[0, 0] = 10
+        assert False
+    except ValueError:
+        assert True
+    try:
+        Ab.swap_rows(0, 1)
+        assert False
+    except ValueError:
+        assert True
+    assert not Ab.is_materialized
+
+def test_augmented_matrix_solve_rejects_right_hand_side():
+    Ab = AugmentedMatrix(Matrix([[2, 0], [0, 4]]), Vector([2, 2]))
+    try:
+        Ab.solve(Vector([1, 1]))
+        assert False
+    except TypeError:
+        assert True
+
 if __name__ == '__main__':
     test_augmented_matrix_compatible_dimensions()
     test_augmented_matrix_incompatible_dimensions()
+    test_augmented_matrix_does_not_copy()
+    test_augmented_matrix_several_right_hand_sides()
+    test_augmented_matrix_copy_on_write()
+    test_augmented_matrix_reads_do_not_materialize()
+    test_augmented_matrix_solves_modified_system()
+    test_augmented_matrix_slices_copy_requested_elements()
+    test_augmented_matrix_frozen_write_does_not_materialize()
+    test_augmented_matrix_solve_rejects_right_hand_side()
     print("All tests passed. ✅")
\ No newline at end of file
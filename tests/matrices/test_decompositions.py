@@ -0,0 +1,87 @@
+from algebra.augmented_matrices import AugmentedMatrix
+from algebra.matrices import Matrix
+from algebra.vectors import Vector
+
+def assert_close(values1, values2):
+    assert all(abs(a - b) < 1e-9 for a, b in zip(values1, values2))
+
+def test_lu_factors():
+    A = Matrix([[1, 2, 0], [3, 4, 4], [5, 6, 3]])
+    lu = A.lu()
+    n = 3
+    L = Matrix([[lu.lu[i, j] if j < i else float(i == j) for j in range(n)] for i in range(n)])
+    U = Matrix([[lu.lu[i, j] if j >= i else 0.0 for j in range(n)] for i in range(n)])
+    PA = Matrix([A.row(p).data for p in lu.permutation])
+    assert_close((L @ U)._row_major(), PA._row_major())
+
+def test_lu_inplace():
+    A = Matrix([[0, 1], [2, 3]])
+    lu = A.lu(inplace=True)
+    assert lu.lu is A
+    assert A == Matrix([[2, 3], [0, 1]])
+
+def test_solve():
+    A = Matrix([[2, 1, 1], [1, 3, 2], [1, 0, 0]])
+    b = Vector([4, 5, 6])
+    x = A.solve(b)
+    assert_close((A @ x).data, b.data)
+
+def test_solve_reuses_cached_factors():
+    A = Matrix([[4, 3], [6, 3]])
+    A.solve(Vector([1, 2]))
+    lu = A._cached_lu()
+    solutions = A.solve_many([Vector([1, 0]), Vector([0, 1])])
+    assert A._cached_lu() is lu
+    assert_close(solutions[0].data, [-0.5, 1])
+    A[0, 0] = 1
+    assert A._cached_lu() is not lu
+
+def test_determinant_and_inverse():
+    A = Matrix([[4, 3], [6, 3]])
+    assert abs(A.determinant() - (-6)) < 1e-12
+    assert_close(A.inverse()._row_major(), [-0.5, 0.5, 1, -2 / 3])
+
+def test_singular_matrix():
+    A = Matrix([[1, 2], [2, 4]])
+    try:
+        A.solve(Vector([1, 1]))
+        assert False
+    except ValueError:
+        assert True
+    try:
+        A.inverse()
+        assert False
+    except ValueError:
+        assert True
+
+def test_singular_matrix_determinant():
+    assert Matrix([[1, 2], [2, 4]]).determinant() == 0.0
+    assert Matrix([[0, 1, 2], [0, 3, 4], [0, 5, 6]]).determinant() == 0.0
+    lu = Matrix([[1, 2, 3], [2, 4, 6], [1, 0, 1]]).lu()
+    assert lu.is_singular and lu.determinant() == 0.0
+    assert not Matrix([[4, 3], [6, 3]]).lu().is_singular
+
+def test_solve_non_square_matrix():
+    try:
+        Matrix([[1, 2, 3], [2, 4, 5]]).solve(Vector([1, 1]))
+        assert False
+    except ValueError:
+        assert True
+
+def test_augmented_matrix_solve():
+    A = Matrix([[2, 0], [0, 4]])
+    assert AugmentedMatrix(A, Vector([2, 2])).solve() == Vector([1, 0.5])
+
+
+if __name__ == '__main__':
+    test_lu_factors()
+    test_lu_inplace()
+    test_solve()
+    test_solve_reuses_cached_factors()
+    test_determinant_and_inverse()
+    test_singular_matrix()
+    test_singular_matrix_determinant()
+    test_solve_non_square_matrix()
+    test_augmented_matrix_solve()
+
+    print("All tests passed. ✅")
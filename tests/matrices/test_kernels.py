@@ -0,0 +1,27 @@
+from algebra import kernels
+from algebra.matrices import Matrix
+
+def naive_product(A, B):
+    return [[sum(a * b for a, b in zip(row, col)) for col in zip(*B)] for row in A]
+
+def test_matmul_with_partial_tiles():
+    A = [[i * 5 + j for j in range(5)] for i in range(3)]
+    B = [[(i - j) % 4 for j in range(3)] for i in range(5)]
+    result = kernels.matmul(Matrix(A), Matrix(B), block_size=2)
+    assert result.tolist() == [value for row in naive_product(A, B) for value in row]
+
+def test_matmul_on_transposed_views():
+    A = Matrix([[1, 2, 3], [4, 5, 6]])
+    result = kernels.matmul(A.transpose(), A, block_size=2)
+    assert result.tolist() == [value for row in naive_product(A.transpose().data, A.data) for value in row]
+
+def test_sumprod():
+    assert kernels.sumprod([1, 2, 3], [4, 5, 6]) == 32
+
+
+if __name__ == '__main__':
+    test_matmul_with_partial_tiles()
+    test_matmul_on_transposed_views()
+    test_sumprod()
+
+    print("All tests passed. ✅")
@@ -1,3 +1,5 @@
+from array import array
+
 from algebra.matrices import Matrix
 from algebra.vectors import Vector
 
@@ -100,6 +102,198 @@ def test_matrix_matmul_operator_with_vector_invalid():
     except TypeError:
         assert True
 
+def test_matrix_transpose_is_a_view():
+    X = Matrix([[0, 1, 2], [0, 3, 5]])
+    X_T = X.transpose()
+    X[0, 1] = 7
+    assert X_T[1, 0] == 7
+    assert X_T.base is X
+
+def test_matrix_row_and_column_views():
+    X = Matrix([[0, 1, 2], [0, 3, 5]])
+    assert X.row(1) == Vector([0, 3, 5])
+    assert X.column(2) == Vector([2, 5])
+    X.column(0)[1] = 4
+    assert X.data == [[0, 1, 2], [4, 3, 5]]
+
+def test_matrix_slicing():
+    X = Matrix([[0, 1, 2], [0, 3, 5], [6, 7, 8]])
+    assert X[1:, 1:] == Matrix([[3, 5], [7, 8]])
+    assert X[::2, 0] == Vector([0, 6])
+    assert X[2] == Vector([6, 7, 8])
+    assert X[2, -1] == 8
+
+def test_matrix_operations_on_views():
+    X = Matrix([[1, 2], [3, 4]])
+    assert X.transpose().add(X) == Matrix([[2, 5], [5, 8]])
+    assert X.transpose() @ X == Matrix([[10, 14], [14, 20]])
+
+def test_matrix_operations_with_out():
+    A = Matrix([[1, 2], [3, 4]])
+    B = Matrix([[5, 6], [7, 8]])
+    out = Matrix([[0, 0], [0, 0]])
+    assert A.add(B, out=out) is out
+    assert out == Matrix([[6, 8], [10, 12]])
+    A.scalar_multiply(2, out=out.transpose())
+    assert out == Matrix([[2, 6], [4, 8]])
+
+def test_matrix_dot_with_aliased_out():
+    A = Matrix([[1, 2], [3, 4]])
+    B = Matrix([[5, 6], [7, 8]])
+    assert A.dot(B, out=A) is A
+    assert A == Matrix([[19, 22], [43, 50]])
+    B.dot(B.transpose(), out=B)
+    assert B == Matrix([[61, 83], [83, 113]])
+
+def test_matrix_out_with_wrong_shape():
+    A = Matrix([[1, 2, 3]])
+    try:
+        A.dot(A.transpose(), out=A)
+        assert False
+    except ValueError:
+        assert True
+
+def test_matrix_inplace_operators():
+    A = Matrix([[1, 2], [3, 4]])
+    alias = A
+    A += Matrix([[1, 1], [1, 1]])
+    A -= Matrix([[0, 1], [0, 1]])
+    A *= 2
+    assert A is alias
+    assert A == Matrix([[4, 4], [8, 8]])
+
+
+def test_matrix_freeze_blocks_writes():
+    A = Matrix([[1, 2], [3, 4]]).freeze()
+    for write in (
+        lambda: A.__setitem__((0, 0), 5),
+        lambda: A.row(1).__setitem__(0, 5),
+        lambda: A.transpose().__setitem__((1, 0), 5),
+        lambda: A.swap_rows(0, 1),
+        lambda: A.add(A, out=A),
+        lambda: A.lu(inplace=True),
+    ):
+        try:
+            write()
+            assert False
+        except ValueError:
+            assert True
+    assert A == Matrix([[1, 2], [3, 4]])
+    assert not A.copy().is_frozen
+
+
+def test_matrix_freeze_caches_derived_quantities():
+    A = Matrix([[3, 4], [0, 2]]).freeze()
+    assert A.transpose() is A.transpose()
+    assert A.row_norms() is A.row_norms() and A.row_norms() == Vector([5, 2])
+    assert A.norm() == 29 ** 0.5
+    assert A._cached_lu() is A._cached_lu()
+    assert hash(A) == hash(Matrix([[3, 4], [0, 2]]).freeze())
+    assert {A: "cached"}[Matrix([[3, 4], [0, 2]]).freeze()] == "cached"
+    try:
+        hash(Matrix([[1]]))
+        assert False
+    except TypeError:
+        assert True
+
+
+def test_matrix_unfreeze_invalidates_cache():
+    A = Matrix([[3, 4], [0, 2]]).freeze()
+    norms, lu = A.row_norms(), A._cached_lu()
+    A.unfreeze()
+    A[1, 1] = 1
+    A.freeze()
+    assert A.row_norms() == Vector([5, 1]) and A.row_norms() is not norms
+    assert A._cached_lu() is not lu
+    assert A.solve(Vector([1, 1])) == Vector([-1, 1])
+
+
+def test_matrix_bulk_constructors():
+    assert Matrix.zeros((2, 3)) == Matrix([[0, 0, 0], [0, 0, 0]])
+    assert Matrix.ones((1, 2)) == Matrix([[1, 1]])
+    assert Matrix.full((2, 1), 7) == Matrix([[7], [7]])
+    assert Matrix.identity(3) == Matrix([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+    assert Matrix.from_flat([1, 2, 3, 4, 5, 6], (2, 3)) == Matrix([[1, 2, 3], [4, 5, 6]])
+    assert Matrix.from_iter((i, i + 1) for i in range(3)) == Matrix([[0, 1], [1, 2], [2, 3]])
+    assert Matrix.random((4, 5), seed=1) == Matrix.random((4, 5), seed=1)
+    assert all(2 <= x < 3 for x in Matrix.random((3, 3), seed=0, low=2, high=3)._row_major())
+
+
+def test_matrix_from_flat_shares_array_buffer():
+    buffer = array("d", [1, 2, 3, 4])
+    A = Matrix.from_flat(buffer, (2, 2))
+    buffer[0] = 9
+    assert A[0, 0] == 9
+    try:
+        Matrix.from_flat(buffer, (3, 2))
+        assert False
+    except ValueError:
+        assert True
+
+
+def test_matrix_memoryview_buffer_row_operations():
+    A = Matrix.from_flat(memoryview(array("d", [1, 2, 3, 4])), (2, 2))
+    A.swap_rows(0, 1)
+    assert A == Matrix([[3, 4], [1, 2]])
+    B = Matrix.from_flat(memoryview(array("d", [0, 2, 3, 4])), (2, 2))
+    lu = B.lu(inplace=True)
+    assert lu.determinant() == -6
+    assert lu.solve(Vector([2, 7])) == Vector([1, 1])
+
+
+def test_matrix_bulk_constructor_checks():
+    for build in (lambda: Matrix.zeros((2, -1)), lambda: Matrix.ones(3), lambda: Matrix.from_iter([[1, 2], [3]])):
+        try:
+            build()
+            assert False
+        except ValueError:
+            assert True
+
+
+def test_matrix_has_no_instance_dict():
+    try:
+        Matrix([[1]]).extra = 1
+        assert False
+    except AttributeError:
+        assert True
+
+
+def test_matrix_gram():
+    A = Matrix([[1, 2], [3, 4], [5, 6]])
+    assert A.gram() == A.transpose().dot(A)
+    assert A.gram(weights=Vector([1, 0, 2])) == Matrix([[51, 62], [62, 76]])
+    assert A.gram(center=True) == Matrix([[8, 8], [8, 8]])
+
+
+def test_matrix_covariance():
+    A = Matrix([[1, 2], [3, 6]])
+    assert A.covariance() == Matrix([[2, 4], [4, 8]])
+    assert A.covariance(ddof=0) == Matrix([[1, 2], [2, 4]])
+    assert A.covariance(weights=Vector([3, 1])) == Matrix([[1, 2], [2, 4]])
+
+
+def test_matrix_apply_to_vectors():
+    A = Matrix([[1, 2], [3, 4], [5, 6]])
+    vectors = [Vector([1, 0]), Vector([0, 1]), Vector([1, -1])]
+    results = A.apply_to_vectors(v for v in vectors)
+    assert not isinstance(results, list)
+    assert list(results) == [A @ v for v in vectors]
+    packed = A.apply_to_vectors(vectors, packed=True)
+    assert (packed.count, packed.dim) == (3, 3)
+    assert packed.as_matrix() == Matrix([[1, 3, 5], [2, 4, 6], [-1, -1, -1]])
+    A.freeze()
+    assert list(A.apply_to_vectors(vectors)) == [A @ v for v in vectors]
+
+
+def test_matrix_apply_to_vectors_checks_lengths_lazily():
+    results = Matrix([[1, 2]]).apply_to_vectors(iter([Vector([1, 1]), Vector([1, 2, 3])]))
+    assert next(results) == Vector([3])
+    try:
+        next(results)
+        assert False
+    except ValueError:
+        assert True
+
 
 if __name__ == '__main__':
     test_matrix_creation()
@@ -119,6 +313,26 @@ if __name__ == '__main__':
     test_apply_to_vector_incompatible_dimensions()
     test_matrix_matmul_operator_with_vector()
     test_matrix_matmul_operator_with_vector_invalid()
+    test_matrix_transpose_is_a_view()
+    test_matrix_row_and_column_views()
+    test_matrix_slicing()
+    test_matrix_operations_on_views()
+    test_matrix_operations_with_out()
+    test_matrix_dot_with_aliased_out()
+    test_matrix_out_with_wrong_shape()
+    test_matrix_inplace_operators()
+    test_matrix_freeze_blocks_writes()
+    test_matrix_freeze_caches_derived_quantities()
+    test_matrix_unfreeze_invalidates_cache()
+    test_matrix_bulk_constructors()
+    test_matrix_from_flat_shares_array_buffer()
+    test_matrix_memoryview_buffer_row_operations()
+    test_matrix_bulk_constructor_checks()
+    test_matrix_has_no_instance_dict()
+    test_matrix_gram()
+    test_matrix_covariance()
+    test_matrix_apply_to_vectors()
+    test_matrix_apply_to_vectors_checks_lengths_lazily()
     
 
     print("All tests passed. ✅")
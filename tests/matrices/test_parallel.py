@@ -0,0 +1,52 @@
+from array import array
+
+from algebra import kernels, parallel
+from algebra.matrices import Matrix
+
+def test_parallel_matmul_matches_serial_kernel():
+    A = Matrix([[(i * 7 + j) % 5 for j in range(6)] for i in range(9)])
+    B = Matrix([[(i + j * 3) % 4 for j in range(4)] for i in range(6)])
+    try:
+        assert parallel.matmul(A, B, workers=2, threshold=0) == kernels.matmul(A, B)
+    finally:
+        parallel.shutdown()
+
+def test_parallel_matmul_on_views():
+    A = Matrix([[(i * 7 + j) % 5 for j in range(6)] for i in range(9)])
+    try:
+        product = parallel.matmul(A.transpose(), A, workers=2, threshold=0)
+        assert product == kernels.matmul(A.transpose(), A)
+    finally:
+        parallel.shutdown()
+
+def test_parallel_matmul_on_memoryview_column():
+    A = Matrix.from_flat(memoryview(array("d", range(12))), (4, 3))
+    v = A.column(1)[::2]
+    column = Matrix._from_buffer(v._values(), [v.length, 1])
+    try:
+        product = parallel.matmul(A[:, :2], column, workers=2, threshold=0)
+        assert product == kernels.matmul(A[:, :2], column)
+    finally:
+        parallel.shutdown()
+
+def test_small_products_stay_serial():
+    A = Matrix([[1, 2], [3, 4]])
+    assert A.dot(A, workers=4) == Matrix([[7, 10], [15, 22]])
+    assert parallel._pool["executor"] is None
+
+def test_invalid_number_of_workers():
+    try:
+        parallel.set_workers(0)
+        assert False
+    except ValueError:
+        assert True
+
+
+if __name__ == '__main__':
+    test_parallel_matmul_matches_serial_kernel()
+    test_parallel_matmul_on_views()
+    test_parallel_matmul_on_memoryview_column()
+    test_small_products_stay_serial()
+    test_invalid_number_of_workers()
+
+    print("All tests passed. ✅")
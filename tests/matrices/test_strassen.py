@@ -0,0 +1,66 @@
+import json
+import os
+import tempfile
+
+from algebra import kernels, strassen
+from algebra.matrices import Matrix
+
+def assert_close(values1, values2):
+    assert len(values1) == len(values2)
+    assert all(abs(a - b) < 1e-9 for a, b in zip(values1, values2))
+
+def test_strassen_square_power_of_two():
+    A = Matrix([[(i * 3 + j) % 7 for j in range(8)] for i in range(8)])
+    B = Matrix([[(i + j * 5) % 3 for j in range(8)] for i in range(8)])
+    assert_close(strassen.matmul(A, B, leaf_size=1), kernels.matmul(A, B))
+
+def test_strassen_odd_rectangular_shapes():
+    A = Matrix([[(i * 3 + j) % 7 - 3 for j in range(9)] for i in range(11)])
+    B = Matrix([[(i + j * 5) % 3 for j in range(7)] for i in range(9)])
+    assert_close(strassen.matmul(A, B, leaf_size=2), kernels.matmul(A, B))
+
+def test_strassen_on_views():
+    A = Matrix([[(i * 3 + j) % 7 for j in range(6)] for i in range(6)])
+    assert_close(strassen.matmul(A.transpose(), A[:, :], leaf_size=1), kernels.matmul(A.transpose(), A))
+
+def test_strassen_applicability():
+    assert strassen.is_applicable(512, 512, 512, leaf_size=256)
+    assert not strassen.is_applicable(256, 256, 256, leaf_size=256)
+    assert not strassen.is_applicable(300, 300, 300, leaf_size=256)
+    assert not strassen.is_applicable(511, 511, 511, leaf_size=256)
+    assert not strassen.is_applicable(2000, 300, 2000, leaf_size=256)
+
+def test_autotune_sets_leaf_size():
+    previous = strassen.get_leaf_size()
+    try:
+        result = strassen.autotune(size=8, candidates=(2, 4), save=False)
+        assert result["leaf_size"] in (2, 4, 8)
+        assert strassen.get_leaf_size() == result["leaf_size"]
+    finally:
+        strassen.set_leaf_size(previous)
+
+def test_tuned_leaf_size_is_validated():
+    previous = strassen.TUNING_FILE
+    with tempfile.TemporaryDirectory() as directory:
+        strassen.TUNING_FILE = os.path.join(directory, "tuning.json")
+        try:
+            for value, expected in ((64, 64), (0, None), (-8, None), (12.5, None), ("64", None), (True, None)):
+                with open(strassen.TUNING_FILE, "w") as file:
+                    json.dump({"strassen_leaf_size": value}, file)
+                assert strassen._load_tuned_leaf_size() == expected
+            with open(strassen.TUNING_FILE, "w") as file:
+                json.dump([64], file)
+            assert strassen._load_tuned_leaf_size() is None
+        finally:
+            strassen.TUNING_FILE = previous
+
+
+if __name__ == '__main__':
+    test_strassen_square_power_of_two()
+    test_strassen_odd_rectangular_shapes()
+    test_strassen_on_views()
+    test_strassen_applicability()
+    test_autotune_sets_leaf_size()
+    test_tuned_leaf_size_is_validated()
+
+    print("All tests passed. ✅")
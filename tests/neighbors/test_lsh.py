@@ -0,0 +1,88 @@
+import random
+
+from algebra.lsh import CosineLSH
+from algebra.vectors import Vector
+
+
+def _random_vectors(count, dim, seed=0):
+    rng = random.Random(seed)
+    return [Vector([rng.gauss(0, 1) for _ in range(dim)]) for _ in range(count)]
+
+
+def test_lsh_insert_and_query():
+    vectors = _random_vectors(50, 8)
+    index = CosineLSH(8, tables=4, bits=6, seed=0)
+    keys = index.extend(vectors)
+    assert keys == list(range(50)) and len(index) == 50
+    similarities, found = index.query(vectors[7], k=1)
+    assert found == [7]
+    assert similarities == [vectors[7].cosine_similarity(vectors[7])]
+
+
+def test_lsh_query_reranks_with_exact_cosine():
+    vectors = _random_vectors(100, 6)
+    index = CosineLSH(6, tables=6, bits=4, seed=1)
+    index.extend(vectors)
+    v = Vector([1, 0, 0, 0, 0, 1])
+    similarities, keys = index.query(v, k=5)
+    assert similarities == [v.cosine_similarity(vectors[key]) for key in keys]
+    assert similarities == sorted(similarities, reverse=True)
+    assert set(keys) <= set(index.candidates(v))
+
+
+def test_lsh_delete():
+    index = CosineLSH(2, tables=2, bits=2, seed=0)
+    index.insert(Vector([1, 0]), key="a")
+    index.insert(Vector([1, 0.1]), key="b")
+    index.delete("a")
+    assert "a" not in index and len(index) == 1
+    assert index.query(Vector([1, 0]), k=2)[1] == ["b"]
+    try:
+        index.delete("a")
+        assert False
+    except KeyError:
+        assert True
+
+
+def test_lsh_checks():
+    index = CosineLSH(3, seed=0)
+    try:
+        index.insert(Vector([0, 0, 0]))
+        assert False
+    except ZeroDivisionError:
+        assert True
+    try:
+        index.insert(Vector([1, 2]))
+        assert False
+    except ValueError:
+        assert True
+    try:
+        CosineLSH(3, bits=0)
+        assert False
+    except ValueError:
+        assert True
+
+
+def test_lsh_recall_report():
+    vectors = _random_vectors(300, 10)
+    index = CosineLSH(10, tables=1, bits=16, seed=0)
+    index.extend(vectors)
+    narrow = index.recall(queries=_random_vectors(20, 10, seed=1), k=5)
+    assert narrow["queries"] == 20 and 0 <= narrow["recall"] <= 1
+
+    wide = CosineLSH(10, tables=16, bits=2, seed=0)
+    wide.extend(vectors)
+    report = wide.recall(queries=_random_vectors(20, 10, seed=1), k=5)
+    assert report["recall"] >= narrow["recall"]
+    assert report["candidates"] > narrow["candidates"]
+    assert wide.recall(k=1, sample=10)["recall"] == 1.0
+
+
+if __name__ == '__main__':
+    test_lsh_insert_and_query()
+    test_lsh_query_reranks_with_exact_cosine()
+    test_lsh_delete()
+    test_lsh_checks()
+    test_lsh_recall_report()
+
+    print("All tests passed. ✅")
@@ -0,0 +1,111 @@
+import os
+import random
+import tempfile
+
+from algebra.matrices import Matrix
+from algebra.neighbors import BallTree, KDTree, build_index
+from algebra.vectors import Vector
+
+
+def _random_vectors(count, dim, seed=0):
+    rng = random.Random(seed)
+    return [Vector([rng.randint(-5, 5) + rng.random() for _ in range(dim)]) for _ in range(count)]
+
+
+def _brute_force(points, v, k):
+    neighbours = sorted((v.distance(point), i) for i, point in enumerate(points))[:k]
+    return [distance for distance, _ in neighbours], [i for _, i in neighbours]
+
+
+def _brute_force_radius(points, v, r):
+    neighbours = sorted((v.distance(point), i) for i, point in enumerate(points) if v.distance(point) <= r)
+    return [distance for distance, _ in neighbours], [i for _, i in neighbours]
+
+
+def test_build_index_kind():
+    assert isinstance(build_index(_random_vectors(10, 3)), KDTree)
+    assert isinstance(build_index(_random_vectors(10, 32)), BallTree)
+
+
+def test_kd_tree_query_matches_brute_force():
+    points, queries = _random_vectors(300, 3), _random_vectors(20, 3, seed=1)
+    tree = KDTree(points, leaf_size=4)
+    for v in queries:
+        assert tree.query(v, k=5) == _brute_force(points, v, 5)
+
+
+def test_ball_tree_query_matches_brute_force():
+    points, queries = _random_vectors(200, 24), _random_vectors(10, 24, seed=1)
+    tree = BallTree(points, leaf_size=4)
+    for v in queries:
+        assert tree.query(v, k=3) == _brute_force(points, v, 3)
+
+
+def test_query_ties_and_duplicates():
+    points = [Vector([1, 0]), Vector([0, 1]), Vector([-1, 0]), Vector([0, -1]), Vector([1, 0])]
+    for tree in (KDTree(points, leaf_size=1), BallTree(points, leaf_size=1)):
+        assert tree.query(Vector([0, 0]), k=3) == ([1.0, 1.0, 1.0], [0, 1, 2])
+        assert tree.query(Vector([0, 0]), k=10)[1] == [0, 1, 2, 3, 4]
+
+
+def test_query_radius_matches_brute_force():
+    points, queries = _random_vectors(200, 4), _random_vectors(10, 4, seed=1)
+    for tree in (KDTree(points, leaf_size=8), BallTree(points, leaf_size=8)):
+        for v in queries:
+            assert tree.query_radius(v, 3.5) == _brute_force_radius(points, v, 3.5)
+
+
+def test_batched_queries_from_matrix():
+    X = Matrix([[0, 0], [1, 1], [5, 5], [2, 0]])
+    tree = build_index(X, leaf_size=1)
+    queries = Matrix([[0.9, 1], [4, 4]])
+    results = tree.query_many(queries, k=1)
+    assert [indices for _, indices in results] == [[1], [2]]
+    assert tree.query_radius_many([Vector([0, 0])], 2) == [tree.query_radius(Vector([0, 0]), 2)]
+
+
+def test_index_is_independent_of_source():
+    X = Matrix([[0, 0], [3, 3]])
+    tree = build_index(X)
+    X[0, 0] = 10
+    assert tree.query(Vector([0, 0]), k=1) == ([0.0], [0])
+
+
+def test_query_checks():
+    tree = build_index(_random_vectors(10, 3))
+    try:
+        tree.query(Vector([1, 2]), k=1)
+        assert False
+    except ValueError:
+        assert True
+    try:
+        tree.query(Vector([1, 2, 3]), k=0)
+        assert False
+    except ValueError:
+        assert True
+
+
+def test_index_save_and_load():
+    points = _random_vectors(50, 3)
+    tree = build_index(points)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "index.bin")
+        tree.save(path)
+        loaded = KDTree.load(path)
+    v = Vector([0.5, 0.5, 0.5])
+    assert isinstance(loaded, KDTree)
+    assert loaded.query(v, k=4) == tree.query(v, k=4)
+
+
+if __name__ == '__main__':
+    test_build_index_kind()
+    test_kd_tree_query_matches_brute_force()
+    test_ball_tree_query_matches_brute_force()
+    test_query_ties_and_duplicates()
+    test_query_radius_matches_brute_force()
+    test_batched_queries_from_matrix()
+    test_index_is_independent_of_source()
+    test_query_checks()
+    test_index_save_and_load()
+
+    print("All tests passed. ✅")
@@ -0,0 +1,87 @@
+from algebra.matrices import Matrix
+from algebra.pipelines import Pipeline
+from algebra.vector_sets import VectorSet
+from algebra.vectors import Vector
+
+W = Matrix([[1, 2], [0, 1], [3, -1]])
+b = Vector([1, -1])
+
+def _vectors():
+    return [Vector([1, 0]), Vector([0, 1]), Vector([2, 3]), Vector([-1, 4]), Vector([0.5, 0.5])]
+
+def _reference(v):
+    u = W.apply_to_vector(v.scalar_multiply(2).add(b))
+    return u.scalar_multiply(1 / u.magnitude())
+
+def _close(u, v, tol=1e-12):
+    return u.length == v.length and all(abs(x - y) <= tol for x, y in zip(u, v))
+
+def test_pipeline_matches_step_by_step():
+    pipeline = Pipeline().scale(2).add_bias(b).apply(W).normalize()
+    results = pipeline.run(v for v in _vectors())
+    assert not isinstance(results, list)
+    for u, v in zip(results, _vectors()):
+        assert _close(u, _reference(v))
+    assert (pipeline.input_dim, pipeline.output_dim) == (2, 3)
+
+def test_pipeline_fuses_affine_steps():
+    V = Matrix([[1, 1, 1]])
+    pipeline = Pipeline().scale(2).add_bias(b).apply(W).scale(3).apply(V).add_bias(Vector([1]))
+    assert len(pipeline.compile()) == 1
+    for u, v in zip(pipeline(_vectors()), _vectors()):
+        expected = V.apply_to_vector(W.apply_to_vector(v.scalar_multiply(2).add(b)).scalar_multiply(3)).add(Vector([1]))
+        assert _close(u, expected, tol=1e-9)
+    assert len(Pipeline().scale(2).normalize().scale(3).compile()) == 3
+
+def test_pipeline_keeps_bottleneck_products_separate():
+    down, up = Matrix.ones((1, 10)), Matrix.ones((10, 1))
+    pipeline = Pipeline().apply(down).apply(up)
+    assert len(pipeline.compile()) == 2
+    assert list(pipeline.run([Vector.ones(10)])) == [Vector.full(10, 10)]
+
+def test_pipeline_micro_batches():
+    pipeline = Pipeline().scale(2).add_bias(b).apply(W).normalize()
+    batched = list(pipeline.run(iter(_vectors()), batch_size=2))
+    assert all(_close(u, _reference(v)) for u, v in zip(batched, _vectors()))
+    packed = list(pipeline.run(VectorSet(_vectors()), batch_size=2, packed=True))
+    assert [block.count for block in packed] == [2, 2, 1]
+    assert _close(packed[2][0], _reference(_vectors()[4]))
+
+def test_pipeline_snapshots_steps():
+    M = Matrix([[1, 0], [0, 1]])
+    pipeline = Pipeline().apply(M)
+    results = pipeline.run([Vector([1, 2])])
+    M[0, 0] = 5
+    assert next(results) == Vector([1, 2])
+
+def test_pipeline_errors():
+    try:
+        Pipeline().apply(W).add_bias(b)
+        assert False
+    except ValueError:
+        assert True
+    try:
+        list(Pipeline().apply(W).run([Vector([1, 2, 3])]))
+        assert False
+    except ValueError:
+        assert True
+    try:
+        list(Pipeline().normalize().run([Vector([0, 0])]))
+        assert False
+    except ZeroDivisionError:
+        assert True
+    try:
+        Pipeline().scale(2).run([], packed=True)
+        assert False
+    except ValueError:
+        assert True
+
+
+if __name__ == '__main__':
+    test_pipeline_matches_step_by_step()
+    test_pipeline_fuses_affine_steps()
+    test_pipeline_keeps_bottleneck_products_separate()
+    test_pipeline_micro_batches()
+    test_pipeline_snapshots_steps()
+    test_pipeline_errors()
+    print("All tests passed. ✅")
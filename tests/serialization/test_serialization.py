@@ -0,0 +1,118 @@
+import os
+import struct
+import tempfile
+from array import array
+
+from algebra import serialization
+from algebra.augmented_matrices import AugmentedMatrix
+from algebra.matrices import Matrix
+from algebra.vectors import Vector
+
+
+def test_matrix_save_and_load():
+    A = Matrix([[1, 2.5, 3], [4, 5, -6]])
+    with tempfile.TemporaryDirectory() as directory:
+        path = A.save(os.path.join(directory, "a.bin"))
+        assert os.path.getsize(path) == 24 + 8 * 6
+        assert Matrix.load(path) == A
+
+
+def test_file_layout_is_little_endian():
+    with tempfile.TemporaryDirectory() as directory:
+        path = Vector([1.5, -2]).save(os.path.join(directory, "v.bin"))
+        with open(path, "rb") as file:
+            content = file.read()
+    assert content[:8] == b"ALGB\x01d<\x01"
+    assert struct.unpack("<Q2d", content[8:]) == (2, 1.5, -2.0)
+
+
+def test_view_is_saved_as_its_elements():
+    A = Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+    with tempfile.TemporaryDirectory() as directory:
+        path = A.transpose()[1:, :2].save(os.path.join(directory, "view.bin"))
+        assert Matrix.load(path) == Matrix([[2, 5], [3, 6]])
+
+
+def test_mmap_load():
+    A = Matrix([[float(i * 4 + j) for j in range(4)] for i in range(5)])
+    with tempfile.TemporaryDirectory() as directory:
+        path = A.save(os.path.join(directory, "a.bin"))
+        M = Matrix.load(path, mmap=True)
+        assert M == A
+        assert M[3] == A[3] and M[2, 1] == 9
+        assert M.dot(A.transpose()) == A.dot(A.transpose())
+        assert AugmentedMatrix(M, Vector([1, 2, 3, 4, 5])).data[0] == [0, 1, 2, 3, 1]
+        assert M.is_frozen
+        try:
+            M[0, 0] = 1
+            assert False
+        except ValueError:
+            assert True
+        copy = M.copy()
+        copy[0, 0] = 1
+        assert copy[0, 0] == 1
+        del M, copy
+
+
+def test_strided_memoryview_views_are_saved():
+    A = Matrix.from_flat(memoryview(array("d", [1, 2, 3, 4, 5, 6])), (2, 3))
+    with tempfile.TemporaryDirectory() as directory:
+        path = A.column(0).save(os.path.join(directory, "c0.bin"))
+        assert Vector.load(path) == Vector([1, 4])
+        M = Matrix.load(A.save(os.path.join(directory, "a.bin")), mmap=True)
+        path = M.column(1).save(os.path.join(directory, "c1.bin"))
+        assert Vector.load(path) == Vector([2, 5])
+        path = M.transpose().save(os.path.join(directory, "t.bin"))
+        assert Matrix.load(path) == Matrix([[1, 4], [2, 5], [3, 6]])
+        del M
+
+
+def test_relative_paths_use_data_dir():
+    original = serialization.DATA_DIR
+    with tempfile.TemporaryDirectory() as directory:
+        serialization.DATA_DIR = directory
+        try:
+            path = Vector([1, 2]).save(os.path.join("vectors", "v.bin"))
+            assert path == os.path.join(directory, "vectors", "v.bin")
+            assert Vector.load(os.path.join("vectors", "v.bin"), mmap=True) == Vector([1, 2])
+        finally:
+            serialization.DATA_DIR = original
+
+
+def test_load_checks():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bad.bin")
+        with open(path, "wb") as file:
+            file.write(b"NOPE" + bytes(20))
+        try:
+            Matrix.load(path)
+            assert False
+        except ValueError:
+            assert True
+
+        path = Vector([1, 2, 3]).save(os.path.join(directory, "v.bin"))
+        try:
+            Matrix.load(path)
+            assert False
+        except TypeError:
+            assert True
+
+        with open(path, "r+b") as file:
+            file.truncate(30)
+        try:
+            Vector.load(path)
+            assert False
+        except ValueError:
+            assert True
+
+
+if __name__ == '__main__':
+    test_matrix_save_and_load()
+    test_file_layout_is_little_endian()
+    test_view_is_saved_as_its_elements()
+    test_mmap_load()
+    test_strided_memoryview_views_are_saved()
+    test_relative_paths_use_data_dir()
+    test_load_checks()
+
+    print("All tests passed. ✅")
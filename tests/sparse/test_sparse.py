@@ -0,0 +1,89 @@
+from algebra.matrices import Matrix
+from algebra.sparse import COOBuilder, SparseMatrix
+from algebra.vectors import Vector
+
+A = [[0, 2, 0, 0], [1, 0, 0, 3], [0, 0, 0, 0]]
+B = [[0, 1], [4, 0], [0, 0], [0, 2]]
+
+def test_sparse_creation():
+    S = SparseMatrix(A)
+    assert S.nnz == 3
+    assert list(S.indptr) == [0, 1, 3, 3]
+    assert list(S.indices) == [1, 0, 3]
+    assert S.to_matrix() == Matrix(A)
+
+def test_sparse_layout_conversions():
+    S = SparseMatrix(A, layout="csc")
+    assert S.layout == "csc"
+    assert list(S.indptr) == [0, 1, 2, 2, 3]
+    assert S.to_csr().to_matrix() == Matrix(A)
+    assert SparseMatrix.from_matrix(Matrix(A), layout="csc") == S
+
+def test_sparse_transpose():
+    S = SparseMatrix(A)
+    assert S.transpose().to_matrix() == Matrix(A).transpose()
+    assert S.transpose().values is S.values
+
+def test_sparse_add_and_scalar_multiply():
+    S = SparseMatrix(A)
+    assert S.add(S.scalar_multiply(-1)).nnz == 0
+    assert S.add(SparseMatrix(A, layout="csc")) == Matrix(A).scalar_multiply(2)
+    assert S.add(Matrix(A)) == Matrix(A).scalar_multiply(2)
+
+def test_sparse_operators():
+    S, D = SparseMatrix(A), Matrix(A)
+    assert isinstance(S + S, SparseMatrix) and S + S == D * 2
+    assert (S - S).nnz == 0
+    assert 3 * S == D * 3 and isinstance(S * 3, SparseMatrix)
+    assert isinstance(D + S, Matrix) and D + S == D * 2
+    assert S + D == D * 2
+    assert D - S == Matrix.zeros((3, 4)) and S - D == Matrix.zeros((3, 4))
+    assert (D * 3) - S == D * 2
+
+def test_sparse_apply_to_vector():
+    v = Vector([1, 2, 3, 4])
+    expected = Matrix(A) @ v
+    assert SparseMatrix(A) @ v == expected
+    assert SparseMatrix(A, layout="csc").apply_to_vector(v) == expected
+
+def test_sparse_products():
+    expected = Matrix(A) @ Matrix(B)
+    assert SparseMatrix(A) @ Matrix(B) == expected
+    assert SparseMatrix(A, layout="csc") @ SparseMatrix(B) == expected
+    assert Matrix(A) @ SparseMatrix(B) == expected
+
+def test_sparse_incompatible_product():
+    try:
+        SparseMatrix(A) @ SparseMatrix(A)
+        assert False
+    except ValueError:
+        assert True
+
+def test_coo_builder():
+    builder = COOBuilder([3, 4])
+    builder.extend([(1, 3, 1), (0, 1, 2), (1, 0, 1), (1, 3, 2), (2, 2, 5), (2, 2, -5)])
+    assert builder.build() == Matrix(A)
+    assert builder.build().nnz == 3
+    assert builder.build(layout="csc").layout == "csc"
+
+def test_coo_builder_out_of_bounds():
+    try:
+        COOBuilder([3, 4]).add(3, 0, 1)
+        assert False
+    except IndexError:
+        assert True
+
+
+if __name__ == '__main__':
+    test_sparse_creation()
+    test_sparse_layout_conversions()
+    test_sparse_transpose()
+    test_sparse_add_and_scalar_multiply()
+    test_sparse_operators()
+    test_sparse_apply_to_vector()
+    test_sparse_products()
+    test_sparse_incompatible_product()
+    test_coo_builder()
+    test_coo_builder_out_of_bounds()
+
+    print("All tests passed. ✅")
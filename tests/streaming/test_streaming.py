@@ -0,0 +1,127 @@
+import random
+
+from algebra import streaming
+from algebra.matrices import Matrix
+from algebra.vectors import Vector
+
+
+def _random_matrix(m, n, seed=0):
+    rng = random.Random(seed)
+    return Matrix([[rng.uniform(-1, 1) for _ in range(n)] for _ in range(m)])
+
+
+def _close(a, b, tol=1e-9):
+    return all(abs(x - y) <= tol for x, y in zip(a, b))
+
+
+def test_iter_row_blocks():
+    A = _random_matrix(10, 3)
+    blocks = list(streaming.iter_row_blocks(A, block_size=4))
+    assert [block.dims for block in blocks] == [[4, 3], [4, 3], [2, 3]]
+    assert blocks[2] == A[8:]
+
+
+def test_streaming_apply_to_vector():
+    A, v = _random_matrix(25, 4), Vector([1, -2, 0.5, 3])
+    result = streaming.apply_to_vector(streaming.iter_row_blocks(A, block_size=7), v)
+    assert _close(result, A.apply_to_vector(v))
+
+
+def test_streaming_transpose_apply_to_vector():
+    A = _random_matrix(25, 4)
+    v = Vector([float(i) for i in range(25)])
+    result = streaming.transpose_apply_to_vector(streaming.iter_row_blocks(A, block_size=6), v)
+    assert _close(result, A.transpose().apply_to_vector(v))
+    try:
+        streaming.transpose_apply_to_vector(streaming.iter_row_blocks(A, block_size=6), Vector([1, 2]))
+        assert False
+    except ValueError:
+        assert True
+
+
+def test_streaming_gram():
+    A = _random_matrix(30, 5)
+    G = streaming.gram(streaming.iter_row_blocks(A, block_size=8))
+    assert G.dims == [5, 5]
+    assert _close(G._row_major(), A.transpose().dot(A)._row_major())
+    assert G == G.transpose()
+
+
+def test_streaming_weighted_and_centered_gram():
+    A = _random_matrix(30, 4)
+    weights = Vector([float(i % 3) for i in range(30)])
+    G = streaming.gram(streaming.iter_row_blocks(A, block_size=7), weights=weights)
+    expected = A.transpose().dot(Matrix([[w * x for x in row] for w, row in zip(weights, A.data)]))
+    assert _close(G._row_major(), expected._row_major())
+
+    shifted = Matrix([[x + 1e6 for x in row] for row in A.data])
+    S = streaming.gram(streaming.iter_row_blocks(shifted, block_size=7), center=True)
+    means = [sum(column) / 30 for column in A.transpose().data]
+    centered = Matrix([[x - mean for x, mean in zip(row, means)] for row in A.data])
+    assert _close(S._row_major(), centered.transpose().dot(centered)._row_major(), tol=1e-6)
+
+    # Same argument order everywhere: weights, center (or ddof), then workers
+    blocks = lambda: streaming.iter_row_blocks(A, block_size=7)
+    assert _close(streaming.gram(blocks(), weights, True, 1)._row_major(), A.gram(weights, True, 1)._row_major())
+    assert _close(streaming.covariance(blocks(), weights, 0, 1)._row_major(), A.covariance(weights, 0, 1)._row_major())
+
+
+def test_streaming_covariance():
+    rows = [[1, 2], [3, 6], [5, 7], [7, 1]]
+    blocks = streaming.iter_row_blocks(Matrix(rows), block_size=3)
+    C = streaming.covariance(blocks)
+    assert _close(C._row_major(), [20 / 3, -2 / 3, -2 / 3, 26 / 3])
+    repeated = Matrix(rows + [rows[2]])
+    weighted = streaming.covariance(streaming.iter_row_blocks(Matrix(rows), block_size=1), weights=Vector([1, 1, 2, 1]))
+    assert _close(weighted._row_major(), repeated.covariance()._row_major())
+    try:
+        streaming.covariance(iter([Matrix([[1, 2]])]))
+        assert False
+    except ValueError:
+        assert True
+    try:
+        streaming.gram(iter([Matrix([[1, 2]])]), weights=Vector([1, 1]))
+        assert False
+    except ValueError:
+        assert True
+
+
+def test_streaming_accepts_generators():
+    rows = ([float(i), 1.0] for i in range(6))
+    blocks = (Matrix([next(rows), next(rows)]) for _ in range(3))
+    assert streaming.gram(blocks) == Matrix([[55, 15], [15, 6]])
+
+
+def test_streaming_block_checks():
+    try:
+        streaming.gram(iter([Matrix([[1, 2]]), Matrix([[1, 2, 3]])]))
+        assert False
+    except ValueError:
+        assert True
+    try:
+        streaming.apply_to_vector(iter([]), Vector([1]))
+        assert False
+    except ValueError:
+        assert True
+
+
+def test_streaming_with_workers():
+    A, v = _random_matrix(40, 3), Vector([1, 2, 3])
+    blocks = lambda: streaming.iter_row_blocks(A, block_size=5)
+    assert streaming.apply_to_vector(blocks(), v, workers=2) == streaming.apply_to_vector(blocks(), v, workers=1)
+    assert streaming.gram(blocks(), workers=2) == streaming.gram(blocks(), workers=1)
+    assert streaming.covariance(blocks(), workers=2) == streaming.covariance(blocks(), workers=1)
+
+
+if __name__ == '__main__':
+    test_iter_row_blocks()
+    test_streaming_apply_to_vector()
+    test_streaming_transpose_apply_to_vector()
+    test_streaming_gram()
+    test_streaming_weighted_and_centered_gram()
+    test_streaming_covariance()
+    test_streaming_accepts_generators()
+    test_streaming_block_checks()
+    test_streaming_with_workers()
+
+    print("All tests passed. ✅")
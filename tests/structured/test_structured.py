@@ -0,0 +1,142 @@
+from algebra.matrices import Matrix
+from algebra.structured import BandedMatrix, DiagonalMatrix, IdentityMatrix, TriangularMatrix
+from algebra.validator import LinearAlgebraValidator as linalgvalidator
+from algebra.vectors import Vector
+
+T = [[2, 1, 0, 0], [1, 3, 1, 0], [0, 1, 4, 1], [0, 0, 1, 5]]
+L = [[2, 0, 0, 0], [1, 3, 0, 0], [4, 1, 4, 0], [1, 2, 1, 5]]
+M = [[1, 2, 3, 4], [5, 6, 7, 8], [9, 1, 2, 3], [4, 5, 6, 7]]
+v = Vector([1, 2, 3, 4])
+
+def test_banded_creation():
+    B = BandedMatrix(T, lower=1, upper=1)
+    assert B.bandwidth == 3
+    assert B.to_matrix() == Matrix(T)
+    assert B.diagonal(1) == Vector([1, 1, 1])
+    assert B.diagonal(-3) == Vector([0])
+    assert B[2, 1] == 1 and B[0, 3] == 0
+
+def test_banded_rejects_elements_outside_the_band():
+    try:
+        BandedMatrix(T, lower=0, upper=1)
+        assert False
+    except ValueError:
+        assert True
+
+def test_banded_transpose():
+    B = BandedMatrix(L, lower=3, upper=0)
+    assert B.transpose().to_matrix() == Matrix(L).transpose()
+    assert B.transpose()._diagonals[0] is B._diagonals[-1]
+
+def test_banded_apply_to_vector():
+    assert BandedMatrix(T, 1, 1) @ v == Matrix(T) @ v
+    assert TriangularMatrix(L) @ v == Matrix(L) @ v
+
+def test_banded_products():
+    B = BandedMatrix(T, 1, 1)
+    product = B @ B
+    assert type(product) is BandedMatrix and (product.lower, product.upper) == (2, 2)
+    assert product == Matrix(T) @ Matrix(T)
+    assert B @ Matrix(M) == Matrix(T) @ Matrix(M)
+    assert Matrix(M) @ B == Matrix(M) @ Matrix(T)
+    assert Matrix([[1, 2, 3, 4]]) @ B == Matrix([[1, 2, 3, 4]]) @ Matrix(T)
+
+def test_structured_results():
+    lower = TriangularMatrix(L)
+    assert isinstance(lower @ lower, TriangularMatrix)
+    assert (lower @ lower) == Matrix(L) @ Matrix(L)
+    assert isinstance(lower.transpose(), TriangularMatrix) and not lower.transpose().is_lower_triangular
+    D = DiagonalMatrix([1, 2, 3, 4])
+    assert isinstance(D @ D, DiagonalMatrix) and D @ D == DiagonalMatrix([1, 4, 9, 16])
+    assert isinstance(D + IdentityMatrix(4), DiagonalMatrix)
+    assert type(lower @ D) is TriangularMatrix
+
+def test_banded_add():
+    B = BandedMatrix(T, 1, 1)
+    assert B + TriangularMatrix(L) == Matrix(T) + Matrix(L)
+    assert B + Matrix(M) == Matrix(T) + Matrix(M)
+    assert Matrix(M) + B == Matrix(M) + Matrix(T)
+    assert Matrix(M) - B == Matrix(M) - Matrix(T)
+    assert B - Matrix(M) == Matrix(T) - Matrix(M)
+    assert isinstance(Matrix(M) + B, Matrix)
+
+def test_triangular_solve():
+    lower = TriangularMatrix(L)
+    x = lower.solve(v)
+    assert Matrix(L) @ x == v
+    upper = TriangularMatrix([[2, 1, 3], [0, 1, 2], [0, 0, 4]], lower=False)
+    x = upper.solve(Vector([1, 2, 8]))
+    assert x == Vector([-1.5, -2, 2])
+    assert lower.determinant() == 120
+    assert BandedMatrix([[1, 2, 0], [2, 4, 0], [0, 0, 1]], 1, 1).determinant() == 0.0
+
+def test_solve_errors():
+    try:
+        BandedMatrix(T, 1, 1).solve(v)
+        assert False
+    except ValueError:
+        assert True
+    try:
+        DiagonalMatrix([1, 0]).solve(Vector([1, 1]))
+        assert False
+    except ValueError:
+        assert True
+
+def test_diagonal_matrix():
+    D = DiagonalMatrix(Vector([2, 4]))
+    assert D.transpose() is D
+    assert D.inverse() == DiagonalMatrix([0.5, 0.25])
+    assert D @ Matrix([[1, 2], [3, 4]]) == Matrix([[2, 4], [12, 16]])
+    assert Matrix([[1, 2], [3, 4]]) @ D == Matrix([[2, 8], [6, 16]])
+
+def test_identity_matrix():
+    I = IdentityMatrix(4)
+    assert I._diagonals is None
+    assert I.to_matrix() == Matrix.identity(4)
+    assert I @ v == v and (I @ v) is not v
+    assert I @ Matrix(M) == Matrix(M) and Matrix(M) @ I == Matrix(M)
+    assert I @ TriangularMatrix(L) == Matrix(L)
+    assert I.transpose() is I
+    assert I * 3 == DiagonalMatrix([3, 3, 3, 3])
+    assert I[2, 2] == 1 and I[-1, 3] == 1 and I[0, 3] == 0
+    assert I.solve(v) == v and I.solve(v) is not v
+    try:
+        I[4, 0]
+        assert False
+    except IndexError:
+        assert True
+
+def test_triangular_validates_data_once():
+    calls = []
+    validate = linalgvalidator.validate_data_is_valid_matrix
+    linalgvalidator.validate_data_is_valid_matrix = lambda data, policy=None: calls.append(data) or validate(data, policy)
+    try:
+        T_L = TriangularMatrix(L)
+    finally:
+        linalgvalidator.validate_data_is_valid_matrix = validate
+    assert len(calls) == 1
+    assert T_L.to_matrix() == Matrix(L)
+
+def test_incompatible_shapes():
+    try:
+        BandedMatrix(T, 1, 1) @ Matrix([[1, 2], [3, 4]])
+        assert False
+    except ValueError:
+        assert True
+
+
+if __name__ == '__main__':
+    test_banded_creation()
+    test_banded_rejects_elements_outside_the_band()
+    test_banded_transpose()
+    test_banded_apply_to_vector()
+    test_banded_products()
+    test_structured_results()
+    test_banded_add()
+    test_triangular_solve()
+    test_solve_errors()
+    test_diagonal_matrix()
+    test_identity_matrix()
+    test_triangular_validates_data_once()
+    test_incompatible_shapes()
+    print("All tests passed. ✅")
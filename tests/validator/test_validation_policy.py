@@ -0,0 +1,52 @@
+from algebra.matrices import Matrix
+from algebra.validator import LinearAlgebraValidator, validation_policy
+from algebra.vectors import Vector
+
+def test_full_policy_checks_elements():
+    try:
+        Matrix([[1, True], [0, 3]])
+        assert False
+    except TypeError:
+        assert True
+
+def test_shape_policy_per_call():
+    assert Vector([1, True], validation="shape") == Vector([1, 1])
+    try:
+        Matrix([[1, 2], [0, 3, 5]], validation="shape")
+        assert False
+    except ValueError:
+        assert True
+
+def test_off_policy_with_context_manager():
+    with validation_policy("off"):
+        assert LinearAlgebraValidator.get_policy() == "off"
+        assert Vector((1, 2)) == Vector([1, 2])
+    assert LinearAlgebraValidator.get_policy() == "full"
+
+def test_global_policy():
+    LinearAlgebraValidator.set_policy("shape")
+    try:
+        assert Matrix([[1, True]]) == Matrix([[1, 1]])
+        Matrix([[1, True]], validation="full")
+        assert False
+    except TypeError:
+        assert True
+    finally:
+        LinearAlgebraValidator.set_policy("full")
+
+def test_unknown_policy():
+    try:
+        Vector([1, 2], validation="fast")
+        assert False
+    except ValueError:
+        assert True
+
+
+if __name__ == '__main__':
+    test_full_policy_checks_elements()
+    test_shape_policy_per_call()
+    test_off_policy_with_context_manager()
+    test_global_policy()
+    test_unknown_policy()
+
+    print("All tests passed. ✅")
@@ -0,0 +1,130 @@
+from algebra.matrices import Matrix
+from algebra.vector_sets import VectorSet
+from algebra.vectors import Vector
+
+
+def _vectors():
+    return [Vector([1, 2, 3]), Vector([0, -1, 4]), Vector([2, 2, 2]), Vector([5, 0, -1])]
+
+
+def _close(a, b, tol=1e-9):
+    return all(abs(x - y) <= tol for x, y in zip(a._row_major(), b._row_major()))
+
+
+def test_vector_set_creation():
+    vectors = _vectors()
+    S = VectorSet(vectors)
+    assert len(S) == 4 and S.dim == 3
+    assert list(S) == vectors
+    assert S[-1] == vectors[-1]
+
+
+def test_vector_set_dimensionality_check():
+    try:
+        VectorSet([Vector([1, 2]), Vector([1, 2, 3])])
+        assert False
+    except ValueError:
+        assert True
+    try:
+        VectorSet([])
+        assert False
+    except ValueError:
+        assert True
+
+
+def test_vector_set_from_matrix_shares_rows():
+    X = Matrix([[1, 2], [3, 4]])
+    S = VectorSet.from_matrix(X)
+    S[0][1] = 7
+    assert X[0, 1] == 7
+    assert S.as_matrix() == X
+
+
+def test_vector_set_dot_matrix():
+    vectors = _vectors()
+    others = VectorSet(vectors[:2])
+    D = VectorSet(vectors).dot_matrix(others, block_size=3)
+    assert D.dims == [4, 2]
+    assert D.data == [[v.dot(w) for w in vectors[:2]] for v in vectors]
+
+
+def test_vector_set_cosine_similarity_matrix():
+    vectors = _vectors()
+    C = VectorSet(vectors).cosine_similarity_matrix(block_size=2)
+    expected = Matrix([[v.cosine_similarity(w) for w in vectors] for v in vectors])
+    assert _close(C, expected)
+
+
+def test_vector_set_cosine_similarity_zero_vector():
+    try:
+        VectorSet([Vector([0, 0]), Vector([1, 2])]).cosine_similarity_matrix()
+        assert False
+    except ZeroDivisionError:
+        assert True
+
+
+def test_vector_set_pairwise_distances():
+    vectors = _vectors()
+    S = VectorSet(vectors)
+    D = S.pairwise_distances(block_size=3)
+    expected = Matrix([[v.distance(w) for w in vectors] for v in vectors])
+    assert _close(D, expected)
+    assert all(D[i, i] == 0 for i in range(len(vectors)))
+
+
+def test_vector_set_iter_pairwise_blocks():
+    S = VectorSet(_vectors())
+    blocks = list(S.iter_pairwise(metric="distance", block_size=3))
+    assert [start for start, _ in blocks] == [0, 3]
+    assert [block.dims for _, block in blocks] == [[3, 4], [1, 4]]
+
+
+def test_vector_set_norms_are_invalidated():
+    S = VectorSet([Vector([3, 4]), Vector([1, 0])])
+    assert list(S.norms()) == [5, 1]
+    S[1][0] = 2
+    assert list(S.norms()) == [5, 2]
+
+
+def test_vector_set_pairwise_with_workers():
+    vectors = _vectors()
+    S = VectorSet(vectors)
+    assert S.dot_matrix(workers=2) == S.dot_matrix()
+
+
+def test_matrix_matmul_vector_set():
+    A = Matrix([[1, 0, 1], [0, 2, 0]])
+    result = A @ VectorSet(_vectors())
+    assert isinstance(result, VectorSet)
+    assert [v for v in result] == [A @ v for v in _vectors()]
+    try:
+        Matrix([[1, 2]]) @ VectorSet(_vectors())
+        assert False
+    except ValueError:
+        assert True
+
+
+def test_vector_set_distances_far_from_origin():
+    vectors = [Vector([1e8, 0]), Vector([1e8 + 1, 0]), Vector([1e8, 3])]
+    D = VectorSet(vectors).pairwise_distances()
+    assert D == Matrix([[v.distance(w) for w in vectors] for v in vectors])
+    assert D[0, 1] == 1.0
+    cross = VectorSet(vectors[:1]).pairwise_distances(VectorSet(vectors[1:]))
+    assert cross == Matrix([[1.0, 3.0]])
+
+
+if __name__ == '__main__':
+    test_vector_set_creation()
+    test_vector_set_dimensionality_check()
+    test_vector_set_from_matrix_shares_rows()
+    test_vector_set_dot_matrix()
+    test_vector_set_cosine_similarity_matrix()
+    test_vector_set_cosine_similarity_zero_vector()
+    test_vector_set_pairwise_distances()
+    test_vector_set_iter_pairwise_blocks()
+    test_vector_set_norms_are_invalidated()
+    test_vector_set_pairwise_with_workers()
+    test_matrix_matmul_vector_set()
+    test_vector_set_distances_far_from_origin()
+
+    print("All tests passed. ✅")
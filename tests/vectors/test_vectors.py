@@ -1,3 +1,5 @@
+from array import array
+
 from algebra.vectors import Vector
 from algebra.visualizer import LinearAlgebraVisualizer
 
@@ -85,6 +87,101 @@ def test_vector_cosine_similarity_magnitude_check():
     except ZeroDivisionError:
         assert True
 
+def test_vector_slice_is_a_view():
+    x = Vector([0, 1, 2, 3, 4])
+    y = x[1::2]
+    assert y == Vector([1, 3])
+    x[3] = 9
+    assert y == Vector([1, 9])
+    assert y.base is x
+
+def test_vector_indexing():
+    x = Vector([0, 1, 2])
+    assert x[-1] == 2
+    assert list(x) == [0, 1, 2]
+    try:
+        x[3]
+        assert False
+    except IndexError:
+        assert True
+
+def test_vector_operations_with_out():
+    x = Vector([0, 1, 2])
+    out = Vector([0, 0, 0])
+    assert x.add(Vector([1, 1, 1]), out=out) is out
+    assert out == Vector([1, 2, 3])
+    x.substract(x, out=x)
+    assert x == Vector([0, 0, 0])
+
+def test_vector_inplace_operators():
+    w = Vector([1, 2, 3])
+    alias = w
+    w += 0.5 * Vector([2, 2, 2])
+    w -= Vector([1, 1, 1])
+    w *= 2
+    assert w is alias
+    assert w == Vector([2, 4, 6])
+
+def test_vector_out_with_overlapping_view():
+    x = Vector([1, 2, 3, 4])
+    x[1:].add(x[:-1], out=x[1:])
+    assert x == Vector([1, 3, 5, 7])
+
+
+def test_vector_freeze():
+    v = Vector([3, 4]).freeze()
+    assert v.magnitude() == 5 and "magnitude" in v._cache
+    assert hash(v) == hash(Vector([3, 4]).freeze())
+    for write in (lambda: v.__setitem__(0, 1), lambda: v[1:].__setitem__(0, 1), lambda: v.__iadd__(v)):
+        try:
+            write()
+            assert False
+        except ValueError:
+            assert True
+    v.unfreeze()
+    v[0] = 0
+    assert v.magnitude() == 4
+    try:
+        hash(v)
+        assert False
+    except TypeError:
+        assert True
+
+
+def test_vector_freeze_through_view():
+    x = Vector([1, 2, 3])
+    x[1:].freeze()
+    assert x.is_frozen
+    try:
+        x[0] = 5
+        assert False
+    except ValueError:
+        assert True
+
+
+def test_vector_bulk_constructors():
+    assert Vector.zeros(3) == Vector([0, 0, 0])
+    assert Vector.ones(2) == Vector([1, 1])
+    assert Vector.full(2, -1.5) == Vector([-1.5, -1.5])
+    assert Vector.from_flat([1, 2, 3], shape=3) == Vector([1, 2, 3])
+    assert Vector.from_iter(x * x for x in range(4)) == Vector([0, 1, 4, 9])
+    assert Vector.random(5, seed=3) == Vector.random(5, seed=3)
+    assert Vector.random(5, seed=3) != Vector.random(5, seed=4)
+    try:
+        Vector.zeros(-1)
+        assert False
+    except ValueError:
+        assert True
+
+
+def test_vector_strided_memoryview_values_are_copies():
+    buffer = memoryview(array("d", [1, 2, 3, 4, 5]))
+    v = Vector.from_flat(buffer)[::2]
+    values = v._values()
+    assert memoryview(values).c_contiguous and values.tolist() == [1, 3, 5]
+    buffer[0] = 9
+    assert values[0] == 1 and v[0] == 9
+
 
 if __name__ == '__main__':
     test_vector_creation()
@@ -104,5 +201,14 @@ if __name__ == '__main__':
     test_vector_euclidian_distance()
     test_vector_cosine_similarity()
     test_vector_cosine_similarity_magnitude_check()
+    test_vector_slice_is_a_view()
+    test_vector_indexing()
+    test_vector_operations_with_out()
+    test_vector_inplace_operators()
+    test_vector_out_with_overlapping_view()
+    test_vector_freeze()
+    test_vector_freeze_through_view()
+    test_vector_bulk_constructors()
+    test_vector_strided_memoryview_values_are_copies()
 
     print("All tests passed. ✅")